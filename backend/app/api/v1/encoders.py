@@ -0,0 +1,110 @@
+"""
+Прямое кодирование лекций в JSON, минуя pydantic-схемы ответа.
+
+Форма и порядок полей совпадают с LectureRead / LectureSummaryRead: схемы
+остаются источником OpenAPI-описания, а эндпоинты возвращают
+LectureJSONResponse с готовыми словарями, и FastAPI не прогоняет их
+через response_model.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+from app.domain.entities.lecture import Lecture, LectureSummary
+from app.domain.entities.search import SearchHit
+from app.domain.entities.value_objects import Transcript, TranscriptSegment
+
+
+def _datetime(value: datetime) -> str:
+    # pydantic пишет UTC как "Z", остальное совпадает с isoformat
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _optional_datetime(value: datetime | None) -> str | None:
+    return _datetime(value) if value is not None else None
+
+
+def _transcript(content: Transcript | None) -> dict[str, Any] | None:
+    if content is None:
+        return None
+    return {
+        "text": content.text,
+        "language": content.language,
+        "confidence": content.confidence,
+    }
+
+
+def encode_lecture(lecture: Lecture) -> dict[str, Any]:
+    return {
+        "title": lecture.title.value,
+        "tags": [tag.value for tag in lecture.tags],
+        "id": lecture.id.value if lecture.id else None,
+        "author_id": lecture.author_id.value,
+        "status": lecture.status.value,
+        "content": _transcript(lecture.content),
+        "registered_at": _datetime(lecture.registered_at),
+        "updated_at": _datetime(lecture.updated_at),
+        "published_at": _optional_datetime(lecture.published_at),
+    }
+
+
+def encode_summary(summary: LectureSummary) -> dict[str, Any]:
+    return {
+        "title": summary.title.value,
+        "tags": [tag.value for tag in summary.tags],
+        "id": summary.id.value,
+        "author_id": summary.author_id.value,
+        "status": summary.status.value,
+        "has_content": summary.has_content,
+        "registered_at": _datetime(summary.registered_at),
+        "updated_at": _datetime(summary.updated_at),
+        "published_at": _optional_datetime(summary.published_at),
+    }
+
+
+def encode_segment(segment: TranscriptSegment) -> dict[str, Any]:
+    return {
+        "start": segment.start,
+        "end": segment.end,
+        "text": segment.text,
+        "confidence": segment.confidence,
+    }
+
+
+def encode_hit(hit: SearchHit) -> dict[str, Any]:
+    snippet = hit.snippet
+    return {
+        "lecture": encode_summary(hit.lecture),
+        "score": hit.score,
+        "snippet": {
+            "text": snippet.text,
+            "offset": snippet.offset,
+            "highlights": [list(span) for span in snippet.highlights],
+        }
+        if snippet
+        else None,
+    }
+
+
+def encode_lectures(lectures: Iterable[Lecture]) -> list[dict[str, Any]]:
+    return [encode_lecture(lecture) for lecture in lectures]
+
+
+def encode_summaries(summaries: Iterable[LectureSummary]) -> list[dict[str, Any]]:
+    return [encode_summary(summary) for summary in summaries]
+
+
+def dumps(content: Any) -> bytes:
+    # Сериализатор pydantic-core (Rust) примерно вдвое быстрее json.dumps на
+    # длинных не-ASCII строках транскриптов; вывод тот же компактный UTF-8
+    return to_json(content)
+
+
+class LectureJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,60 +1,377 @@
+import asyncio
+import math
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime
-from typing import Any
+from typing import Annotated, Any, Literal
 
 from dishka.integrations.fastapi import FromDishka, inject
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
-from app.api.v1.schemas.lecture import LectureCreate, LectureRead, LectureUpdate
-from app.domain.entities.lecture import Lecture
+from app.api.v1.encoders import (
+    LectureJSONResponse,
+    dumps,
+    encode_hit,
+    encode_lecture,
+    encode_lectures,
+    encode_segment,
+    encode_summaries,
+)
+from app.api.v1.etag import etag_matches, lecture_etag, page_etag
+from app.api.v1.schemas.lecture import (
+    BulkItemError,
+    LectureBulkCreate,
+    LectureBulkResult,
+    LectureCreate,
+    LectureRead,
+    LectureSummaryRead,
+    LectureUpdate,
+    SearchHitRead,
+    SegmentRead,
+    TagCountRead,
+)
+from app.common.constants import (
+    DEFAULT_LIMIT,
+    MAX_LIMIT,
+    MAX_SEARCH_QUERY,
+    NEXT_CURSOR_HEADER,
+    SSE_HEARTBEAT_SEC,
+    SSE_RETRY_MS,
+)
+from app.domain.entities.lecture import (
+    Lecture,
+    LectureStatus,
+    LectureSummary,
+    LectureVersion,
+    TagFilter,
+)
 from app.domain.entities.value_objects import (
     AuthorId,
+    InvalidCursorError,
     LectureId,
     Tag,
     Title,
 )
 from app.domain.interfaces.lecture_repo import ILectureRepository
-from app.tasks.lecture import process_lecture_task
+from app.domain.interfaces.segment_repo import ISegmentRepository
+from app.infra.events.lecture_events import LectureEventBroadcaster
+from app.tasks.lecture import enqueue_lectures, process_lecture_task
 
 router = APIRouter()
 
 
+def _new_lecture(data: LectureCreate, now: datetime) -> Lecture:
+    return Lecture(
+        author_id=AuthorId(data.author_id),
+        title=Title(data.title),
+        content=None,
+        tags=frozenset(Tag(t) for t in data.tags),
+        registered_at=now,
+        updated_at=now,
+    )
+
+
+def _versions(items: Iterable[Lecture | LectureSummary]) -> list[LectureVersion]:
+    return [LectureVersion(x.id, x.updated_at) for x in items if x.id]
+
+
+def _lecture_etag(lecture: Lecture) -> str:
+    # Id из базы, а не из пути: разные написания одного ObjectId — одна версия
+    assert lecture.id is not None
+    return lecture_etag(LectureVersion(lecture.id, lecture.updated_at))
+
+
+def _etag_headers(etag: str) -> dict[str, str]:
+    # Клиент может хранить ответ, но обязан перепроверять его по ETag
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=_etag_headers(etag)
+    )
+
+
 @router.post("/", response_model=LectureRead, status_code=status.HTTP_201_CREATED)
 @inject
 async def create_lecture(
     data: LectureCreate, repo: FromDishka[ILectureRepository]
 ) -> Any:
+    new_lecture = _new_lecture(data, datetime.now())
+    new_lecture.id = await repo.add(new_lecture)
+
+    await process_lecture_task.kiq(new_lecture.id.value)  # type: ignore[call-overload]
+
+    return LectureJSONResponse(
+        encode_lecture(new_lecture), status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.post(
+    "/bulk", response_model=LectureBulkResult, status_code=status.HTTP_201_CREATED
+)
+@inject
+async def bulk_create_lectures(
+    data: LectureBulkCreate,
+    repo: FromDishka[ILectureRepository],
+) -> Any:
+    """
+    Создает пачку лекций: невалидные элементы попадают в errors с индексом,
+    остальные вставляются одним insert_many и ставятся в очередь пачкой.
+    """
     now = datetime.now()
+    errors: list[BulkItemError] = []
+    lectures: list[Lecture] = []
+    positions: list[int] = []
 
-    new_lecture = Lecture(
-        author_id=AuthorId(data.author_id),
-        title=Title(data.title),
-        content=None,
-        tags=frozenset(Tag(t) for t in data.tags),
-        registered_at=now,
-        updated_at=now,
+    for index, item in enumerate(data.items):
+        try:
+            lectures.append(_new_lecture(LectureCreate.model_validate(item), now))
+            positions.append(index)
+        except ValidationError as e:
+            details = e.errors(include_url=False, include_context=False)
+            errors.append(BulkItemError(index=index, errors=[dict(d) for d in details]))
+        except ValueError as e:
+            error = {"type": "value_error", "msg": str(e)}
+            errors.append(BulkItemError(index=index, errors=[error]))
+
+    created: list[Lecture] = []
+    lecture_ids = await repo.add_many(lectures)
+    for index, lecture, lecture_id in zip(
+        positions, lectures, lecture_ids, strict=True
+    ):
+        if lecture_id is None:
+            error = {"type": "write_error", "msg": "Failed to store lecture"}
+            errors.append(BulkItemError(index=index, errors=[error]))
+            continue
+        lecture.id = lecture_id
+        created.append(lecture)
+
+    await enqueue_lectures(lecture.id for lecture in created if lecture.id)
+
+    return LectureJSONResponse(
+        {
+            "created": encode_lectures(created),
+            "errors": [
+                error.model_dump(mode="json")
+                for error in sorted(errors, key=lambda error: error.index)
+            ],
+        },
+        status_code=status.HTTP_201_CREATED,
     )
 
-    lecture_id = await repo.add(new_lecture)
 
-    await process_lecture_task.kiq(lecture_id.value)  # type: ignore[call-overload]
+@router.get("/", response_model=list[LectureSummaryRead] | list[LectureRead])
+@inject
+async def list_lectures(
+    repo: FromDishka[ILectureRepository],
+    limit: Annotated[int, Query(ge=1, le=MAX_LIMIT)] = DEFAULT_LIMIT,
+    cursor: str | None = None,
+    author_id: str | None = None,
+    lecture_status: Annotated[LectureStatus | None, Query(alias="status")] = None,
+    include: Literal["content"] | None = None,
+    tag: Annotated[list[str] | None, Query()] = None,
+    tag_match: Literal["any", "all"] = "any",
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Any:
+    """
+    По умолчанию отдает краткие записи без транскрипта;
+    include=content возвращает лекции целиком. Параметр tag можно повторять:
+    tag_match=any — лекции хотя бы с одним из тегов, all — со всеми.
+    """
+    try:
+        tags = (
+            TagFilter(frozenset(Tag(t) for t in tag), tag_match == "all")
+            if tag
+            else None
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(e)
+        ) from e
+
+    filters: dict[str, Any] = {
+        "limit": limit,
+        "cursor": cursor,
+        "author_id": AuthorId(author_id) if author_id else None,
+        "status": lecture_status,
+        "tags": tags,
+    }
+    variant = include or "summary"
+    items: list[dict[str, Any]]
+    try:
+        if if_none_match:
+            # Сначала сверяем только версии: неизменная страница не читается
+            versions = await repo.find_version_page(**filters)
+            etag = page_etag(versions.items, versions.next_cursor, variant)
+            if etag_matches(if_none_match, etag):
+                return _not_modified(etag)
+
+        if include == "content":
+            page = await repo.find_page(**filters)
+            items = encode_lectures(page.items)
+            etag = page_etag(_versions(page.items), page.next_cursor, variant)
+            next_cursor = page.next_cursor
+        else:
+            summaries = await repo.find_summary_page(**filters)
+            items = encode_summaries(summaries.items)
+            etag = page_etag(_versions(summaries.items), summaries.next_cursor, variant)
+            next_cursor = summaries.next_cursor
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    headers = _etag_headers(etag)
+    # Курсор следующей страницы отдаем заголовком, чтобы не менять форму ответа
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return LectureJSONResponse(items, headers=headers)
+
+
+@router.get("/export", response_class=StreamingResponse)
+@inject
+async def export_lectures(
+    repo: FromDishka[ILectureRepository],
+    author_id: str | None = None,
+    registered_from: datetime | None = None,
+    registered_to: datetime | None = None,
+    resume_after: str | None = None,
+) -> StreamingResponse:
+    """
+    Выгрузка лекций с транскриптами в NDJSON (одна лекция на строку, по
+    возрастанию id). Если выгрузка оборвалась, ее продолжают, передав в
+    resume_after id последней полученной строки.
+    """
+    try:
+        lectures = repo.export(
+            author_id=AuthorId(author_id) if author_id else None,
+            registered_from=registered_from,
+            registered_to=registered_to,
+            resume_after=LectureId(resume_after) if resume_after else None,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for lecture in lectures:
+            yield dumps(encode_lecture(lecture)) + b"\n"
 
-    created = await repo.find_by_id(lecture_id)
-    return created
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/search", response_model=list[SearchHitRead])
+@inject
+async def search_lectures(
+    repo: FromDishka[ILectureRepository],
+    q: Annotated[str, Query(min_length=2, max_length=MAX_SEARCH_QUERY)],
+    limit: Annotated[int, Query(ge=1, le=MAX_LIMIT)] = DEFAULT_LIMIT,
+    cursor: str | None = None,
+    author_id: str | None = None,
+) -> Any:
+    """
+    Поиск по названиям и транскриптам с учетом русской морфологии.
+    Выдача отсортирована по релевантности; snippet — фрагмент транскрипта
+    с позициями совпадений. Следующая страница — по курсору из X-Next-Cursor.
+    """
+    try:
+        page = await repo.search(
+            q,
+            limit=limit,
+            cursor=cursor,
+            author_id=AuthorId(author_id) if author_id else None,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    return LectureJSONResponse([encode_hit(hit) for hit in page.items], headers=headers)
+
+
+@router.get("/tags", response_model=list[TagCountRead])
+@inject
+async def list_tags(repo: FromDishka[ILectureRepository]) -> Any:
+    """Теги с количеством лекций, от самых частых."""
+    counts = await repo.count_tags()
+    ordered = sorted(counts.items(), key=lambda item: (-item[1], item[0].value))
+    return LectureJSONResponse(
+        [{"tag": tag.value, "count": count} for tag, count in ordered]
+    )
 
 
-@router.get("/", response_model=list[LectureRead])
+@router.get("/events", response_class=StreamingResponse)
 @inject
-async def list_lectures(repo: FromDishka[ILectureRepository]) -> Any:
-    return await repo.find_all()
+async def stream_lecture_events(
+    broadcaster: FromDishka[LectureEventBroadcaster],
+) -> StreamingResponse:
+    """
+    Server-Sent Events об изменениях лекций (event: lecture, data: JSON с
+    type, lecture_id, status, updated_at). Раз в SSE_HEARTBEAT_SEC
+    отправляется комментарий, чтобы прокси не закрывали простаивающее
+    соединение.
+    """
+
+    async def events() -> AsyncIterator[str]:
+        async with broadcaster.subscribe() as queue:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+            while True:
+                try:
+                    data = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SEC)
+                except TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: lecture\ndata: {data}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{lecture_id}", response_model=LectureRead)
 @inject
-async def get_lecture(lecture_id: str, repo: FromDishka[ILectureRepository]) -> Any:
-    lecture = await repo.find_by_id(LectureId(lecture_id))
+async def get_lecture(
+    lecture_id: str,
+    repo: FromDishka[ILectureRepository],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Any:
+    lid = LectureId(lecture_id)
+    if if_none_match:
+        version = await repo.find_version(lid)
+        if version and etag_matches(if_none_match, lecture_etag(version)):
+            return _not_modified(lecture_etag(version))
+
+    lecture = await repo.find_by_id(lid)
     if not lecture:
         raise HTTPException(status_code=404, detail="Lecture not found")
-    return lecture
+    return LectureJSONResponse(
+        encode_lecture(lecture),
+        headers=_etag_headers(_lecture_etag(lecture)),
+    )
+
+
+@router.get("/{lecture_id}/segments", response_model=list[SegmentRead])
+@inject
+async def get_lecture_segments(
+    lecture_id: str,
+    repo: FromDishka[ILectureRepository],
+    segments: FromDishka[ISegmentRepository],
+    start: Annotated[float, Query(alias="from", ge=0)] = 0,
+    end: Annotated[float | None, Query(alias="to", gt=0)] = None,
+) -> Any:
+    """
+    Сегменты транскрипта с таймингом, пересекающиеся с [from, to) секунд.
+    Читаются только пачки сегментов, попадающие в интервал.
+    """
+    if end is not None and end <= start:
+        raise HTTPException(status_code=400, detail="'to' must be greater than 'from'")
+
+    lid = LectureId(lecture_id)
+    if not await repo.find_version(lid):
+        raise HTTPException(status_code=404, detail="Lecture not found")
+
+    found = await segments.find_range(lid, start, end if end is not None else math.inf)
+    return LectureJSONResponse([encode_segment(segment) for segment in found])
 
 
 @router.patch("/{lecture_id}", response_model=LectureRead)
@@ -64,7 +381,8 @@ async def update_lecture(
     data: LectureUpdate,
     repo: FromDishka[ILectureRepository],
 ) -> Any:
-    lecture = await repo.find_by_id(LectureId(lecture_id))
+    lid = LectureId(lecture_id)
+    lecture = await repo.find_by_id(lid)
     if not lecture:
         raise HTTPException(status_code=404, detail="Lecture not found")
 
@@ -75,11 +393,20 @@ async def update_lecture(
     )
 
     await repo.save(lecture)
-    return lecture
+    return LectureJSONResponse(
+        encode_lecture(lecture),
+        headers=_etag_headers(_lecture_etag(lecture)),
+    )
 
 
 @router.delete("/{lecture_id}", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-async def delete_lecture(lecture_id: str, repo: FromDishka[ILectureRepository]) -> None:
-    if not await repo.delete(LectureId(lecture_id)):
+async def delete_lecture(
+    lecture_id: str,
+    repo: FromDishka[ILectureRepository],
+    segments: FromDishka[ISegmentRepository],
+) -> None:
+    lid = LectureId(lecture_id)
+    if not await repo.delete(lid):
         raise HTTPException(status_code=404, detail="Lecture not found")
+    await segments.delete(lid)
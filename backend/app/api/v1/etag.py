@@ -0,0 +1,45 @@
+"""
+Сильные ETag для лекций и страниц списка, проверка If-None-Match.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from datetime import datetime
+
+from app.domain.entities.lecture import LectureVersion
+
+
+def _stamp(updated_at: datetime) -> str:
+    # Mongo хранит время с точностью до миллисекунд: только что записанная
+    # сущность и прочитанная из базы должны давать один и тот же тег
+    return updated_at.isoformat(timespec="milliseconds")
+
+
+def lecture_etag(version: LectureVersion) -> str:
+    digest = hashlib.sha1(f"{version.id.value}:{_stamp(version.updated_at)}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def page_etag(
+    versions: Iterable[LectureVersion], next_cursor: str | None, variant: str
+) -> str:
+    """
+    Тег страницы меняется при изменении, добавлении или удалении любой
+    лекции на ней. variant отличает представления одной страницы
+    (краткое и с транскриптами).
+    """
+    digest = hashlib.sha1(variant.encode())
+    for version in versions:
+        digest.update(f"|{version.id.value}:{_stamp(version.updated_at)}".encode())
+    digest.update(f"|{next_cursor or ''}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Слабое сравнение, как требует RFC 9110 для If-None-Match."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
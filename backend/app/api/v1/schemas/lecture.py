@@ -3,7 +3,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from app.domain.entities.lecture import LectureStatus
+from app.common.constants import MAX_BULK_SIZE
+from app.domain.entities.lecture import LectureStatus, LectureSummary
 
 
 class TranscriptSchema(BaseModel):
@@ -26,6 +27,35 @@ class LectureUpdate(BaseModel):
     tags: list[str] | None = None
 
 
+class LectureSummaryRead(LectureBase):
+    id: str
+    author_id: str
+    status: LectureStatus
+    has_content: bool
+    registered_at: datetime
+    updated_at: datetime
+    published_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def transform_domain_to_schema(cls, data: Any) -> Any:
+        if isinstance(data, LectureSummary):
+            return {
+                "id": data.id.value,
+                "author_id": data.author_id.value,
+                "title": data.title.value,
+                "tags": [t.value for t in data.tags],
+                "status": data.status,
+                "has_content": data.has_content,
+                "registered_at": data.registered_at,
+                "updated_at": data.updated_at,
+                "published_at": data.published_at,
+            }
+        return data
+
+
 class LectureRead(LectureBase):
     id: str
     author_id: str
@@ -59,3 +89,43 @@ class LectureRead(LectureBase):
                 "content": getattr(data, "content", None),
             }
         return data
+
+
+class SegmentRead(BaseModel):
+    start: float
+    end: float
+    text: str
+    confidence: float | None = None
+
+
+class SnippetRead(BaseModel):
+    text: str
+    offset: int
+    highlights: list[tuple[int, int]]
+
+
+class SearchHitRead(BaseModel):
+    lecture: LectureSummaryRead
+    score: float
+    snippet: SnippetRead | None = None
+
+
+class TagCountRead(BaseModel):
+    tag: str
+    count: int
+
+
+class LectureBulkCreate(BaseModel):
+    # Элементы (любого JSON-типа) валидируются по одному, чтобы ошибка
+    # не роняла всю пачку
+    items: list[Any] = Field(..., min_length=1, max_length=MAX_BULK_SIZE)
+
+
+class BulkItemError(BaseModel):
+    index: int
+    errors: list[dict[str, Any]]
+
+
+class LectureBulkResult(BaseModel):
+    created: list[LectureRead]
+    errors: list[BulkItemError] = Field(default_factory=list)
@@ -1,7 +1,34 @@
 # MongoDB Settings
 MONGO_TIMEOUT_MS = 5000
 MONGO_LECTURES_COLLECTION = "lectures"
+MONGO_EXPORT_BATCH_SIZE = 500
 
 # Pagination Defaults
 DEFAULT_LIMIT = 10
 DEFAULT_OFFSET = 0
+MAX_LIMIT = 100
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Full-text Search
+MAX_SEARCH_QUERY = 200
+
+# Bulk Ingestion
+MAX_BULK_SIZE = 500
+
+# Lecture Events (SSE)
+LECTURE_EVENTS_CHANNEL = "lectures:events"
+SSE_HEARTBEAT_SEC = 15
+SSE_RETRY_MS = 3000
+SSE_CLIENT_QUEUE_SIZE = 100
+
+# Transcript Segments
+MONGO_SEGMENTS_COLLECTION = "lecture_segments"
+# Длительность записи, сегменты которой хранятся одним документом
+SEGMENT_BUCKET_SEC = 300
+# Предельная длина одного сегмента: ограничивает, насколько пачка может
+# выходить за свой интервал, и тем самым нижнюю границу поиска по времени
+SEGMENT_MAX_SEC = 300
+
+# Task Queue
+# Список Redis, в который ListQueueBroker складывает задачи
+TASKIQ_QUEUE_NAME = "taskiq"
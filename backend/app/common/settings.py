@@ -22,6 +22,25 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
 
+    LECTURE_CACHE_TTL_SEC: int = 30
+    # Инкрементальные правки счетчиков тегов могут разойтись при гонках;
+    # по истечении TTL счетчики пересчитываются агрегацией целиком
+    TAG_FACETS_TTL_SEC: int = 600
+    # Транскрипты от этого размера (байт UTF-8) хранятся сжатыми; в текстовом
+    # индексе остаются их слова без повторов, без фразового поиска.
+    # 0 отключает сжатие
+    TRANSCRIPT_COMPRESS_MIN_BYTES: int = 64 * 1024
+
+    # Лекция в PROCESSING дольше этого срока считается брошенной упавшим
+    # воркером, и повторная задача может забрать ее заново
+    PROCESSING_LEASE_SEC: int = 30 * 60
+
+    # Пауза между попытками создать индексы, если Mongo недоступна при старте
+    INDEX_BOOTSTRAP_RETRY_SEC: float = 30.0
+
+    HEALTH_CHECK_INTERVAL_SEC: float = 5.0
+    HEALTH_PROBE_TIMEOUT_SEC: float = 1.0
+
     @computed_field
     def mongo_url(self) -> str:
         return (
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+from app.domain.entities.lecture import LectureStatus
+from app.domain.entities.value_objects import LectureId
+
+
+class LectureEventType(StrEnum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+@dataclass(frozen=True, kw_only=True)
+class LectureEvent:
+    """Уведомление об изменении лекции, без тела самой лекции."""
+
+    type: LectureEventType
+    lecture_id: LectureId
+    status: LectureStatus | None = None
+    updated_at: datetime | None = None
@@ -1,6 +1,7 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import StrEnum
+from typing import Any
 
 from app.domain.entities.value_objects import (
     AuthorId,
@@ -19,6 +20,10 @@ class LectureStatus(StrEnum):
     FAILED = "failed"
 
 
+# Статусы, из которых лекцию можно (пере)запустить в обработку
+STARTABLE_STATUSES = frozenset({LectureStatus.PENDING, LectureStatus.FAILED})
+
+
 @dataclass(kw_only=True)
 class Lecture:
     id: LectureId | None = None
@@ -34,8 +39,33 @@ class Lecture:
     updated_at: datetime
     published_at: datetime | None = None
 
+    # Поля, измененные после загрузки/последнего сохранения, и их исходные
+    # значения. Заполняется в __setattr__, поэтому учитываются и методы,
+    # и прямое присваивание
+    _original: dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        # Во время __init__ _original еще не создан — начальные значения не грязные
+        original = self.__dict__.get("_original")
+        if original is not None and name in _TRACKED_FIELDS and name not in original:
+            original[name] = self.__dict__[name]
+        super().__setattr__(name, value)
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        return frozenset(self._original)
+
+    def original_value(self, name: str) -> Any:
+        """Значение поля на момент последнего mark_clean."""
+        return self._original.get(name, getattr(self, name))
+
+    def mark_clean(self) -> None:
+        self._original.clear()
+
     def start_processing(self, at: datetime) -> None:
-        if self.status not in (LectureStatus.PENDING, LectureStatus.FAILED):
+        if self.status not in STARTABLE_STATUSES:
             raise InvalidStateTransitionError(
                 f"Cannot start processing from {self.status}"
             )
@@ -71,3 +101,38 @@ class Lecture:
         if tags is not None:
             self.tags = tags
         self.updated_at = at
+
+
+_TRACKED_FIELDS = frozenset(f.name for f in fields(Lecture)) - {"id", "_original"}
+
+
+@dataclass(frozen=True)
+class TagFilter:
+    """Отбор по тегам: лекции хотя бы с одним из tags или, при match_all, со всеми"""
+
+    tags: frozenset[Tag]
+    match_all: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class LectureSummary:
+    """Модель для списков: метаданные лекции без тела транскрипта"""
+
+    id: LectureId
+    author_id: AuthorId
+    title: Title
+    tags: frozenset[Tag] = field(default_factory=frozenset)
+    status: LectureStatus
+    has_content: bool = False
+
+    registered_at: datetime
+    updated_at: datetime
+    published_at: datetime | None = None
+
+
+@dataclass(frozen=True)
+class LectureVersion:
+    """Отметка версии лекции: для условных запросов без чтения документа"""
+
+    id: LectureId
+    updated_at: datetime
@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
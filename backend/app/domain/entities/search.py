@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from app.domain.entities.lecture import LectureSummary
+
+
+@dataclass(frozen=True, kw_only=True)
+class Snippet:
+    """Фрагмент транскрипта вокруг первого совпадения"""
+
+    text: str
+    # Смещение фрагмента в полном тексте транскрипта, в символах
+    offset: int
+    # Совпадения внутри фрагмента: пары (начало, конец) относительно text
+    highlights: tuple[tuple[int, int], ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True)
+class SearchHit:
+    lecture: LectureSummary
+    score: float
+    snippet: Snippet | None = None
@@ -30,6 +30,23 @@ class Transcript:
         return len(self.text.strip()) == 0
 
 
+@dataclass(frozen=True)
+class TranscriptSegment:
+    """Фрагмент расшифровки с таймингом; смещения в секундах от начала записи"""
+
+    start: float
+    end: float
+    text: str
+    confidence: float | None = None
+
+    def __post_init__(self) -> None:
+        if not (0 <= self.start <= self.end):
+            raise ValueError("Segment must satisfy 0 <= start <= end")
+
+    def overlaps(self, start: float, end: float) -> bool:
+        return self.start < end and self.end > start
+
+
 @dataclass(frozen=True)
 class Tag:
     value: str
@@ -44,3 +61,6 @@ class DomainError(Exception): ...
 
 
 class InvalidStateTransitionError(DomainError): ...
+
+
+class InvalidCursorError(DomainError): ...
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from app.domain.entities.events import LectureEvent
+
+
+class ILectureEventPublisher(ABC):
+    @abstractmethod
+    async def publish(self, *events: LectureEvent) -> None:
+        """
+        Рассылает события подписчикам. Доставка best-effort: ошибка
+        публикации не должна ломать уже выполненную запись.
+        """
+        ...
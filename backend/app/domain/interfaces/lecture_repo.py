@@ -1,7 +1,19 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Collection, Sequence
+from datetime import datetime
+from typing import Any
 
-from app.domain.entities.lecture import Lecture
-from app.domain.entities.value_objects import AuthorId, LectureId
+from app.common.constants import DEFAULT_LIMIT
+from app.domain.entities.lecture import (
+    Lecture,
+    LectureStatus,
+    LectureSummary,
+    LectureVersion,
+    TagFilter,
+)
+from app.domain.entities.pagination import Page
+from app.domain.entities.search import SearchHit
+from app.domain.entities.value_objects import AuthorId, LectureId, Tag
 
 
 class ILectureRepository(ABC):
@@ -9,7 +21,46 @@ class ILectureRepository(ABC):
     async def add(self, lecture: Lecture) -> LectureId: ...
 
     @abstractmethod
-    async def save(self, lecture: Lecture) -> None: ...
+    async def add_many(self, lectures: Sequence[Lecture]) -> list[LectureId | None]:
+        """
+        Вставляет лекции одной пачкой, не прерываясь на ошибке отдельной записи.
+        Возвращает id в порядке входа; None — запись не удалось вставить.
+        """
+        ...
+
+    @abstractmethod
+    async def save(self, lecture: Lecture) -> None:
+        """
+        Сохраняет только поля из lecture.dirty_fields и сбрасывает их.
+        """
+        ...
+
+    @abstractmethod
+    async def transition_status(
+        self,
+        lecture_id: LectureId,
+        *,
+        from_statuses: Collection[LectureStatus],
+        to_status: LectureStatus,
+        at: datetime,
+        stale_before: datetime | None = None,
+        claim: str | None = None,
+        claimed_by: str | None = None,
+        **fields: Any,
+    ) -> LectureSummary | None:
+        """
+        Атомарно переводит лекцию в to_status, только если ее текущий статус
+        входит в from_statuses. Вместе со статусом пишутся updated_at=at и
+        fields (по именам полей Lecture). С stale_before подходит и лекция,
+        уже находящаяся в to_status, если updated_at раньше stale_before:
+        так переход, брошенный упавшим обработчиком, можно перехватить.
+        claim записывает в лекцию токен захватившего ее обработчика;
+        с claimed_by переход выполняется, только если записан этот токен —
+        обработчик, у которого лекцию перехватили, ее уже не меняет.
+        Возвращает лекцию после перехода или None, если лекции нет или ее
+        статус уже другой.
+        """
+        ...
 
     @abstractmethod
     async def delete(self, lecture_id: LectureId) -> bool: ...
@@ -19,9 +70,116 @@ class ILectureRepository(ABC):
 
     @abstractmethod
     async def find_all(
-        self, *, limit: int = 10, offset: int = 0, author_id: AuthorId | None = None
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        author_id: AuthorId | None = None,
+        tags: TagFilter | None = None,
     ) -> list[Lecture]: ...
 
+    @abstractmethod
+    async def find_page(
+        self,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        cursor: str | None = None,
+        author_id: AuthorId | None = None,
+        status: LectureStatus | None = None,
+        tags: TagFilter | None = None,
+    ) -> Page[Lecture]:
+        """
+        Keyset-пагинация по (registered_at, id), от новых к старым.
+        cursor — непрозрачный токен из Page.next_cursor предыдущей страницы.
+        Бросает InvalidCursorError, если токен не удалось разобрать.
+        """
+        ...
+
+    @abstractmethod
+    async def find_summary_page(
+        self,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        cursor: str | None = None,
+        author_id: AuthorId | None = None,
+        status: LectureStatus | None = None,
+        tags: TagFilter | None = None,
+    ) -> Page[LectureSummary]:
+        """
+        То же, что find_page, но без чтения текста транскрипта из хранилища.
+        """
+        ...
+
+    @abstractmethod
+    async def find_summary(self, lecture_id: LectureId) -> LectureSummary | None:
+        """
+        Метаданные лекции без чтения текста транскрипта.
+        """
+        ...
+
+    @abstractmethod
+    async def find_version(self, lecture_id: LectureId) -> LectureVersion | None:
+        """
+        Версия лекции (id + updated_at) без чтения остальных полей.
+        """
+        ...
+
+    @abstractmethod
+    async def find_version_page(
+        self,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        cursor: str | None = None,
+        author_id: AuthorId | None = None,
+        status: LectureStatus | None = None,
+        tags: TagFilter | None = None,
+    ) -> Page[LectureVersion]:
+        """
+        Версии лекций той же страницы, что вернули бы find_page и
+        find_summary_page с теми же аргументами.
+        """
+        ...
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        cursor: str | None = None,
+        author_id: AuthorId | None = None,
+    ) -> Page[SearchHit]:
+        """
+        Полнотекстовый поиск по названию и транскрипту, от самых релевантных.
+        query в синтаксисе $text: слова, "фразы", -исключения.
+        Бросает InvalidCursorError, если токен не удалось разобрать.
+        """
+        ...
+
+    @abstractmethod
+    def export(
+        self,
+        *,
+        author_id: AuthorId | None = None,
+        registered_from: datetime | None = None,
+        registered_to: datetime | None = None,
+        resume_after: LectureId | None = None,
+    ) -> AsyncIterator[Lecture]:
+        """
+        Потоковый обход лекций в порядке id, без загрузки всего набора в память.
+        resume_after — id последней полученной лекции для продолжения выгрузки.
+        Аргументы проверяются сразу при вызове (InvalidCursorError),
+        а не на первой итерации.
+        """
+        ...
+
+    @abstractmethod
+    async def count_tags(self) -> dict[Tag, int]:
+        """
+        Количество лекций по каждому тегу.
+        """
+        ...
+
     @abstractmethod
     async def count(self, author_id: AuthorId | None = None) -> int:
         """
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from app.domain.entities.value_objects import LectureId, TranscriptSegment
+
+
+class ISegmentRepository(ABC):
+    @abstractmethod
+    async def replace(
+        self, lecture_id: LectureId, segments: Sequence[TranscriptSegment]
+    ) -> None:
+        """
+        Заменяет все сегменты лекции. Повторный вызов с теми же данными
+        дает тот же результат, поэтому безопасен при повторе задачи.
+        Бросает ValueError, если сегмент длиннее SEGMENT_MAX_SEC.
+        """
+        ...
+
+    @abstractmethod
+    async def find_range(
+        self, lecture_id: LectureId, start: float, end: float
+    ) -> list[TranscriptSegment]:
+        """
+        Сегменты, пересекающиеся с интервалом [start, end), по возрастанию start.
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, lecture_id: LectureId) -> None: ...
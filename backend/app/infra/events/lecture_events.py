@@ -0,0 +1,215 @@
+"""
+События об изменении лекций через Redis pub/sub.
+
+Любой процесс (API или воркер) публикует события в общий канал. Каждый
+API-процесс держит ровно одну подписку на канал и раздает сообщения
+своим SSE-клиентам через ограниченные очереди в памяти.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Collection, Sequence
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.entities.events import LectureEvent, LectureEventType
+from app.domain.entities.lecture import Lecture, LectureStatus, LectureSummary
+from app.domain.entities.value_objects import LectureId
+from app.domain.interfaces.lecture_events import ILectureEventPublisher
+from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.infra.repositories.decorator import LectureRepositoryDecorator
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_DELAY_SEC = 1.0
+SUBSCRIBE_TIMEOUT_SEC = 5.0
+
+
+def dump_event(event: LectureEvent) -> str:
+    return json.dumps(
+        {
+            "type": str(event.type),
+            "lecture_id": event.lecture_id.value,
+            "status": str(event.status) if event.status else None,
+            "updated_at": event.updated_at.isoformat() if event.updated_at else None,
+        }
+    )
+
+
+class RedisLectureEventPublisher(ILectureEventPublisher):
+    def __init__(self, redis: Redis, channel: str) -> None:
+        self._redis = redis
+        self._channel = channel
+
+    async def publish(self, *events: LectureEvent) -> None:
+        if not events:
+            return
+        try:
+            if len(events) == 1:
+                await self._redis.publish(self._channel, dump_event(events[0]))
+                return
+            pipe = self._redis.pipeline(transaction=False)
+            for event in events:
+                pipe.publish(self._channel, dump_event(event))
+            await pipe.execute()
+        except RedisError:
+            logger.warning("Lecture event publish failed", exc_info=True)
+
+
+class LectureEventBroadcaster:
+    """
+    Одна подписка на канал на процесс, веером по очередям клиентов.
+    Медленный клиент не тормозит остальных: при переполнении его очереди
+    теряются самые старые события (клиенту важен сам факт изменения).
+    """
+
+    def __init__(self, redis: Redis, channel: str, queue_size: int) -> None:
+        self._redis = redis
+        self._channel = channel
+        self._queue_size = queue_size
+        self._queues: set[asyncio.Queue[str]] = set()
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._queues)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue[str]]:
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self._queue_size)
+        self._queues.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+        try:
+            # Ждем подтверждения подписки, чтобы не пропустить события,
+            # опубликованные сразу после подключения клиента
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._ready.wait(), SUBSCRIBE_TIMEOUT_SEC)
+            yield queue
+        finally:
+            self._queues.discard(queue)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                async for message in pubsub.listen():
+                    if message["type"] == "subscribe":
+                        self._ready.set()
+                    elif message["type"] == "message":
+                        self._fan_out(message["data"])
+            except RedisError:
+                logger.warning("Lecture events subscription lost", exc_info=True)
+            finally:
+                self._ready.clear()
+                await pubsub.aclose()  # type: ignore
+            await asyncio.sleep(RECONNECT_DELAY_SEC)
+
+    def _fan_out(self, data: str) -> None:
+        for queue in self._queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(data)
+
+
+class PublishingLectureRepository(LectureRepositoryDecorator):
+    """
+    Декоратор репозитория: после успешной записи публикует событие.
+    Должен быть внешним по отношению к кэшу — к моменту, когда клиент
+    получит событие и перечитает лекцию, кэш уже сброшен.
+    """
+
+    def __init__(
+        self, inner: ILectureRepository, publisher: ILectureEventPublisher
+    ) -> None:
+        super().__init__(inner)
+        self._publisher = publisher
+
+    async def add(self, lecture: Lecture) -> LectureId:
+        lecture_id = await self._inner.add(lecture)
+        await self._publisher.publish(
+            self._event(LectureEventType.CREATED, lecture_id, lecture)
+        )
+        return lecture_id
+
+    async def add_many(self, lectures: Sequence[Lecture]) -> list[LectureId | None]:
+        ids = await self._inner.add_many(lectures)
+        await self._publisher.publish(
+            *(
+                self._event(LectureEventType.CREATED, lecture_id, lecture)
+                for lecture_id, lecture in zip(ids, lectures, strict=True)
+                if lecture_id is not None
+            )
+        )
+        return ids
+
+    async def save(self, lecture: Lecture) -> None:
+        changed = bool(lecture.dirty_fields)
+        await self._inner.save(lecture)
+        if changed and lecture.id:
+            await self._publisher.publish(
+                self._event(LectureEventType.UPDATED, lecture.id, lecture)
+            )
+
+    async def transition_status(
+        self,
+        lecture_id: LectureId,
+        *,
+        from_statuses: Collection[LectureStatus],
+        to_status: LectureStatus,
+        at: datetime,
+        stale_before: datetime | None = None,
+        claim: str | None = None,
+        claimed_by: str | None = None,
+        **fields: Any,
+    ) -> LectureSummary | None:
+        result = await self._inner.transition_status(
+            lecture_id,
+            from_statuses=from_statuses,
+            to_status=to_status,
+            at=at,
+            stale_before=stale_before,
+            claim=claim,
+            claimed_by=claimed_by,
+            **fields,
+        )
+        if result:
+            await self._publisher.publish(
+                self._event(LectureEventType.UPDATED, lecture_id, result)
+            )
+        return result
+
+    async def delete(self, lecture_id: LectureId) -> bool:
+        deleted = await self._inner.delete(lecture_id)
+        if deleted:
+            await self._publisher.publish(
+                LectureEvent(type=LectureEventType.DELETED, lecture_id=lecture_id)
+            )
+        return deleted
+
+    @staticmethod
+    def _event(
+        event_type: LectureEventType,
+        lecture_id: LectureId,
+        lecture: Lecture | LectureSummary,
+    ) -> LectureEvent:
+        return LectureEvent(
+            type=event_type,
+            lecture_id=lecture_id,
+            status=lecture.status,
+            updated_at=lecture.updated_at,
+        )
@@ -0,0 +1,99 @@
+"""
+Проверки зависимостей для /health: параллельно, с таймаутом на каждую,
+результат обновляется в фоне не чаще раза в интервал на процесс.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+logger = logging.getLogger(__name__)
+
+type Probe = Callable[[], Awaitable[object]]
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    ok: bool
+    latency_ms: float
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    probes: dict[str, ProbeResult]
+    checked_at: datetime
+
+    @property
+    def healthy(self) -> bool:
+        return all(result.ok for result in self.probes.values())
+
+
+class HealthMonitor:
+    """
+    Держит последний HealthSnapshot. Запросы к /health читают его и сами
+    в базы не ходят: проверки выполняет только фоновая задача.
+    """
+
+    def __init__(
+        self,
+        probes: Mapping[str, Probe],
+        *,
+        timeout_sec: float,
+        interval_sec: float,
+    ) -> None:
+        self._probes = dict(probes)
+        self._timeout_sec = timeout_sec
+        self._interval_sec = interval_sec
+        self._snapshot: HealthSnapshot | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def snapshot(self) -> HealthSnapshot:
+        if self._snapshot is None:
+            raise RuntimeError("HealthMonitor is not started")
+        return self._snapshot
+
+    async def start(self) -> None:
+        # Первый снимок готов до того, как монитор отдадут обработчикам
+        self._snapshot = await self.check()
+        self._task = asyncio.create_task(self._refresh_forever())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def check(self) -> HealthSnapshot:
+        names = list(self._probes)
+        results = await asyncio.gather(*(self._run(self._probes[n]) for n in names))
+        return HealthSnapshot(
+            probes=dict(zip(names, results, strict=True)),
+            checked_at=datetime.now(UTC),
+        )
+
+    async def _run(self, probe: Probe) -> ProbeResult:
+        started = time.perf_counter()
+        error: str | None = None
+        try:
+            await asyncio.wait_for(probe(), self._timeout_sec)
+        except TimeoutError:
+            error = f"timed out after {self._timeout_sec}s"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        latency_ms = (time.perf_counter() - started) * 1000
+        return ProbeResult(ok=error is None, latency_ms=latency_ms, error=error)
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_sec)
+            try:
+                self._snapshot = await self.check()
+            except Exception:
+                logger.exception("Health refresh failed")
@@ -5,9 +5,32 @@ from dishka import Provider, Scope, provide
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from redis.asyncio import Redis, from_url
 
+from app.common.constants import (
+    LECTURE_EVENTS_CHANNEL,
+    SSE_CLIENT_QUEUE_SIZE,
+    TASKIQ_QUEUE_NAME,
+)
 from app.common.settings import settings
+from app.domain.interfaces.lecture_events import ILectureEventPublisher
 from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.domain.interfaces.segment_repo import ISegmentRepository
+from app.infra.events.lecture_events import (
+    LectureEventBroadcaster,
+    PublishingLectureRepository,
+    RedisLectureEventPublisher,
+)
+from app.infra.health import HealthMonitor
+from app.infra.metrics.instruments import Metrics
+from app.infra.metrics.repository import InstrumentedLectureRepository
+from app.infra.repositories.mongo.indexes import IndexBootstrap
 from app.infra.repositories.mongo.lecture import MongoLectureRepository
+from app.infra.repositories.mongo.registry import MONGO_INDEXES
+from app.infra.repositories.mongo.segment import MongoSegmentRepository
+from app.infra.repositories.redis.lecture_cache import (
+    CachedLectureRepository,
+    LectureCache,
+)
+from app.infra.repositories.redis.tag_facets import TagFacetCache, TagFacetRepository
 
 # TODO:
 # 1. Разбить на провайдеры
@@ -17,9 +40,13 @@ class AppProvider(Provider):
     # Infra
 
     @provide(scope=Scope.APP)
-    async def get_mongo_client(self) -> AsyncIterable[AsyncIOMotorClient[Any]]:
+    async def get_mongo_client(
+        self, metrics: Metrics
+    ) -> AsyncIterable[AsyncIOMotorClient[Any]]:
         client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(
-            str(settings.mongo_url), serverSelectionTimeoutMS=5000
+            str(settings.mongo_url),
+            serverSelectionTimeoutMS=5000,
+            event_listeners=[metrics.mongo_pool],
         )
         yield client
         client.close()
@@ -28,14 +55,84 @@ class AppProvider(Provider):
     def get_db(self, client: AsyncIOMotorClient[Any]) -> AsyncIOMotorDatabase[Any]:
         return client[settings.MONGO_DB_NAME]
 
+    @provide(scope=Scope.APP)
+    async def get_index_bootstrap(
+        self, db: AsyncIOMotorDatabase[Any]
+    ) -> AsyncIterable[IndexBootstrap]:
+        # Один раз на контейнер (процесс): создает недостающие индексы в фоне
+        bootstrap = IndexBootstrap(
+            db, MONGO_INDEXES, retry_sec=settings.INDEX_BOOTSTRAP_RETRY_SEC
+        )
+        bootstrap.start()
+        yield bootstrap
+        await bootstrap.close()
+
     @provide(scope=Scope.APP)
     async def get_redis(self) -> AsyncIterable[Redis]:
         client = from_url(str(settings.redis_url), decode_responses=True)  # type: ignore
         yield client
         await client.aclose()
 
+    @provide(scope=Scope.APP)
+    def get_metrics(self, redis: Redis) -> Metrics:
+        return Metrics(redis, queue_name=TASKIQ_QUEUE_NAME)
+
+    @provide(scope=Scope.APP)
+    async def get_health_monitor(
+        self, db: AsyncIOMotorDatabase[Any], redis: Redis
+    ) -> AsyncIterable[HealthMonitor]:
+        monitor = HealthMonitor(
+            {
+                "mongodb": lambda: db.command("ping"),
+                "redis": lambda: redis.ping(),
+            },
+            timeout_sec=settings.HEALTH_PROBE_TIMEOUT_SEC,
+            interval_sec=settings.HEALTH_CHECK_INTERVAL_SEC,
+        )
+        await monitor.start()
+        yield monitor
+        await monitor.close()
+
+    @provide(scope=Scope.APP)
+    def get_lecture_cache(self, redis: Redis) -> LectureCache:
+        return LectureCache(redis, ttl_sec=settings.LECTURE_CACHE_TTL_SEC)
+
+    @provide(scope=Scope.APP)
+    def get_tag_facets(self, redis: Redis) -> TagFacetCache:
+        return TagFacetCache(redis, ttl_sec=settings.TAG_FACETS_TTL_SEC)
+
+    @provide(scope=Scope.APP)
+    def get_event_publisher(self, redis: Redis) -> ILectureEventPublisher:
+        return RedisLectureEventPublisher(redis, LECTURE_EVENTS_CHANNEL)
+
+    @provide(scope=Scope.APP)
+    async def get_event_broadcaster(
+        self, redis: Redis
+    ) -> AsyncIterable[LectureEventBroadcaster]:
+        broadcaster = LectureEventBroadcaster(
+            redis, LECTURE_EVENTS_CHANNEL, queue_size=SSE_CLIENT_QUEUE_SIZE
+        )
+        yield broadcaster
+        await broadcaster.close()
+
     # Repos
 
     @provide(scope=Scope.REQUEST)
-    def get_lecture_repo(self, db: AsyncIOMotorDatabase[Any]) -> ILectureRepository:
-        return MongoLectureRepository(db)
+    def get_lecture_repo(
+        self,
+        db: AsyncIOMotorDatabase[Any],
+        cache: LectureCache,
+        facets: TagFacetCache,
+        publisher: ILectureEventPublisher,
+        metrics: Metrics,
+    ) -> ILectureRepository:
+        repo: ILectureRepository = InstrumentedLectureRepository(
+            MongoLectureRepository(db), metrics.repo_calls
+        )
+        repo = CachedLectureRepository(repo, cache)
+        repo = TagFacetRepository(repo, facets)
+        return PublishingLectureRepository(repo, publisher)
+
+    @provide(scope=Scope.REQUEST)
+    def get_segment_repo(self, db: AsyncIOMotorDatabase[Any]) -> ISegmentRepository:
+        return MongoSegmentRepository(db)
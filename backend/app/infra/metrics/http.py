@@ -0,0 +1,50 @@
+import time
+
+from dishka import AsyncContainer
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infra.metrics.instruments import Metrics
+
+# Метка для запросов, не попавших ни в один маршрут: сырой путь в метке
+# дал бы неограниченное число рядов
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Чистый ASGI middleware (не BaseHTTPMiddleware): не буферизует ответ
+    и не ломает потоковые ответы вроде SSE и экспорта.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        container: AsyncContainer = scope["app"].state.dishka_container
+        metrics = await container.get(Metrics)
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Маршрут известен только после роутинга: FastAPI кладет его в scope.
+            # Берем имя обработчика: route.path у вложенных роутеров бывает
+            # относительным, и разные маршруты совпали бы в одной метке
+            route = scope.get("route")
+            metrics.http_requests.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                route.name if route is not None else UNMATCHED_ROUTE,
+                str(status),
+            )
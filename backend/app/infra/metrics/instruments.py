@@ -0,0 +1,54 @@
+from redis.asyncio import Redis
+
+from app.infra.metrics.pools import (
+    MongoPoolListener,
+    QueueLengthCollector,
+    RedisPoolCollector,
+)
+from app.infra.metrics.registry import Gauge, Histogram, MetricsRegistry
+
+
+class Metrics:
+    """Метрики процесса. Один экземпляр на контейнер (APP-скоуп)."""
+
+    def __init__(self, redis: Redis, queue_name: str) -> None:
+        self.registry = MetricsRegistry()
+
+        self.http_requests = self.registry.register(
+            Histogram(
+                "http_request_duration_seconds",
+                "HTTP request latency until the response is fully sent",
+                ("method", "route", "status"),
+            )
+        )
+        self.repo_calls = self.registry.register(
+            Histogram(
+                "lecture_repo_call_duration_seconds",
+                "MongoLectureRepository call latency",
+                ("method", "outcome"),
+            )
+        )
+
+        mongo_pool_gauge = self.registry.register(
+            Gauge(
+                "mongo_pool_connections",
+                "MongoDB pool connections by server and state",
+                ("address", "state"),
+            )
+        )
+        redis_pool_gauge = self.registry.register(
+            Gauge(
+                "redis_pool_connections",
+                "Redis pool connections by state",
+                ("state",),
+            )
+        )
+        queue_gauge = self.registry.register(
+            Gauge("taskiq_queue_length", "Tasks waiting in the queue", ("queue",))
+        )
+        self.mongo_pool = MongoPoolListener(mongo_pool_gauge)
+        redis_pool = RedisPoolCollector(redis, redis_pool_gauge)
+        queue = QueueLengthCollector(redis, queue_name, queue_gauge)
+        self.registry.add_collector(self.mongo_pool.collect, mongo_pool_gauge)
+        self.registry.add_collector(redis_pool.collect, redis_pool_gauge)
+        self.registry.add_collector(queue.collect, queue_gauge)
@@ -0,0 +1,121 @@
+"""
+Состояние пулов соединений к Mongo и Redis и длина очереди taskiq.
+"""
+
+import threading
+from collections import Counter
+
+from pymongo.monitoring import (
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+    ConnectionReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+    PoolReadyEvent,
+)
+from redis.asyncio import Redis
+
+from app.infra.metrics.registry import Gauge
+
+type Address = tuple[str, int | None]
+
+
+class MongoPoolListener(ConnectionPoolListener):
+    """
+    Считает соединения пулов pymongo по адресам серверов. Motor вызывает
+    слушателя из своих потоков, поэтому счетчики под блокировкой, а в
+    gauge они попадают только при выгрузке (collect).
+    """
+
+    def __init__(self, gauge: Gauge) -> None:
+        self._gauge = gauge
+        self._lock = threading.Lock()
+        self._open: Counter[Address] = Counter()
+        self._in_use: Counter[Address] = Counter()
+
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._open[event.address] += 1
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._open[event.address] -= 1
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self._in_use[event.address] += 1
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._in_use[event.address] -= 1
+
+    def pool_created(self, event: PoolCreatedEvent) -> None: ...
+
+    def pool_ready(self, event: PoolReadyEvent) -> None: ...
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None: ...
+
+    def pool_closed(self, event: PoolClosedEvent) -> None: ...
+
+    def connection_ready(self, event: ConnectionReadyEvent) -> None: ...
+
+    def connection_check_out_started(
+        self, event: ConnectionCheckOutStartedEvent
+    ) -> None: ...
+
+    def connection_check_out_failed(
+        self, event: ConnectionCheckOutFailedEvent
+    ) -> None: ...
+
+    async def collect(self) -> None:
+        with self._lock:
+            snapshot = [
+                (address, self._in_use[address], opened)
+                for address, opened in self._open.items()
+            ]
+        for (host, port), in_use, opened in snapshot:
+            address = f"{host}:{port}" if port is not None else host
+            self._gauge.set(in_use, address, "in_use")
+            self._gauge.set(max(opened - in_use, 0), address, "available")
+
+
+class RedisPoolCollector:
+    """
+    Публичного счетчика соединений у пула redis-py нет: занятые и
+    свободные читаются из его внутренних списков, если они есть в
+    установленной версии, иначе выгружается только лимит пула.
+    """
+
+    def __init__(self, redis: Redis, gauge: Gauge) -> None:
+        self._redis = redis
+        self._gauge = gauge
+
+    async def collect(self) -> None:
+        pool = self._redis.connection_pool
+        self._gauge.set(pool.max_connections, "max")
+        for state, attr in (
+            ("in_use", "_in_use_connections"),
+            ("available", "_available_connections"),
+        ):
+            connections = getattr(pool, attr, None)
+            if connections is not None:
+                self._gauge.set(len(connections), state)
+
+
+class QueueLengthCollector:
+    """Длина списка ListQueueBroker: задачи, еще не взятые воркерами."""
+
+    def __init__(self, redis: Redis, queue_name: str, gauge: Gauge) -> None:
+        self._redis = redis
+        self._queue_name = queue_name
+        self._gauge = gauge
+
+    async def collect(self) -> None:
+        length = await self._redis.llen(self._queue_name)
+        self._gauge.set(length, self._queue_name)
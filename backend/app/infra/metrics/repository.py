@@ -0,0 +1,140 @@
+import time
+from collections.abc import AsyncIterator, Awaitable, Collection, Sequence
+from datetime import datetime
+from typing import Any
+
+from app.domain.entities.lecture import (
+    Lecture,
+    LectureStatus,
+    LectureSummary,
+    LectureVersion,
+    TagFilter,
+)
+from app.domain.entities.pagination import Page
+from app.domain.entities.search import SearchHit
+from app.domain.entities.value_objects import AuthorId, LectureId, Tag
+from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.infra.metrics.registry import Histogram
+from app.infra.repositories.decorator import LectureRepositoryDecorator
+
+
+class InstrumentedLectureRepository(LectureRepositoryDecorator):
+    """
+    Декоратор репозитория: длительность каждого вызова в гистограмму
+    с метками method и outcome (ok/error).
+    """
+
+    def __init__(self, inner: ILectureRepository, histogram: Histogram) -> None:
+        super().__init__(inner)
+        self._histogram = histogram
+
+    async def _timed[T](self, method: str, call: Awaitable[T]) -> T:
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await call
+            outcome = "ok"
+            return result
+        finally:
+            self._histogram.observe(time.perf_counter() - started, method, outcome)
+
+    async def add(self, lecture: Lecture) -> LectureId:
+        return await self._timed("add", self._inner.add(lecture))
+
+    async def add_many(self, lectures: Sequence[Lecture]) -> list[LectureId | None]:
+        return await self._timed("add_many", self._inner.add_many(lectures))
+
+    async def save(self, lecture: Lecture) -> None:
+        await self._timed("save", self._inner.save(lecture))
+
+    async def transition_status(
+        self,
+        lecture_id: LectureId,
+        *,
+        from_statuses: Collection[LectureStatus],
+        to_status: LectureStatus,
+        at: datetime,
+        stale_before: datetime | None = None,
+        claim: str | None = None,
+        claimed_by: str | None = None,
+        **fields: Any,
+    ) -> LectureSummary | None:
+        return await self._timed(
+            "transition_status",
+            self._inner.transition_status(
+                lecture_id,
+                from_statuses=from_statuses,
+                to_status=to_status,
+                at=at,
+                stale_before=stale_before,
+                claim=claim,
+                claimed_by=claimed_by,
+                **fields,
+            ),
+        )
+
+    async def delete(self, lecture_id: LectureId) -> bool:
+        return await self._timed("delete", self._inner.delete(lecture_id))
+
+    async def find_by_id(self, lecture_id: LectureId) -> Lecture | None:
+        return await self._timed("find_by_id", self._inner.find_by_id(lecture_id))
+
+    async def find_all(
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        author_id: AuthorId | None = None,
+        tags: TagFilter | None = None,
+    ) -> list[Lecture]:
+        return await self._timed(
+            "find_all",
+            self._inner.find_all(
+                limit=limit, offset=offset, author_id=author_id, tags=tags
+            ),
+        )
+
+    async def find_page(self, **kwargs: Any) -> Page[Lecture]:
+        return await self._timed("find_page", self._inner.find_page(**kwargs))
+
+    async def find_summary_page(self, **kwargs: Any) -> Page[LectureSummary]:
+        return await self._timed(
+            "find_summary_page", self._inner.find_summary_page(**kwargs)
+        )
+
+    async def find_summary(self, lecture_id: LectureId) -> LectureSummary | None:
+        return await self._timed("find_summary", self._inner.find_summary(lecture_id))
+
+    async def find_version(self, lecture_id: LectureId) -> LectureVersion | None:
+        return await self._timed("find_version", self._inner.find_version(lecture_id))
+
+    async def find_version_page(self, **kwargs: Any) -> Page[LectureVersion]:
+        return await self._timed(
+            "find_version_page", self._inner.find_version_page(**kwargs)
+        )
+
+    async def search(self, query: str, **kwargs: Any) -> Page[SearchHit]:
+        return await self._timed("search", self._inner.search(query, **kwargs))
+
+    def export(self, **kwargs: Any) -> AsyncIterator[Lecture]:
+        # Аргументы проверяются при вызове, как и у вложенного репозитория
+        return self._timed_export(self._inner.export(**kwargs))
+
+    async def _timed_export(
+        self, lectures: AsyncIterator[Lecture]
+    ) -> AsyncIterator[Lecture]:
+        # Время всей выгрузки, включая ожидание клиента между батчами
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            async for lecture in lectures:
+                yield lecture
+            outcome = "ok"
+        finally:
+            self._histogram.observe(time.perf_counter() - started, "export", outcome)
+
+    async def count_tags(self) -> dict[Tag, int]:
+        return await self._timed("count_tags", self._inner.count_tags())
+
+    async def count(self, author_id: AuthorId | None = None) -> int:
+        return await self._timed("count", self._inner.count(author_id))
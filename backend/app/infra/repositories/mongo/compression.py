@@ -0,0 +1,209 @@
+"""
+Сжатие длинных транскриптов в документах лекций.
+
+Текст длиннее порога хранится в transcript.text_z (zlib от UTF-8) с версией
+формата в transcript.text_format. В transcript.text при этом остается
+поисковая копия — слова текста без повторов, — чтобы лекция не выпадала из
+текстового индекса. Фразовый поиск ("...") по такой копии не работает.
+Чтение отдает LazyTranscript, который распаковывает текст при первом
+обращении к text.
+
+Сжать уже сохраненные транскрипты (без --apply только подсчет):
+    python -m app.infra.repositories.mongo.compression [--apply]
+"""
+
+import argparse
+import asyncio
+import re
+import zlib
+from typing import Any
+
+from bson import Binary
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from app.common.constants import MONGO_EXPORT_BATCH_SIZE, MONGO_LECTURES_COLLECTION
+from app.common.settings import settings
+from app.domain.entities.value_objects import Transcript
+
+ZLIB_FORMAT = 1
+ZLIB_LEVEL = 6
+
+_WORD = re.compile(r"\w+")
+
+
+class LazyTranscript(Transcript):
+    """
+    Transcript, прочитанный в сжатом виде. Сравнивается и хешируется как
+    обычный Transcript с тем же текстом.
+    """
+
+    _blob: bytes | None
+    _text: str | None
+    _search_text: str | None
+
+    def __init__(
+        self,
+        blob: bytes,
+        language: str | None = None,
+        confidence: float | None = None,
+        search_text: str | None = None,
+    ) -> None:
+        object.__setattr__(self, "_blob", blob)
+        object.__setattr__(self, "_text", None)
+        object.__setattr__(self, "_search_text", search_text)
+        object.__setattr__(self, "language", language)
+        object.__setattr__(self, "confidence", confidence)
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            assert self._blob is not None
+            object.__setattr__(self, "_text", decompress_text(self._blob))
+        assert self._text is not None
+        return self._text
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._text is not None
+
+    @property
+    def blob(self) -> bytes | None:
+        return self._blob
+
+    @property
+    def search_text(self) -> str:
+        if self._search_text is None:
+            object.__setattr__(self, "_search_text", search_copy(self.text))
+        assert self._search_text is not None
+        return self._search_text
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Transcript):
+            return NotImplemented
+        return (self.text, self.language, self.confidence) == (
+            other.text,
+            other.language,
+            other.confidence,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.text, self.language, self.confidence))
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "compressed"
+        return f"LazyTranscript({state}, language={self.language!r})"
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), ZLIB_LEVEL)
+
+
+def decompress_text(blob: bytes) -> str:
+    return zlib.decompress(blob).decode("utf-8")
+
+
+def search_copy(text: str) -> str:
+    """Слова текста в нижнем регистре без повторов, в порядке появления."""
+    return " ".join(dict.fromkeys(_WORD.findall(text.lower())))
+
+
+def transcript_to_doc(transcript: Transcript | None) -> dict[str, Any] | None:
+    if transcript is None:
+        return None
+    doc: dict[str, Any] = {
+        "language": transcript.language,
+        "confidence": transcript.confidence,
+    }
+    # Нераспакованный транскрипт пишется как есть, без повторного сжатия
+    if isinstance(transcript, LazyTranscript) and not transcript.is_loaded:
+        doc["text"] = transcript.search_text
+        doc["text_z"] = Binary(transcript.blob or b"")
+        doc["text_format"] = ZLIB_FORMAT
+        return doc
+
+    threshold = settings.TRANSCRIPT_COMPRESS_MIN_BYTES
+    raw_size = len(transcript.text.encode("utf-8"))
+    if 0 < threshold <= raw_size:
+        doc["text"] = search_copy(transcript.text)
+        doc["text_z"] = Binary(compress_text(transcript.text))
+        doc["text_format"] = ZLIB_FORMAT
+    else:
+        doc["text"] = transcript.text
+    return doc
+
+
+def transcript_from_doc(doc: dict[str, Any] | None) -> Transcript | None:
+    if not doc:
+        return None
+    language, confidence = doc.get("language"), doc.get("confidence")
+    if "text_z" in doc:
+        text_format = doc.get("text_format")
+        if text_format != ZLIB_FORMAT:
+            raise ValueError(f"Unknown transcript format: {text_format}")
+        return LazyTranscript(
+            bytes(doc["text_z"]), language, confidence, search_text=doc.get("text")
+        )
+    return Transcript(text=doc["text"], language=language, confidence=confidence)
+
+
+async def compress_existing(
+    db: AsyncIOMotorDatabase[Any], *, apply: bool
+) -> tuple[int, int, int]:
+    """
+    Сжимает уже сохраненные тексты длиннее порога; поисковая копия пишется
+    тем же обновлением. Документ обновляется, только если его updated_at не
+    изменился с момента чтения.
+    Возвращает (документов, байт до, байт после).
+    """
+    threshold = settings.TRANSCRIPT_COMPRESS_MIN_BYTES
+    if threshold <= 0:
+        return 0, 0, 0
+
+    collection = db[MONGO_LECTURES_COLLECTION]
+    query = {
+        "transcript.text": {"$type": "string"},
+        "transcript.text_z": {"$exists": False},
+        "$expr": {"$gte": [{"$strLenBytes": "$transcript.text"}, threshold]},
+    }
+    cursor = collection.find(query, {"transcript.text": 1, "updated_at": 1}).batch_size(
+        MONGO_EXPORT_BATCH_SIZE
+    )
+
+    count = before = after = 0
+    async for doc in cursor:
+        text = doc["transcript"]["text"]
+        blob = compress_text(text)
+        count += 1
+        before += len(text.encode("utf-8"))
+        after += len(blob)
+        if apply:
+            await collection.update_one(
+                {"_id": doc["_id"], "updated_at": doc["updated_at"]},
+                {
+                    "$set": {
+                        "transcript.text": search_copy(text),
+                        "transcript.text_z": Binary(blob),
+                        "transcript.text_format": ZLIB_FORMAT,
+                    },
+                },
+            )
+    return count, before, after
+
+
+async def _main(apply: bool) -> None:
+    client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(str(settings.mongo_url))
+    try:
+        db = client[settings.MONGO_DB_NAME]
+        count, before, after = await compress_existing(db, apply=apply)
+    finally:
+        client.close()
+
+    action = "compressed" if apply else "to compress"
+    print(f"{count} transcripts {action}: {before} -> {after} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--apply", action="store_true", help="write changes")
+    args = parser.parse_args()
+    asyncio.run(_main(args.apply))
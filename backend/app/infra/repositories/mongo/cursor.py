@@ -0,0 +1,57 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+
+from app.domain.entities.value_objects import InvalidCursorError
+
+
+def _pack(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _unpack(token: str) -> dict[str, Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+    if not isinstance(payload, dict):
+        raise InvalidCursorError("Malformed pagination cursor")
+    return payload
+
+
+def _object_id(value: Any) -> ObjectId:
+    if not isinstance(value, str) or not ObjectId.is_valid(value):
+        raise InvalidCursorError("Malformed pagination cursor")
+    return ObjectId(value)
+
+
+def encode_cursor(registered_at: datetime, last_id: ObjectId) -> str:
+    return _pack({"r": registered_at.isoformat(), "i": str(last_id)})
+
+
+def decode_cursor(token: str) -> tuple[datetime, ObjectId]:
+    payload = _unpack(token)
+    try:
+        registered_at = datetime.fromisoformat(payload["r"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+    return registered_at, _object_id(payload.get("i"))
+
+
+def encode_score_cursor(score: float, last_id: ObjectId) -> str:
+    """Курсор поисковой выдачи: позиция в порядке (score desc, _id desc)."""
+    return _pack({"s": score, "i": str(last_id)})
+
+
+def decode_score_cursor(token: str) -> tuple[float, ObjectId]:
+    payload = _unpack(token)
+    score = payload.get("s")
+    if isinstance(score, bool) or not isinstance(score, int | float):
+        raise InvalidCursorError("Malformed pagination cursor")
+    return float(score), _object_id(payload.get("i"))
@@ -0,0 +1,213 @@
+"""
+Описание индексов MongoDB и проверка покрытия запросов репозиториев.
+"""
+
+import asyncio
+import logging
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
+
+logger = logging.getLogger(__name__)
+
+# Направление поля индекса: 1/-1 или тип индекса ("text")
+type IndexKeys = tuple[tuple[str, int | str], ...]
+type SortKeys = tuple[tuple[str, int], ...]
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    name: str
+    keys: IndexKeys
+    options: dict[str, Any] = field(default_factory=dict, hash=False)
+
+    def to_model(self) -> IndexModel:
+        return IndexModel(list(self.keys), name=self.name, **self.options)
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """Форма запроса: поля фильтра на равенство и порядок сортировки."""
+
+    name: str
+    equality: tuple[str, ...] = ()
+    sort: SortKeys = ()
+
+
+class Coverage(StrEnum):
+    FULL = "covered"
+    PARTIAL = "partial"
+    NONE = "not covered"
+
+
+@dataclass(frozen=True)
+class QueryCoverage:
+    collection: str
+    query: QueryShape
+    coverage: Coverage
+    index_name: str | None = None
+
+
+@dataclass(frozen=True)
+class IndexReport:
+    applied: dict[str, list[str]]
+    coverage: list[QueryCoverage]
+
+    @property
+    def uncovered(self) -> list[QueryCoverage]:
+        return [c for c in self.coverage if c.coverage != Coverage.FULL]
+
+
+ID_INDEX = IndexSpec(name="_id_", keys=(("_id", ASCENDING),))
+
+
+@dataclass(frozen=True)
+class CollectionIndexes:
+    indexes: tuple[IndexSpec, ...]
+    queries: tuple[QueryShape, ...] = ()
+
+
+type IndexRegistry = Mapping[str, CollectionIndexes]
+
+
+def _sort_matches(keys: IndexKeys, sort: SortKeys) -> bool:
+    if len(keys) < len(sort):
+        return False
+    head = keys[: len(sort)]
+    # Индекс читается в обе стороны, поэтому подходит и полностью обратный порядок
+    inverted = tuple((name, -direction) for name, direction in sort)
+    return head == sort or head == inverted
+
+
+def _rate(index: IndexSpec, query: QueryShape) -> Coverage:
+    keys = index.keys
+    matched = 0
+    while matched < len(keys) and keys[matched][0] in query.equality:
+        matched += 1
+
+    if matched == 0 and query.equality:
+        return Coverage.NONE
+
+    sort_ok = _sort_matches(keys[matched:], query.sort)
+    if matched == len(query.equality) and sort_ok:
+        return Coverage.FULL
+    if matched or sort_ok:
+        return Coverage.PARTIAL
+    return Coverage.NONE
+
+
+def check_coverage(collection: str, spec: CollectionIndexes) -> list[QueryCoverage]:
+    ranking = [Coverage.FULL, Coverage.PARTIAL, Coverage.NONE]
+    result = []
+    for query in spec.queries:
+        best = QueryCoverage(collection=collection, query=query, coverage=Coverage.NONE)
+        for index in (ID_INDEX, *spec.indexes):
+            coverage = _rate(index, query)
+            if ranking.index(coverage) < ranking.index(best.coverage):
+                best = QueryCoverage(
+                    collection=collection,
+                    query=query,
+                    coverage=coverage,
+                    index_name=index.name,
+                )
+        result.append(best)
+    return result
+
+
+def coverage_report(registry: IndexRegistry) -> list[QueryCoverage]:
+    return [
+        item
+        for collection, spec in registry.items()
+        for item in check_coverage(collection, spec)
+    ]
+
+
+async def ensure_indexes(
+    db: AsyncIOMotorDatabase[Any], registry: IndexRegistry
+) -> IndexReport:
+    """
+    Создает индексы из реестра. create_indexes идемпотентен для совпадающих
+    спецификаций, поэтому безопасно вызывать при каждом старте процесса.
+    """
+    applied: dict[str, list[str]] = {}
+    for collection, spec in registry.items():
+        if spec.indexes:
+            applied[collection] = await db[collection].create_indexes(
+                [index.to_model() for index in spec.indexes]
+            )
+
+    report = IndexReport(applied=applied, coverage=coverage_report(registry))
+    for item in report.uncovered:
+        # partial — осознанный компромисс (остаток фильтра в памяти), не ошибка
+        level = logging.WARNING if item.coverage == Coverage.NONE else logging.INFO
+        logger.log(
+            level,
+            "Query %s.%s is %s by indexes (best: %s)",
+            item.collection,
+            item.query.name,
+            item.coverage,
+            item.index_name,
+        )
+    return report
+
+
+class IndexState(StrEnum):
+    PENDING = "pending"
+    APPLIED = "applied"
+    FAILED = "failed"
+
+
+class IndexBootstrap:
+    """
+    Применяет индексы в фоне: недоступная Mongo или конфликт спецификаций
+    не мешают процессу стартовать. Ошибка пишется в лог, попытка
+    повторяется через retry_sec; состояние отдается в /health/ready.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase[Any],
+        registry: IndexRegistry,
+        *,
+        retry_sec: float,
+    ) -> None:
+        self._db = db
+        self._registry = registry
+        self._retry_sec = retry_sec
+        self._task: asyncio.Task[None] | None = None
+        self.report: IndexReport | None = None
+        self.error: str | None = None
+
+    @property
+    def state(self) -> IndexState:
+        if self.report is not None:
+            return IndexState.APPLIED
+        return IndexState.PENDING if self.error is None else IndexState.FAILED
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._apply_until_done())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _apply_until_done(self) -> None:
+        while True:
+            try:
+                self.report = await ensure_indexes(self._db, self._registry)
+                self.error = None
+                return
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"
+                logger.exception(
+                    "Index bootstrap failed, retrying in %ss", self._retry_sec
+                )
+            await asyncio.sleep(self._retry_sec)
@@ -1,18 +1,149 @@
+from collections.abc import AsyncIterator, Callable, Collection, Mapping, Sequence
+from datetime import datetime
 from typing import Any
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
 
-from app.common.constants import MONGO_LECTURES_COLLECTION
-from app.domain.entities.lecture import Lecture, LectureStatus
+from app.common.constants import (
+    DEFAULT_LIMIT,
+    MONGO_EXPORT_BATCH_SIZE,
+    MONGO_LECTURES_COLLECTION,
+)
+from app.domain.entities.lecture import (
+    Lecture,
+    LectureStatus,
+    LectureSummary,
+    LectureVersion,
+    TagFilter,
+)
+from app.domain.entities.pagination import Page
+from app.domain.entities.search import SearchHit, Snippet
 from app.domain.entities.value_objects import (
     AuthorId,
+    InvalidCursorError,
     LectureId,
     Tag,
     Title,
-    Transcript,
 )
 from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.infra.repositories.mongo.compression import (
+    decompress_text,
+    transcript_from_doc,
+    transcript_to_doc,
+)
+from app.infra.repositories.mongo.cursor import (
+    decode_cursor,
+    encode_cursor,
+    encode_score_cursor,
+)
+from app.infra.repositories.mongo.indexes import (
+    CollectionIndexes,
+    IndexSpec,
+    QueryShape,
+)
+from app.infra.repositories.mongo.search import (
+    TEXT_INDEX,
+    build_snippet,
+    highlight_pattern,
+    search_pipeline,
+    search_terms,
+    snippet_from_text,
+)
+
+# Порядок keyset-пагинации: от новых к старым, _id разрешает равные registered_at
+PAGE_SORT = [("registered_at", DESCENDING), ("_id", DESCENDING)]
+_PAGE_KEYS = tuple(PAGE_SORT)
+
+# Списки не тянут текст транскрипта: он может занимать мегабайты
+SUMMARY_PROJECTION: dict[str, Any] = {"transcript.text": 0, "transcript.text_z": 0}
+# registered_at нужен для курсора следующей страницы
+VERSION_PROJECTION: dict[str, Any] = {"updated_at": 1, "registered_at": 1}
+# Токен обработчика, захватившего лекцию (transition_status claim/claimed_by)
+CLAIM_FIELD = "claim"
+
+# Индексы коллекции и формы запросов репозитория, которые они должны покрывать.
+# При добавлении нового запроса сюда же добавляется его QueryShape.
+LECTURE_INDEXES = CollectionIndexes(
+    indexes=(
+        IndexSpec(name="registered_at_id", keys=_PAGE_KEYS),
+        IndexSpec(
+            name="author_id_registered_at_id",
+            keys=(("author_id", ASCENDING), *_PAGE_KEYS),
+        ),
+        IndexSpec(
+            name="status_registered_at_id",
+            keys=(("status", ASCENDING), *_PAGE_KEYS),
+        ),
+        IndexSpec(
+            name="status_updated_at",
+            keys=(("status", ASCENDING), ("updated_at", DESCENDING)),
+        ),
+        TEXT_INDEX,
+        IndexSpec(
+            name="tags_registered_at_id", keys=(("tags", ASCENDING), *_PAGE_KEYS)
+        ),
+    ),
+    queries=(
+        QueryShape(name="find_by_id", equality=("_id",)),
+        QueryShape(name="find_all[author_id]", equality=("author_id",)),
+        QueryShape(name="find_all[tags]", equality=("tags",)),
+        QueryShape(name="count[author_id]", equality=("author_id",)),
+        QueryShape(name="find_page", sort=_PAGE_KEYS),
+        QueryShape(
+            name="find_page[author_id]", equality=("author_id",), sort=_PAGE_KEYS
+        ),
+        QueryShape(name="find_page[status]", equality=("status",), sort=_PAGE_KEYS),
+        QueryShape(name="find_page[tags]", equality=("tags",), sort=_PAGE_KEYS),
+        QueryShape(
+            name="find_page[author_id,status]",
+            equality=("author_id", "status"),
+            sort=_PAGE_KEYS,
+        ),
+        QueryShape(name="export", sort=(("_id", ASCENDING),)),
+        QueryShape(
+            name="export[author_id]",
+            equality=("author_id",),
+            sort=(("_id", ASCENDING),),
+        ),
+    ),
+)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Как поле сущности хранится в документе: (ключ документа, кодировщик).
+# Порядок задает порядок полей во вставляемом документе.
+_FIELD_CODECS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "title": ("title", lambda title: title.value),
+    "author_id": ("author_id", lambda author_id: author_id.value),
+    "status": ("status", str),
+    "tags": ("tags", lambda tags: [tag.value for tag in tags]),
+    "content": ("transcript", transcript_to_doc),
+    "registered_at": ("registered_at", _identity),
+    "updated_at": ("updated_at", _identity),
+    "published_at": ("published_at", _identity),
+}
+
+
+def encode_fields(values: Mapping[str, Any]) -> dict[str, Any]:
+    doc = {}
+    for name, value in values.items():
+        if name not in _FIELD_CODECS:
+            raise ValueError(f"Unknown lecture field: {name}")
+        key, encode = _FIELD_CODECS[name]
+        doc[key] = encode(value)
+    return doc
+
+
+def dirty_delta(lecture: Lecture) -> dict[str, Any]:
+    return encode_fields(
+        {name: getattr(lecture, name) for name in lecture.dirty_fields}
+    )
 
 
 class MongoLectureRepository(ILectureRepository):
@@ -23,14 +154,84 @@ class MongoLectureRepository(ILectureRepository):
     async def add(self, lecture: Lecture) -> LectureId:
         doc = self._entity_to_doc(lecture)
         result = await self._collection.insert_one(doc)
+        lecture.mark_clean()
         return LectureId(str(result.inserted_id))
 
+    async def add_many(self, lectures: Sequence[Lecture]) -> list[LectureId | None]:
+        if not lectures:
+            return []
+
+        # _id назначаем сами, чтобы сопоставить ошибки вставки с входом
+        docs = [{"_id": ObjectId(), **self._entity_to_doc(x)} for x in lectures]
+        failed: set[int] = set()
+        try:
+            await self._collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+
+        for lecture in lectures:
+            lecture.mark_clean()
+
+        return [
+            None if index in failed else LectureId(str(doc["_id"]))
+            for index, doc in enumerate(docs)
+        ]
+
     async def save(self, lecture: Lecture) -> None:
         if not lecture.id or not ObjectId.is_valid(lecture.id.value):
             raise ValueError("Entity must have a valid ID to be saved")
 
-        doc = self._entity_to_doc(lecture)
-        await self._collection.replace_one({"_id": ObjectId(lecture.id.value)}, doc)
+        changed = lecture.dirty_fields
+        if not changed:
+            return
+
+        # Пишем только измененные поля: смена статуса не переписывает транскрипт
+        await self._collection.update_one(
+            {"_id": ObjectId(lecture.id.value)}, {"$set": dirty_delta(lecture)}
+        )
+        lecture.mark_clean()
+
+    async def transition_status(
+        self,
+        lecture_id: LectureId,
+        *,
+        from_statuses: Collection[LectureStatus],
+        to_status: LectureStatus,
+        at: datetime,
+        stale_before: datetime | None = None,
+        claim: str | None = None,
+        claimed_by: str | None = None,
+        **fields: Any,
+    ) -> LectureSummary | None:
+        if not ObjectId.is_valid(lecture_id.value):
+            return None
+
+        changes = encode_fields({**fields, "status": to_status, "updated_at": at})
+        if claim is not None:
+            # Служебное поле документа, в Lecture не отображается
+            changes[CLAIM_FIELD] = claim
+        query: dict[str, Any] = {
+            "_id": ObjectId(lecture_id.value),
+            "status": {"$in": [str(status) for status in from_statuses]},
+        }
+        if stale_before is not None:
+            # Переход, начатый давно и так и не завершенный, считается брошенным
+            query = {
+                "_id": query["_id"],
+                "$or": [
+                    {"status": query["status"]},
+                    {"status": str(to_status), "updated_at": {"$lt": stale_before}},
+                ],
+            }
+        if claimed_by is not None:
+            query[CLAIM_FIELD] = claimed_by
+        doc = await self._collection.find_one_and_update(
+            query,
+            {"$set": changes},
+            projection=SUMMARY_PROJECTION,
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._map_to_summary(doc) if doc else None
 
     async def delete(self, lecture_id: LectureId) -> bool:
         if not ObjectId.is_valid(lecture_id.value):
@@ -47,54 +248,255 @@ class MongoLectureRepository(ILectureRepository):
         return self._map_to_entity(doc) if doc else None
 
     async def find_all(
-        self, *, limit: int = 10, offset: int = 0, author_id: AuthorId | None = None
+        self,
+        *,
+        limit: int = 10,
+        offset: int = 0,
+        author_id: AuthorId | None = None,
+        tags: TagFilter | None = None,
     ) -> list[Lecture]:
-        query = {"author_id": author_id.value} if author_id else {}
+        query = self._filter_query(author_id=author_id, tags=tags)
         cursor = self._collection.find(query).skip(offset).limit(limit)
         return [self._map_to_entity(doc) async for doc in cursor]
 
+    async def find_page(
+        self,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        cursor: str | None = None,
+        author_id: AuthorId | None = None,
+        status: LectureStatus | None = None,
+        tags: TagFilter | None = None,
+    ) -> Page[Lecture]:
+        docs, next_cursor = await self._fetch_page(
+            limit=limit, cursor=cursor, author_id=author_id, status=status, tags=tags
+        )
+        return Page(
+            items=[self._map_to_entity(doc) for doc in docs], next_cursor=next_cursor
+        )
+
+    async def find_summary_page(
+        self,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        cursor: str | None = None,
+        author_id: AuthorId | None = None,
+        status: LectureStatus | None = None,
+        tags: TagFilter | None = None,
+    ) -> Page[LectureSummary]:
+        docs, next_cursor = await self._fetch_page(
+            limit=limit,
+            cursor=cursor,
+            author_id=author_id,
+            status=status,
+            tags=tags,
+            projection=SUMMARY_PROJECTION,
+        )
+        return Page(
+            items=[self._map_to_summary(doc) for doc in docs], next_cursor=next_cursor
+        )
+
+    async def find_summary(self, lecture_id: LectureId) -> LectureSummary | None:
+        if not ObjectId.is_valid(lecture_id.value):
+            return None
+
+        doc = await self._collection.find_one(
+            {"_id": ObjectId(lecture_id.value)}, SUMMARY_PROJECTION
+        )
+        return self._map_to_summary(doc) if doc else None
+
+    async def find_version(self, lecture_id: LectureId) -> LectureVersion | None:
+        if not ObjectId.is_valid(lecture_id.value):
+            return None
+
+        doc = await self._collection.find_one(
+            {"_id": ObjectId(lecture_id.value)}, VERSION_PROJECTION
+        )
+        return self._map_to_version(doc) if doc else None
+
+    async def find_version_page(
+        self,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        cursor: str | None = None,
+        author_id: AuthorId | None = None,
+        status: LectureStatus | None = None,
+        tags: TagFilter | None = None,
+    ) -> Page[LectureVersion]:
+        docs, next_cursor = await self._fetch_page(
+            limit=limit,
+            cursor=cursor,
+            author_id=author_id,
+            status=status,
+            tags=tags,
+            projection=VERSION_PROJECTION,
+        )
+        return Page(
+            items=[self._map_to_version(doc) for doc in docs], next_cursor=next_cursor
+        )
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        cursor: str | None = None,
+        author_id: AuthorId | None = None,
+    ) -> Page[SearchHit]:
+        pattern = highlight_pattern(search_terms(query))
+        pipeline = search_pipeline(
+            query,
+            limit=limit,
+            cursor=cursor,
+            match=self._filter_query(author_id=author_id),
+            pattern=pattern,
+            projection=SUMMARY_PROJECTION,
+        )
+        docs = await self._collection.aggregate(pipeline).to_list(length=limit + 1)
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = encode_score_cursor(docs[-1]["_score"], docs[-1]["_id"])
+        hits = [
+            SearchHit(
+                lecture=self._map_to_summary(doc),
+                score=doc["_score"],
+                snippet=self._hit_snippet(doc, pattern),
+            )
+            for doc in docs
+        ]
+        return Page(items=hits, next_cursor=next_cursor)
+
+    def export(
+        self,
+        *,
+        author_id: AuthorId | None = None,
+        registered_from: datetime | None = None,
+        registered_to: datetime | None = None,
+        resume_after: LectureId | None = None,
+    ) -> AsyncIterator[Lecture]:
+        query = self._filter_query(author_id=author_id)
+
+        registered: dict[str, datetime] = {}
+        if registered_from:
+            registered["$gte"] = registered_from
+        if registered_to:
+            registered["$lt"] = registered_to
+        if registered:
+            query["registered_at"] = registered
+
+        if resume_after:
+            if not ObjectId.is_valid(resume_after.value):
+                raise InvalidCursorError("Malformed export resume token")
+            query["_id"] = {"$gt": ObjectId(resume_after.value)}
+
+        return self._iter_entities(query)
+
+    async def count_tags(self) -> dict[Tag, int]:
+        pipeline: list[dict[str, Any]] = [
+            {"$project": {"_id": 0, "tags": 1}},
+            {"$unwind": "$tags"},
+            {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+        ]
+        cursor = self._collection.aggregate(pipeline)
+        return {Tag(doc["_id"]): doc["count"] async for doc in cursor}
+
     async def count(self, author_id: AuthorId | None = None) -> int:
         query = {"author_id": author_id.value} if author_id else {}
         return await self._collection.count_documents(query)
 
     # Helpers
 
+    async def _fetch_page(
+        self,
+        *,
+        limit: int,
+        cursor: str | None,
+        author_id: AuthorId | None,
+        status: LectureStatus | None,
+        tags: TagFilter | None,
+        projection: dict[str, Any] | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        query = self._filter_query(author_id=author_id, status=status, tags=tags)
+        if cursor:
+            registered_at, last_id = decode_cursor(cursor)
+            query["$or"] = [
+                {"registered_at": {"$lt": registered_at}},
+                {"registered_at": registered_at, "_id": {"$lt": last_id}},
+            ]
+
+        # Берем на один документ больше, чтобы узнать, есть ли следующая страница
+        docs = await (
+            self._collection.find(query, projection).sort(PAGE_SORT).limit(limit + 1)
+        ).to_list(length=limit + 1)
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            last = docs[-1]
+            next_cursor = encode_cursor(last["registered_at"], last["_id"])
+        return docs, next_cursor
+
+    async def _iter_entities(self, query: dict[str, Any]) -> AsyncIterator[Lecture]:
+        cursor = (
+            self._collection.find(query)
+            .sort("_id", ASCENDING)
+            .batch_size(MONGO_EXPORT_BATCH_SIZE)
+        )
+        async for doc in cursor:
+            yield self._map_to_entity(doc)
+
+    def _filter_query(
+        self,
+        *,
+        author_id: AuthorId | None = None,
+        status: LectureStatus | None = None,
+        tags: TagFilter | None = None,
+    ) -> dict[str, Any]:
+        query: dict[str, Any] = {}
+        if author_id:
+            query["author_id"] = author_id.value
+        if status:
+            query["status"] = str(status)
+        if tags and tags.tags:
+            operator = "$all" if tags.match_all else "$in"
+            query["tags"] = {operator: sorted(tag.value for tag in tags.tags)}
+        return query
+
     def _entity_to_doc(self, lecture: Lecture) -> dict[str, Any]:
-        return {
-            "title": lecture.title.value,
-            "author_id": lecture.author_id.value,
-            "status": str(lecture.status),
-            "tags": [tag.value for tag in lecture.tags],
-            "transcript": {
-                "text": lecture.content.text,
-                "language": lecture.content.language,
-                "confidence": lecture.content.confidence,
-            }
-            if lecture.content
-            else None,
-            "registered_at": lecture.registered_at,
-            "updated_at": lecture.updated_at,
-            "published_at": lecture.published_at,
-        }
+        return encode_fields({name: getattr(lecture, name) for name in _FIELD_CODECS})
 
-    def _map_to_entity(self, doc: dict[str, Any]) -> Lecture:
-        transcript_data = doc.get("transcript")
+    def _map_to_version(self, doc: dict[str, Any]) -> LectureVersion:
+        return LectureVersion(
+            id=LectureId(str(doc["_id"])), updated_at=doc["updated_at"]
+        )
 
-        transcript = (
-            Transcript(
-                text=transcript_data["text"],
-                language=transcript_data.get("language"),
-                confidence=transcript_data.get("confidence"),
-            )
-            if transcript_data
-            else None
+    def _hit_snippet(self, doc: dict[str, Any], pattern: str | None) -> Snippet | None:
+        if "_text_z" in doc:
+            # Распаковываются только транскрипты лекций текущей страницы
+            return snippet_from_text(decompress_text(bytes(doc["_text_z"])), pattern)
+        return build_snippet(doc.get("_snippet"), pattern)
+
+    def _map_to_summary(self, doc: dict[str, Any]) -> LectureSummary:
+        return LectureSummary(
+            id=LectureId(str(doc["_id"])),
+            author_id=AuthorId(doc["author_id"]),
+            title=Title(doc["title"]),
+            tags=frozenset(Tag(t) for t in doc.get("tags", [])),
+            status=LectureStatus(doc["status"]),
+            has_content=doc.get("transcript") is not None,
+            registered_at=doc["registered_at"],
+            updated_at=doc["updated_at"],
+            published_at=doc.get("published_at"),
         )
 
+    def _map_to_entity(self, doc: dict[str, Any]) -> Lecture:
         return Lecture(
             id=LectureId(str(doc["_id"])),
             author_id=AuthorId(doc["author_id"]),
             title=Title(doc["title"]),
-            content=transcript,
+            content=transcript_from_doc(doc.get("transcript")),
             tags=frozenset(Tag(t) for t in doc.get("tags", [])),
             status=LectureStatus(doc["status"]),
             registered_at=doc["registered_at"],
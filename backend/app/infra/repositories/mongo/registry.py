@@ -0,0 +1,73 @@
+"""
+Реестр индексов всех Mongo-коллекций приложения.
+
+Отчет о покрытии запросов (без подключения к БД):
+    python -m app.infra.repositories.mongo.registry
+Применить индексы к базе из настроек:
+    python -m app.infra.repositories.mongo.registry --apply
+"""
+
+import argparse
+import asyncio
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from app.common.constants import MONGO_LECTURES_COLLECTION, MONGO_SEGMENTS_COLLECTION
+from app.common.settings import settings
+from app.infra.repositories.mongo.indexes import (
+    Coverage,
+    IndexRegistry,
+    IndexReport,
+    QueryCoverage,
+    coverage_report,
+    ensure_indexes,
+)
+from app.infra.repositories.mongo.lecture import LECTURE_INDEXES
+from app.infra.repositories.mongo.segment import SEGMENT_INDEXES
+
+MONGO_INDEXES: IndexRegistry = {
+    MONGO_LECTURES_COLLECTION: LECTURE_INDEXES,
+    MONGO_SEGMENTS_COLLECTION: SEGMENT_INDEXES,
+}
+
+
+async def bootstrap_indexes(db: AsyncIOMotorDatabase[Any]) -> IndexReport:
+    return await ensure_indexes(db, MONGO_INDEXES)
+
+
+def format_report(items: list[QueryCoverage]) -> str:
+    return "\n".join(
+        f"{item.coverage:<12} {item.collection}.{item.query.name:<32} "
+        f"{item.index_name or '-'}"
+        for item in items
+    )
+
+
+async def _apply() -> IndexReport:
+    client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(str(settings.mongo_url))
+    try:
+        return await bootstrap_indexes(client[settings.MONGO_DB_NAME])
+    finally:
+        client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MongoDB index registry")
+    parser.add_argument("--apply", action="store_true", help="create indexes")
+    args = parser.parse_args()
+
+    if args.apply:
+        report = asyncio.run(_apply())
+        for collection, names in report.applied.items():
+            print(f"{collection}: {', '.join(names)}")
+
+    items = coverage_report(MONGO_INDEXES)
+    print(format_report(items))
+    # partial — индекс используется, но часть фильтра или сортировки идет в памяти
+    if any(item.coverage == Coverage.NONE for item in items):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Полнотекстовый поиск по лекциям: текстовый индекс и агрегация выдачи.
+"""
+
+import re
+from typing import Any
+
+from app.domain.entities.search import Snippet
+from app.infra.repositories.mongo.cursor import decode_score_cursor
+from app.infra.repositories.mongo.indexes import IndexSpec
+
+# Символов транскрипта по обе стороны от первого совпадения
+SNIPPET_RADIUS = 80
+
+# Поле language_override указывает на несуществующее поле: иначе MongoDB
+# брала бы язык из transcript.language, а неизвестный ей код (например,
+# "en-US") делал бы вставку документа ошибкой
+TEXT_INDEX = IndexSpec(
+    name="title_transcript_text",
+    keys=(("title", "text"), ("transcript.text", "text")),
+    options={
+        "weights": {"title": 10, "transcript.text": 1},
+        "default_language": "russian",
+        "language_override": "search_language",
+    },
+)
+
+_WORD = re.compile(r"(-?)(\w+)")
+_MIN_TERM_LENGTH = 2
+
+
+def search_terms(query: str) -> list[str]:
+    """Слова запроса без исключенных через минус, в нижнем регистре."""
+    terms: list[str] = []
+    for negated, word in _WORD.findall(query):
+        term = word.lower()
+        if not negated and len(term) >= _MIN_TERM_LENGTH and term not in terms:
+            terms.append(term)
+    return terms
+
+
+def _stem(term: str) -> str:
+    # Грубое приближение стемминга индекса: срезаем окончание, чтобы
+    # "лекция" подсвечивалась и в "лекции", и в "лекциями"
+    if len(term) > 5:
+        return term[:-2]
+    if len(term) > 3:
+        return term[:-1]
+    return term
+
+
+def highlight_pattern(terms: list[str]) -> str | None:
+    if not terms:
+        return None
+    stems = sorted({_stem(term) for term in terms}, key=len, reverse=True)
+    return "|".join(re.escape(stem) for stem in stems)
+
+
+def search_pipeline(
+    query: str,
+    *,
+    limit: int,
+    cursor: str | None,
+    match: dict[str, Any],
+    pattern: str | None,
+    projection: dict[str, Any],
+) -> list[dict[str, Any]]:
+    stages: list[dict[str, Any]] = [
+        {"$match": {"$text": {"$search": query}, **match}},
+        {"$addFields": {"_score": {"$meta": "textScore"}}},
+    ]
+    if cursor:
+        score, last_id = decode_score_cursor(cursor)
+        stages.append(
+            {
+                "$match": {
+                    "$or": [
+                        {"_score": {"$lt": score}},
+                        {"_score": score, "_id": {"$lt": last_id}},
+                    ]
+                }
+            }
+        )
+    # Берем на один документ больше, чтобы узнать, есть ли следующая страница
+    stages += [
+        {"$sort": {"_score": -1, "_id": -1}},
+        {"$limit": limit + 1},
+    ]
+    if pattern:
+        # Фрагмент вырезается на сервере: полный текст транскрипта
+        # в приложение не передается. У сжатого транскрипта в text лежит
+        # только поисковая копия, поэтому для него отдается text_z, и
+        # фрагмент строится в приложении (snippet_from_text)
+        stages.append(
+            {
+                "$addFields": {
+                    "_snippet": _snippet_expr(pattern),
+                    "_text_z": "$transcript.text_z",
+                }
+            }
+        )
+    stages.append({"$project": projection})
+    return stages
+
+
+def _snippet_expr(pattern: str) -> dict[str, Any]:
+    text = {
+        "$cond": [
+            {"$eq": [{"$type": "$transcript.text_z"}, "missing"]},
+            {"$ifNull": ["$transcript.text", ""]},
+            "",
+        ]
+    }
+    return {
+        "$let": {
+            "vars": {
+                "found": {
+                    "$regexFind": {"input": text, "regex": pattern, "options": "i"}
+                }
+            },
+            "in": {
+                "$cond": [
+                    {"$eq": ["$$found", None]},
+                    None,
+                    {
+                        "$let": {
+                            "vars": {
+                                "start": {
+                                    "$max": [
+                                        0,
+                                        {"$subtract": ["$$found.idx", SNIPPET_RADIUS]},
+                                    ]
+                                }
+                            },
+                            "in": {
+                                "offset": "$$start",
+                                "text": {
+                                    "$substrCP": [text, "$$start", 2 * SNIPPET_RADIUS]
+                                },
+                            },
+                        }
+                    },
+                ]
+            },
+        }
+    }
+
+
+def build_snippet(raw: dict[str, Any] | None, pattern: str | None) -> Snippet | None:
+    if not raw or not pattern:
+        return None
+    text = raw["text"]
+    highlights = tuple(
+        (m.start(), m.end()) for m in re.finditer(pattern, text, re.IGNORECASE)
+    )
+    return Snippet(text=text, offset=raw["offset"], highlights=highlights)
+
+
+def snippet_from_text(text: str, pattern: str | None) -> Snippet | None:
+    """То же, что _snippet_expr на сервере, для уже распакованного текста."""
+    if not pattern:
+        return None
+    found = re.search(pattern, text, re.IGNORECASE)
+    if found is None:
+        return None
+    start = max(0, found.start() - SNIPPET_RADIUS)
+    raw = {"text": text[start : start + 2 * SNIPPET_RADIUS], "offset": start}
+    return build_snippet(raw, pattern)
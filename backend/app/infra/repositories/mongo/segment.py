@@ -0,0 +1,124 @@
+from collections.abc import Sequence
+from itertools import groupby
+from typing import Any
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING
+
+from app.common.constants import (
+    MONGO_SEGMENTS_COLLECTION,
+    SEGMENT_BUCKET_SEC,
+    SEGMENT_MAX_SEC,
+)
+from app.domain.entities.value_objects import LectureId, TranscriptSegment
+from app.domain.interfaces.segment_repo import ISegmentRepository
+from app.infra.repositories.mongo.indexes import (
+    CollectionIndexes,
+    IndexSpec,
+    QueryShape,
+)
+
+_BUCKET_KEYS = (("lecture_id", ASCENDING), ("start_offset", ASCENDING))
+
+# Сегменты лежат пачками по SEGMENT_BUCKET_SEC секунд записи: документ
+# {lecture_id, start_offset, end_offset, segments: [...]}. Сегмент попадает
+# в пачку по своему началу; end_offset — самый поздний конец в пачке, так
+# что длинный сегмент находится и из соседнего интервала. Сегменты не
+# длиннее SEGMENT_MAX_SEC, поэтому end_offset - start_offset не превышает
+# MAX_BUCKET_SPAN и поиск по времени ограничен снизу.
+MAX_BUCKET_SPAN = SEGMENT_BUCKET_SEC + SEGMENT_MAX_SEC
+
+SEGMENT_INDEXES = CollectionIndexes(
+    indexes=(IndexSpec(name="lecture_id_start_offset", keys=_BUCKET_KEYS),),
+    queries=(
+        QueryShape(
+            name="find_range",
+            equality=("lecture_id",),
+            sort=(("start_offset", ASCENDING),),
+        ),
+        QueryShape(name="delete", equality=("lecture_id",)),
+    ),
+)
+
+
+def _bucket_start(segment: TranscriptSegment) -> int:
+    return int(segment.start // SEGMENT_BUCKET_SEC) * SEGMENT_BUCKET_SEC
+
+
+class MongoSegmentRepository(ISegmentRepository):
+    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+        self._collection = db[MONGO_SEGMENTS_COLLECTION]
+
+    async def replace(
+        self, lecture_id: LectureId, segments: Sequence[TranscriptSegment]
+    ) -> None:
+        for segment in segments:
+            if segment.end - segment.start > SEGMENT_MAX_SEC:
+                raise ValueError(
+                    f"Segment at {segment.start}s is longer than {SEGMENT_MAX_SEC}s"
+                )
+
+        object_id = ObjectId(lecture_id.value)
+        ordered = sorted(segments, key=lambda s: s.start)
+        docs = []
+        for start, group in groupby(ordered, key=_bucket_start):
+            bucket = list(group)
+            docs.append(
+                {
+                    "lecture_id": object_id,
+                    "start_offset": start,
+                    "end_offset": max(s.end for s in bucket),
+                    "segments": [self._segment_to_doc(s) for s in bucket],
+                }
+            )
+
+        await self._collection.delete_many({"lecture_id": object_id})
+        if docs:
+            await self._collection.insert_many(docs)
+
+    async def find_range(
+        self, lecture_id: LectureId, start: float, end: float
+    ) -> list[TranscriptSegment]:
+        if not ObjectId.is_valid(lecture_id.value):
+            return []
+
+        query = {
+            "lecture_id": ObjectId(lecture_id.value),
+            # Пачки, начатые раньше start - MAX_BUCKET_SPAN, закончились до
+            # start: без нижней границы индекс прошел бы все пачки до end
+            "start_offset": {"$gt": start - MAX_BUCKET_SPAN, "$lt": end},
+            "end_offset": {"$gt": start},
+        }
+        cursor = self._collection.find(query, {"segments": 1}).sort(
+            "start_offset", ASCENDING
+        )
+        result = []
+        async for doc in cursor:
+            for raw in doc["segments"]:
+                segment = self._map_to_segment(raw)
+                if segment.overlaps(start, end):
+                    result.append(segment)
+        return result
+
+    async def delete(self, lecture_id: LectureId) -> None:
+        if ObjectId.is_valid(lecture_id.value):
+            await self._collection.delete_many(
+                {"lecture_id": ObjectId(lecture_id.value)}
+            )
+
+    def _segment_to_doc(self, segment: TranscriptSegment) -> dict[str, Any]:
+        return {
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+            "confidence": segment.confidence,
+        }
+
+    def _map_to_segment(self, doc: dict[str, Any]) -> TranscriptSegment:
+        return TranscriptSegment(
+            start=doc["start"],
+            end=doc["end"],
+            text=doc["text"],
+            confidence=doc.get("confidence"),
+        )
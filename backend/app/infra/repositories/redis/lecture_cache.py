@@ -0,0 +1,206 @@
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable, Collection
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.entities.lecture import Lecture, LectureStatus, LectureSummary
+from app.domain.entities.value_objects import (
+    AuthorId,
+    LectureId,
+    Tag,
+    Title,
+    Transcript,
+)
+from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.infra.repositories.decorator import LectureRepositoryDecorator
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "lecture:"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Промахи, которые дождались уже идущего чтения вместо своего похода в Mongo
+    coalesced: int = 0
+    invalidations: int = 0
+    errors: int = 0
+
+
+def dump_lecture(lecture: Lecture) -> str:
+    return json.dumps(
+        {
+            "id": lecture.id.value if lecture.id else None,
+            "author_id": lecture.author_id.value,
+            "title": lecture.title.value,
+            "tags": [tag.value for tag in lecture.tags],
+            "status": str(lecture.status),
+            "content": {
+                "text": lecture.content.text,
+                "language": lecture.content.language,
+                "confidence": lecture.content.confidence,
+            }
+            if lecture.content
+            else None,
+            "registered_at": lecture.registered_at.isoformat(),
+            "updated_at": lecture.updated_at.isoformat(),
+            "published_at": lecture.published_at.isoformat()
+            if lecture.published_at
+            else None,
+        },
+        ensure_ascii=False,
+    )
+
+
+def load_lecture(raw: str | bytes) -> Lecture:
+    data = json.loads(raw)
+    content = data["content"]
+    return Lecture(
+        id=LectureId(data["id"]),
+        author_id=AuthorId(data["author_id"]),
+        title=Title(data["title"]),
+        content=Transcript(**content) if content else None,
+        tags=frozenset(Tag(t) for t in data["tags"]),
+        status=LectureStatus(data["status"]),
+        registered_at=datetime.fromisoformat(data["registered_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"]),
+        published_at=datetime.fromisoformat(data["published_at"])
+        if data["published_at"]
+        else None,
+    )
+
+
+class LectureCache:
+    """
+    Кэш сериализованных лекций в Redis. Живет в APP-скоупе: счетчики и
+    таблица текущих загрузок общие для всех запросов процесса.
+    """
+
+    def __init__(self, redis: Redis, ttl_sec: int) -> None:
+        self._redis = redis
+        self._ttl_sec = ttl_sec
+        self._inflight: dict[str, asyncio.Task[str | None]] = {}
+        self.stats = CacheStats()
+
+    async def get_or_load(
+        self,
+        lecture_id: LectureId,
+        loader: Callable[[], Awaitable[Lecture | None]],
+    ) -> Lecture | None:
+        key = KEY_PREFIX + lecture_id.value
+
+        try:
+            cached = await self._redis.get(key)
+        except RedisError:
+            logger.warning("Lecture cache read failed", exc_info=True)
+            self.stats.errors += 1
+            cached = None
+
+        if cached is not None:
+            self.stats.hits += 1
+            return load_lecture(cached)
+
+        self.stats.misses += 1
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.create_task(self._load(key, loader))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda f: self._forget(key, f))
+        else:
+            self.stats.coalesced += 1
+
+        # Каждый вызывающий получает свою копию: сущность изменяемая
+        raw = await asyncio.shield(inflight)
+        return load_lecture(raw) if raw is not None else None
+
+    async def invalidate(self, lecture_id: LectureId) -> None:
+        key = KEY_PREFIX + lecture_id.value
+        # Загрузка, начатая до инвалидации, больше не считается текущей
+        # и не запишет в кэш устаревшую версию
+        self._inflight.pop(key, None)
+        self.stats.invalidations += 1
+        try:
+            await self._redis.delete(key)
+        except RedisError:
+            logger.warning("Lecture cache invalidation failed", exc_info=True)
+            self.stats.errors += 1
+
+    async def _load(
+        self, key: str, loader: Callable[[], Awaitable[Lecture | None]]
+    ) -> str | None:
+        lecture = await loader()
+        if lecture is None:
+            return None
+
+        raw = dump_lecture(lecture)
+        if self._inflight.get(key) is asyncio.current_task():
+            try:
+                await self._redis.set(key, raw, ex=self._ttl_sec)
+            except RedisError:
+                logger.warning("Lecture cache write failed", exc_info=True)
+                self.stats.errors += 1
+        return raw
+
+    def _forget(self, key: str, task: asyncio.Future[str | None]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+
+class CachedLectureRepository(LectureRepositoryDecorator):
+    """
+    Декоратор репозитория: find_by_id читает через кэш,
+    операции записи сбрасывают закэшированную лекцию.
+    """
+
+    def __init__(self, inner: ILectureRepository, cache: LectureCache) -> None:
+        super().__init__(inner)
+        self._cache = cache
+
+    async def save(self, lecture: Lecture) -> None:
+        await self._inner.save(lecture)
+        if lecture.id:
+            await self._cache.invalidate(lecture.id)
+
+    async def transition_status(
+        self,
+        lecture_id: LectureId,
+        *,
+        from_statuses: Collection[LectureStatus],
+        to_status: LectureStatus,
+        at: datetime,
+        stale_before: datetime | None = None,
+        claim: str | None = None,
+        claimed_by: str | None = None,
+        **fields: Any,
+    ) -> LectureSummary | None:
+        result = await self._inner.transition_status(
+            lecture_id,
+            from_statuses=from_statuses,
+            to_status=to_status,
+            at=at,
+            stale_before=stale_before,
+            claim=claim,
+            claimed_by=claimed_by,
+            **fields,
+        )
+        if result:
+            await self._cache.invalidate(lecture_id)
+        return result
+
+    async def delete(self, lecture_id: LectureId) -> bool:
+        deleted = await self._inner.delete(lecture_id)
+        await self._cache.invalidate(lecture_id)
+        return deleted
+
+    async def find_by_id(self, lecture_id: LectureId) -> Lecture | None:
+        return await self._cache.get_or_load(
+            lecture_id, lambda: self._inner.find_by_id(lecture_id)
+        )
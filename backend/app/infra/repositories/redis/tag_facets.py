@@ -0,0 +1,177 @@
+import logging
+from collections import Counter
+from collections.abc import Collection, Iterable, Sequence
+from datetime import datetime
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, WatchError
+
+from app.domain.entities.lecture import Lecture, LectureStatus, LectureSummary
+from app.domain.entities.value_objects import LectureId, Tag
+from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.infra.repositories.decorator import LectureRepositoryDecorator
+
+logger = logging.getLogger(__name__)
+
+FACETS_KEY = "lecture:tags"
+# Попыток применить приращение, пока хэш меняют параллельные запросы
+APPLY_ATTEMPTS = 3
+
+
+class TagFacetCache:
+    """
+    Счетчики лекций по тегам в Redis-хэше. Хэш строится агрегацией при
+    первом чтении, дальше поддерживается приращениями (HINCRBY).
+    """
+
+    def __init__(self, redis: Redis, ttl_sec: int) -> None:
+        self._redis = redis
+        self._ttl_sec = ttl_sec
+
+    async def get(self) -> dict[Tag, int] | None:
+        try:
+            raw = await self._redis.hgetall(FACETS_KEY)
+        except RedisError:
+            logger.warning("Tag facets read failed", exc_info=True)
+            return None
+        if not raw:
+            return None
+        # Теги, у которых не осталось лекций, хранятся с нулем до пересчета
+        return {
+            Tag(tag if isinstance(tag, str) else tag.decode()): int(count)
+            for tag, count in raw.items()
+            if int(count) > 0
+        }
+
+    async def put(self, counts: dict[Tag, int]) -> None:
+        if not counts:
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.delete(FACETS_KEY)
+            pipe.hset(FACETS_KEY, mapping={t.value: n for t, n in counts.items()})
+            pipe.expire(FACETS_KEY, self._ttl_sec)
+            await pipe.execute()
+        except RedisError:
+            logger.warning("Tag facets write failed", exc_info=True)
+
+    async def apply(self, delta: Counter[Tag]) -> None:
+        """
+        Применяет приращения, только если хэш уже построен: иначе он
+        появился бы с неполным набором тегов.
+        """
+        changes = {tag.value: n for tag, n in delta.items() if n}
+        if not changes:
+            return
+        try:
+            for _ in range(APPLY_ATTEMPTS):
+                try:
+                    async with self._redis.pipeline(transaction=True) as pipe:
+                        await pipe.watch(FACETS_KEY)
+                        if not await pipe.exists(FACETS_KEY):
+                            return
+                        pipe.multi()  # type: ignore
+                        for tag, n in changes.items():
+                            pipe.hincrby(FACETS_KEY, tag, n)
+                        await pipe.execute()
+                        return
+                except WatchError:
+                    continue
+            # Не удалось применить атомарно — пусть следующее чтение пересчитает
+            await self.invalidate()
+        except RedisError:
+            logger.warning("Tag facets update failed", exc_info=True)
+
+    async def invalidate(self) -> None:
+        try:
+            await self._redis.delete(FACETS_KEY)
+        except RedisError:
+            logger.warning("Tag facets invalidation failed", exc_info=True)
+
+
+def _tag_delta(added: Iterable[Tag] = (), removed: Iterable[Tag] = ()) -> Counter[Tag]:
+    delta: Counter[Tag] = Counter(added)
+    delta.subtract(removed)
+    return delta
+
+
+class TagFacetRepository(LectureRepositoryDecorator):
+    """
+    Декоратор репозитория: count_tags читается из TagFacetCache, записи,
+    меняющие теги, правят счетчики приращениями вместо пересчета.
+    """
+
+    def __init__(self, inner: ILectureRepository, facets: TagFacetCache) -> None:
+        super().__init__(inner)
+        self._facets = facets
+
+    async def add(self, lecture: Lecture) -> LectureId:
+        lecture_id = await self._inner.add(lecture)
+        await self._facets.apply(_tag_delta(added=lecture.tags))
+        return lecture_id
+
+    async def add_many(self, lectures: Sequence[Lecture]) -> list[LectureId | None]:
+        ids = await self._inner.add_many(lectures)
+        delta: Counter[Tag] = Counter()
+        for lecture, lecture_id in zip(lectures, ids, strict=True):
+            if lecture_id is not None:
+                delta.update(lecture.tags)
+        await self._facets.apply(delta)
+        return ids
+
+    async def save(self, lecture: Lecture) -> None:
+        # save сбрасывает отметки изменений, поэтому разницу считаем заранее
+        delta = (
+            _tag_delta(added=lecture.tags, removed=lecture.original_value("tags"))
+            if "tags" in lecture.dirty_fields
+            else Counter[Tag]()
+        )
+        await self._inner.save(lecture)
+        await self._facets.apply(delta)
+
+    async def transition_status(
+        self,
+        lecture_id: LectureId,
+        *,
+        from_statuses: Collection[LectureStatus],
+        to_status: LectureStatus,
+        at: datetime,
+        stale_before: datetime | None = None,
+        claim: str | None = None,
+        claimed_by: str | None = None,
+        **fields: Any,
+    ) -> LectureSummary | None:
+        result = await self._inner.transition_status(
+            lecture_id,
+            from_statuses=from_statuses,
+            to_status=to_status,
+            at=at,
+            stale_before=stale_before,
+            claim=claim,
+            claimed_by=claimed_by,
+            **fields,
+        )
+        # Прежние теги здесь неизвестны
+        if result and "tags" in fields:
+            await self._facets.invalidate()
+        return result
+
+    async def delete(self, lecture_id: LectureId) -> bool:
+        # Нужны только теги: транскрипт не читаем
+        lecture = await self._inner.find_summary(lecture_id)
+        deleted = await self._inner.delete(lecture_id)
+        if deleted:
+            if lecture is None:
+                await self._facets.invalidate()
+            else:
+                await self._facets.apply(_tag_delta(removed=lecture.tags))
+        return deleted
+
+    async def count_tags(self) -> dict[Tag, int]:
+        cached = await self._facets.get()
+        if cached is not None:
+            return cached
+        counts = await self._inner.count_tags()
+        await self._facets.put(counts)
+        return counts
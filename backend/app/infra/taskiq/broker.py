@@ -1,11 +1,24 @@
 from dishka import make_async_container
 from dishka.integrations.taskiq import setup_dishka
+from taskiq import TaskiqEvents, TaskiqState
 from taskiq_redis import ListQueueBroker
 
+from app.common.constants import TASKIQ_QUEUE_NAME
 from app.common.settings import settings
 from app.infra.ioc import AppProvider
+from app.infra.repositories.mongo.indexes import IndexBootstrap
 
 container = make_async_container(AppProvider())
-broker = ListQueueBroker(str(settings.redis_url))
+broker = ListQueueBroker(str(settings.redis_url), queue_name=TASKIQ_QUEUE_NAME)
 
 setup_dishka(container, broker)
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def bootstrap_indexes(_state: TaskiqState) -> None:
+    await container.get(IndexBootstrap)
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def close_container(_state: TaskiqState) -> None:
+    await container.close()
@@ -0,0 +1,55 @@
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from redis.asyncio import Redis
+from taskiq import AsyncTaskiqDecoratedTask, TaskiqMessage
+from taskiq.exceptions import SendTaskError
+from taskiq.utils import maybe_awaitable
+from taskiq_redis import ListQueueBroker
+
+
+async def kiq_many(
+    task: AsyncTaskiqDecoratedTask[Any, Any],
+    calls: Iterable[Sequence[Any]],
+) -> None:
+    """
+    Ставит пачку вызовов задачи в очередь. Для ListQueueBroker все сообщения
+    уходят одним LPUSH в pipeline: один round trip и одно соединение пула на
+    пачку. pre_send и post_send middleware брокера вызываются для каждого
+    сообщения, как в kiq. Другим брокерам вызовы отправляются обычным kiq.
+    """
+    broker = task.broker
+    kicker = task.kicker()
+    if not isinstance(broker, ListQueueBroker):
+        for args in calls:
+            await kicker.kiq(*args)
+        return
+
+    messages: list[TaskiqMessage] = []
+    # LPUSH, как в ListQueueBroker.kick: воркер забирает BRPOP с другого конца
+    payloads: defaultdict[str, list[bytes]] = defaultdict(list)
+    for args in calls:
+        # Сборка сообщения из kiq: публичного способа без отправки в taskiq нет
+        message = kicker._prepare_message(*args)
+        for middleware in broker.middlewares:
+            message = await maybe_awaitable(middleware.pre_send(message))
+        sent = broker.formatter.dumps(message)
+        queue_name = sent.labels.get("queue_name") or broker.queue_name
+        payloads[queue_name].append(sent.message)
+        messages.append(message)
+    if not messages:
+        return
+
+    try:
+        async with Redis(connection_pool=broker.connection_pool) as redis:
+            pipe = redis.pipeline(transaction=False)
+            for queue_name, queued in payloads.items():
+                pipe.lpush(queue_name, *queued)
+            await pipe.execute()
+    except Exception as exc:
+        raise SendTaskError from exc
+
+    for message in messages:
+        for middleware in reversed(broker.middlewares):
+            await maybe_awaitable(middleware.post_send(message))
@@ -1,19 +1,36 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from typing import Any
 
-from dishka import make_async_container
+from dishka import AsyncContainer, make_async_container
 from dishka.integrations.fastapi import FromDishka, inject, setup_dishka
 from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
-from motor.motor_asyncio import AsyncIOMotorDatabase
-from redis.asyncio import Redis
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
 
 from app.api.v1.router import v1_router
 from app.common.settings import settings
+from app.infra.health import HealthMonitor
 from app.infra.ioc import AppProvider
+from app.infra.metrics.http import MetricsMiddleware
+from app.infra.metrics.instruments import Metrics
+from app.infra.repositories.mongo.indexes import IndexBootstrap
+from app.infra.repositories.redis.lecture_cache import LectureCache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    container: AsyncContainer = app.state.dishka_container
+    # Индексы создаются в фоне: старт не ждет Mongo
+    await container.get(IndexBootstrap)
+    # Запускает фоновую проверку зависимостей
+    await container.get(HealthMonitor)
+    yield
+    await container.close()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.PROJECT_NAME, version="0.1.0")
+    app = FastAPI(title=settings.PROJECT_NAME, version="0.1.0", lifespan=lifespan)
 
     # 1. Создаем контейнер зависимостей
     container = make_async_container(AppProvider())
@@ -21,6 +38,7 @@ def create_app() -> FastAPI:
     # 2. Интегрируем Dishka в FastAPI.
     # Это само управляет жизненным циклом (заменяет старый lifespan)
     setup_dishka(container, app)
+    app.add_middleware(MetricsMiddleware)
 
     app.include_router(v1_router, prefix="/api/v1")
     return app
@@ -31,20 +49,10 @@ app = create_app()
 
 @app.get("/", response_class=HTMLResponse)
 @inject
-async def root_page(
-    db: FromDishka[AsyncIOMotorDatabase[Any]], redis: FromDishka[Redis]
-) -> Any:
-    try:
-        await db.command("ping")
-        mongo_status = "Connected"
-    except Exception:
-        mongo_status = "Disconnected"
-
-    try:
-        await redis.ping()  # type: ignore
-        redis_status = "Connected"
-    except Exception:
-        redis_status = "Disconnected"
+async def root_page(health: FromDishka[HealthMonitor]) -> Any:
+    probes = health.snapshot.probes
+    mongo_status = "Connected" if probes["mongodb"].ok else "Disconnected"
+    redis_status = "Connected" if probes["redis"].ok else "Disconnected"
 
     mongo_color = "bg-green-500" if mongo_status == "Connected" else "bg-red-500"
     redis_color = "bg-green-500" if redis_status == "Connected" else "bg-red-500"
@@ -137,8 +145,10 @@ async def root_page(
                                 </span>
                             </div>
                             
-                            <div class="bg-slate-50 p-3 rounded-lg">
-                                 <pre class="text-[10px] text-slate-500 overflow-x-auto">${{JSON.stringify(l.content || 'Нет контента', null, 2)}}</pre>
+                            <div class="bg-slate-50 p-3 rounded-lg text-xs text-slate-500">
+                                ${{l.has_content
+                                    ? `<a href="${{API_URL + l.id}}" target="_blank" class="text-indigo-600 font-semibold hover:underline">Открыть транскрипт</a>`
+                                    : 'Нет контента'}}
                             </div>
 
                             <div class="flex justify-between items-center pt-2 border-t border-slate-50">
@@ -177,8 +187,20 @@ async def root_page(
                 fetchLectures();
             }}
 
+            // Вместо опроса раз в 5 секунд список перечитывается по событиям
+            // сервера; пачку событий (bulk, воркер) схлопываем в одно чтение
+            let refetchTimer = null;
+            function scheduleFetch() {{
+                clearTimeout(refetchTimer);
+                refetchTimer = setTimeout(fetchLectures, 300);
+            }}
+
+            const events = new EventSource(API_URL + 'events');
+            events.addEventListener('lecture', scheduleFetch);
+            // После (пере)подключения перечитываем: события за время обрыва потеряны
+            events.addEventListener('open', scheduleFetch);
+
             fetchLectures();
-            setInterval(fetchLectures, 5000);
         </script>
     </body>
     </html>
@@ -189,24 +211,56 @@ async def root_page(
 @app.get("/health")
 @inject
 async def health_check(
-    db: FromDishka[AsyncIOMotorDatabase[Any]], redis: FromDishka[Redis]
+    health: FromDishka[HealthMonitor],
+    lecture_cache: FromDishka[LectureCache],
 ) -> Any:
-    try:
-        await redis.ping()  # type: ignore[misc]
-        redis_ok = True
-    except Exception:
-        redis_ok = False
-
-    try:
-        await db.command("ping")
-        mongo_ok = True
-    except Exception:
-        mongo_ok = False
-
+    # Снимок из фоновой проверки: запрос к /health сам в базы не ходит
+    snapshot = health.snapshot
     return {
-        "status": "ok" if mongo_ok and redis_ok else "error",
+        "status": "ok" if snapshot.healthy else "error",
+        "checked_at": snapshot.checked_at.isoformat(),
         "services": {
-            "mongodb": "connected" if mongo_ok else "error",
-            "redis": "connected" if redis_ok else "error",
+            name: "connected" if result.ok else "error"
+            for name, result in snapshot.probes.items()
+        },
+        "latency_ms": {
+            name: round(result.latency_ms, 2)
+            for name, result in snapshot.probes.items()
         },
+        "lecture_cache": asdict(lecture_cache.stats),
     }
+
+
+@app.get("/metrics", include_in_schema=False)
+@inject
+async def metrics_page(metrics: FromDishka[Metrics]) -> Any:
+    await metrics.registry.collect()
+    return PlainTextResponse(
+        metrics.registry.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.get("/health/live")
+async def liveness() -> Any:
+    # Процесс жив и отвечает; зависимости не проверяются
+    return {"status": "ok"}
+
+
+@app.get("/health/ready")
+@inject
+async def readiness(
+    health: FromDishka[HealthMonitor], indexes: FromDishka[IndexBootstrap]
+) -> Any:
+    snapshot = health.snapshot
+    return JSONResponse(
+        status_code=200 if snapshot.healthy else 503,
+        content={
+            "status": "ok" if snapshot.healthy else "error",
+            "services": {
+                name: asdict(result) for name, result in snapshot.probes.items()
+            },
+            # Без индексов API работает, только медленнее: на статус не влияет
+            "indexes": {"state": indexes.state, "error": indexes.error},
+        },
+    )
@@ -1,30 +1,99 @@
 import asyncio
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from uuid import uuid4
 
 from dishka.integrations.taskiq import FromDishka, inject
 
-from app.domain.entities.value_objects import LectureId, Transcript
+from app.common.settings import settings
+from app.domain.entities.lecture import STARTABLE_STATUSES, LectureStatus
+from app.domain.entities.value_objects import (
+    LectureId,
+    Transcript,
+    TranscriptSegment,
+)
 from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.domain.interfaces.segment_repo import ISegmentRepository
 from app.infra.taskiq.broker import broker
+from app.infra.taskiq.enqueue import kiq_many
 
 
 @broker.task
 @inject
 async def process_lecture_task(
-    lecture_id: str, repo: FromDishka[ILectureRepository]
+    lecture_id: str,
+    repo: FromDishka[ILectureRepository],
+    segments: FromDishka[ISegmentRepository],
 ) -> None:
-    lecture = await repo.find_by_id(LectureId(lecture_id))
-    if not lecture:
+    lid = LectureId(lecture_id)
+
+    # Забрать лекцию может только один воркер: переход условный и атомарный.
+    # Зависшую в PROCESSING (воркер упал, не дойдя до except) можно забрать
+    # повторной задачей после истечения лиза. Дальше лекцию меняет только
+    # держатель claim: медленный воркер, у которого ее перехватили, результат
+    # нового не затрет
+    claim = uuid4().hex
+    now = datetime.now()
+    started = await repo.transition_status(
+        lid,
+        from_statuses=STARTABLE_STATUSES,
+        to_status=LectureStatus.PROCESSING,
+        at=now,
+        stale_before=now - timedelta(seconds=settings.PROCESSING_LEASE_SEC),
+        claim=claim,
+    )
+    if not started:
         return
 
-    lecture.start_processing(at=datetime.now())
-    await repo.save(lecture)
+    try:
+        await asyncio.sleep(10)
 
-    await asyncio.sleep(10)
+        mock_segments = [
+            TranscriptSegment(start=0.0, end=2.5, text="Это тестовая", confidence=0.99),
+            TranscriptSegment(
+                start=2.5, end=5.0, text="расшифровка лекции", confidence=0.99
+            ),
+        ]
+        mock_transcript = Transcript(
+            text=" ".join(s.text for s in mock_segments),
+            language="ru",
+            confidence=0.99,
+        )
+        # Сегменты пишутся до перехода в COMPLETED: завершенная лекция
+        # всегда видна вместе с таймингами. Перед записью лиз продлевается:
+        # если лекцию уже перехватили, сегменты нового воркера не трогаем
+        renewed = await repo.transition_status(
+            lid,
+            from_statuses={LectureStatus.PROCESSING},
+            to_status=LectureStatus.PROCESSING,
+            at=datetime.now(),
+            claimed_by=claim,
+        )
+        if not renewed:
+            return
+        await segments.replace(lid, mock_segments)
+    except BaseException:
+        # В том числе CancelledError при остановке воркера
+        await repo.transition_status(
+            lid,
+            from_statuses={LectureStatus.PROCESSING},
+            to_status=LectureStatus.FAILED,
+            at=datetime.now(),
+            claimed_by=claim,
+        )
+        raise
 
-    mock_transcript = Transcript(
-        text="Это тестовая расшифровка лекции", language="ru", confidence=0.99
+    now = datetime.now()
+    await repo.transition_status(
+        lid,
+        from_statuses={LectureStatus.PROCESSING},
+        to_status=LectureStatus.COMPLETED,
+        at=now,
+        content=mock_transcript,
+        published_at=now,
+        claimed_by=claim,
     )
 
-    lecture.complete(transcript=mock_transcript, at=datetime.now())
-    await repo.save(lecture)
+
+async def enqueue_lectures(lecture_ids: Iterable[LectureId]) -> None:
+    await kiq_many(process_lecture_task, ((lid.value,) for lid in lecture_ids))
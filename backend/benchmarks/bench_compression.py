@@ -0,0 +1,136 @@
+"""
+Размер документа и задержки чтения/записи лекции с транскриптом в открытом
+и сжатом виде (app.infra.repositories.mongo.compression).
+
+Запуск (из каталога backend):
+    python -m benchmarks.bench_compression            # размеры и CPU
+    python -m benchmarks.bench_compression --mongo    # плюс живая база
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from functools import partial
+from typing import Any
+
+import bson
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.common.constants import MONGO_LECTURES_COLLECTION
+from app.common.settings import settings
+from app.domain.entities.lecture import Lecture
+from app.domain.entities.value_objects import AuthorId, LectureId, Title, Transcript
+from app.infra.repositories.mongo.compression import compress_text, decompress_text
+from app.infra.repositories.mongo.lecture import MongoLectureRepository
+from benchmarks.bench_search import make_text, make_vocabulary
+
+# ~130 слов в минуту устной речи
+WORDS_PER_MINUTE = 130
+DURATIONS_MIN = (10, 60, 180)
+MODES = {"plain": 0, "compressed": 1}
+
+
+def make_lecture(text: str) -> Lecture:
+    now = datetime.now()
+    return Lecture(
+        author_id=AuthorId("bench"),
+        title=Title("Compression bench"),
+        content=Transcript(text=text, language="ru", confidence=0.9),
+        registered_at=now,
+        updated_at=now,
+    )
+
+
+def median_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+async def median_ms_async(fn: Callable[[], Awaitable[object]], repeat: int) -> float:
+    await fn()  # прогрев
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+async def read_text(repo: MongoLectureRepository, lecture_id: LectureId) -> None:
+    lecture = await repo.find_by_id(lecture_id)
+    assert lecture is not None and lecture.content is not None
+    _ = lecture.content.text  # сжатый текст распаковывается здесь
+
+
+async def time_mongo(repo: MongoLectureRepository, text: str, repeat: int) -> None:
+    for mode, threshold in MODES.items():
+        settings.TRANSCRIPT_COMPRESS_MIN_BYTES = threshold
+        lecture_id = await repo.add(make_lecture(text))
+
+        insert = await median_ms_async(
+            lambda: repo.add(make_lecture(text)),
+            repeat,
+        )
+        find = await median_ms_async(partial(read_text, repo, lecture_id), repeat)
+        summary = await median_ms_async(
+            partial(repo.find_summary_page, author_id=AuthorId("bench"), limit=20),
+            repeat,
+        )
+        print(
+            f"    {mode:<10} insert {insert:7.2f} ms   find_by_id {find:7.2f} ms"
+            f"   summary page {summary:7.2f} ms"
+        )
+
+
+async def main(use_mongo: bool, repeat: int) -> None:
+    client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(str(settings.mongo_url))
+    db = client[f"{settings.MONGO_DB_NAME}_bench"]
+    repo = MongoLectureRepository(db)
+    rng = random.Random(1)
+    vocabulary = make_vocabulary(rng)
+    threshold = settings.TRANSCRIPT_COMPRESS_MIN_BYTES
+
+    try:
+        for minutes in DURATIONS_MIN:
+            text = make_text(rng, vocabulary, WORDS_PER_MINUTE * minutes)
+            raw = text.encode("utf-8")
+            blob = compress_text(text)
+
+            sizes = {}
+            for mode, mode_threshold in MODES.items():
+                settings.TRANSCRIPT_COMPRESS_MIN_BYTES = mode_threshold
+                doc = repo._entity_to_doc(make_lecture(text))
+                sizes[mode] = len(bson.encode(doc))
+
+            print(f"{minutes} min transcript ({len(raw)} B UTF-8):")
+            ratio = sizes["plain"] / sizes["compressed"]
+            print(
+                f"  BSON plain {sizes['plain']:>9} B   "
+                f"compressed {sizes['compressed']:>8} B   x{ratio:.1f}"
+            )
+            pack = median_ms(partial(compress_text, text), repeat)
+            unpack = median_ms(partial(decompress_text, blob), repeat)
+            print(f"  compress {pack:6.2f} ms   decompress {unpack:6.2f} ms")
+            if use_mongo:
+                await time_mongo(repo, text, repeat)
+    finally:
+        settings.TRANSCRIPT_COMPRESS_MIN_BYTES = threshold
+        if use_mongo:
+            await db[MONGO_LECTURES_COLLECTION].drop()
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mongo", action="store_true", help="time real reads/writes")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.mongo, args.repeat))
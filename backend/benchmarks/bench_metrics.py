@@ -0,0 +1,147 @@
+"""
+Накладные расходы метрик: Histogram.observe, MetricsMiddleware на пустом
+маршруте, InstrumentedLectureRepository вокруг репозитория без I/O и
+выгрузка /metrics.
+
+Запуск (из каталога backend, базы не нужны):
+    python -m benchmarks.bench_metrics --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from dishka import Provider, Scope, make_async_container, provide
+from fastapi import FastAPI
+from redis.asyncio import Redis
+from starlette.types import Message
+
+from app.domain.entities.lecture import Lecture
+from app.domain.entities.value_objects import LectureId
+from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.infra.metrics.http import MetricsMiddleware
+from app.infra.metrics.instruments import Metrics
+from app.infra.metrics.registry import Histogram
+from app.infra.metrics.repository import InstrumentedLectureRepository
+from app.infra.repositories.decorator import LectureRepositoryDecorator
+
+ROUTES = 20
+STATUSES = ("200", "304", "404", "422")
+
+
+class MetricsProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_metrics(self) -> Metrics:
+        # Соединение не открывается: коллекторы в замерах не вызываются
+        return Metrics(Redis(), queue_name="bench")
+
+
+class NullRepository(LectureRepositoryDecorator):
+    """Репозиторий без I/O: измеряется только стоимость обертки."""
+
+    def __init__(self) -> None:
+        pass
+
+    async def find_by_id(self, lecture_id: LectureId) -> Lecture | None:
+        return None
+
+
+def make_app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+    app.state.dishka_container = make_async_container(MetricsProvider())
+
+    @app.get("/ping/{item}")
+    async def ping(item: str) -> dict[str, str]:
+        return {"item": item}
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> None:
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("bench", 80),
+        "client": ("bench", 1),
+        "app": app,
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    await app(scope, receive, send)
+
+
+async def per_request_us(app: FastAPI, requests: int) -> float:
+    for i in range(200):
+        await call(app, f"/ping/{i}")
+    started = time.perf_counter()
+    for i in range(requests):
+        await call(app, f"/ping/{i}")
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main(requests: int) -> None:
+    histogram = Histogram("bench", "bench", ("route", "status"))
+    started = time.perf_counter()
+    for i in range(requests):
+        histogram.observe(i / requests, "route", "200")
+    observe_ns = (time.perf_counter() - started) / requests * 1e9
+    print(f"Histogram.observe              {observe_ns:8.0f} ns")
+
+    plain = await per_request_us(make_app(instrumented=False), requests)
+    metered = await per_request_us(make_app(instrumented=True), requests)
+    print(
+        f"request without middleware     {plain:8.1f} us\n"
+        f"request with MetricsMiddleware {metered:8.1f} us"
+        f"   (+{metered - plain:.1f} us, {(metered / plain - 1) * 100:+.1f}%)"
+    )
+
+    bare: ILectureRepository = NullRepository()
+    wrapped = InstrumentedLectureRepository(bare, histogram)
+    lecture_id = LectureId("0" * 24)
+    timings = []
+    for repo in (bare, wrapped):
+        started = time.perf_counter()
+        for _ in range(requests):
+            await repo.find_by_id(lecture_id)
+        timings.append((time.perf_counter() - started) / requests * 1e9)
+    print(
+        f"repo.find_by_id bare           {timings[0]:8.0f} ns\n"
+        f"repo.find_by_id instrumented   {timings[1]:8.0f} ns"
+        f"   (+{timings[1] - timings[0]:.0f} ns)"
+    )
+
+    # Типичный размер: маршруты x статусы x корзины
+    metrics = Metrics(Redis(), queue_name="bench")
+    for route in range(ROUTES):
+        for status in STATUSES:
+            metrics.http_requests.observe(0.01, "GET", f"route_{route}", status)
+    started = time.perf_counter()
+    text = metrics.registry.render()
+    render_ms = (time.perf_counter() - started) * 1000
+    print(
+        f"render {ROUTES * len(STATUSES)} series           "
+        f"{render_ms:8.2f} ms   ({len(text)} B)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
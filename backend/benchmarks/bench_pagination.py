@@ -0,0 +1,118 @@
+"""
+Сравнение skip/limit и keyset-пагинации на засеянной коллекции.
+
+Запуск (из каталога backend, нужен поднятый MongoDB из .env):
+    python -m benchmarks.bench_pagination --count 100000 --page 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from app.common.constants import MONGO_LECTURES_COLLECTION
+from app.common.settings import settings
+from app.infra.repositories.mongo.cursor import encode_cursor
+from app.infra.repositories.mongo.lecture import PAGE_SORT, MongoLectureRepository
+from app.infra.repositories.mongo.registry import bootstrap_indexes
+
+SEED_BATCH = 5_000
+
+
+async def seed(db: AsyncIOMotorDatabase[Any], count: int) -> None:
+    collection = db[MONGO_LECTURES_COLLECTION]
+    await collection.drop()
+
+    start = datetime(2024, 1, 1)
+    for batch_start in range(0, count, SEED_BATCH):
+        docs = [
+            {
+                "title": f"Lecture {i}",
+                "author_id": f"author_{i % 50}",
+                "status": "completed",
+                "tags": ["bench"],
+                "transcript": None,
+                # Пары документов делят registered_at, чтобы курсор
+                # проверялся и на равных значениях
+                "registered_at": start + timedelta(seconds=i // 2),
+                "updated_at": start,
+                "published_at": None,
+            }
+            for i in range(batch_start, min(batch_start + SEED_BATCH, count))
+        ]
+        await collection.insert_many(docs, ordered=False)
+
+    await bootstrap_indexes(db)
+
+
+async def measure(fn: Callable[[], Awaitable[object]], repeat: int) -> float:
+    await fn()  # прогрев
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+async def main(count: int, page: int, limit: int, repeat: int) -> None:
+    client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(str(settings.mongo_url))
+    db = client[f"{settings.MONGO_DB_NAME}_bench"]
+    repo = MongoLectureRepository(db)
+
+    try:
+        print(f"Seeding {count} lectures...")
+        await seed(db, count)
+
+        offset = (page - 1) * limit
+        # Курсор, который клиент получил бы, пролистав до нужной страницы
+        boundary = await (
+            db[MONGO_LECTURES_COLLECTION]
+            .find({}, {"registered_at": 1})
+            .sort(PAGE_SORT)
+            .skip(offset - 1)
+            .limit(1)
+        ).to_list(length=1)
+        deep_cursor = encode_cursor(boundary[0]["registered_at"], boundary[0]["_id"])
+
+        results = {
+            "offset  page 1": await measure(
+                lambda: repo.find_all(limit=limit, offset=0), repeat
+            ),
+            f"offset  page {page}": await measure(
+                lambda: repo.find_all(limit=limit, offset=offset), repeat
+            ),
+            "keyset  page 1": await measure(
+                lambda: repo.find_page(limit=limit), repeat
+            ),
+            f"keyset  page {page}": await measure(
+                lambda: repo.find_page(limit=limit, cursor=deep_cursor), repeat
+            ),
+        }
+
+        for name, ms in results.items():
+            print(f"{name:<20} median {ms:8.2f} ms")
+    finally:
+        await client.drop_database(db.name)
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--page", type=int, default=10_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.page < 2:
+        parser.error("--page must be at least 2")
+    if (args.page - 1) * args.limit >= args.count:
+        parser.error("--count is too small for the requested --page")
+
+    asyncio.run(main(args.count, args.page, args.limit, args.repeat))
@@ -0,0 +1,129 @@
+"""
+Объем данных, отправляемых в MongoDB при save: полный replace_one против
+$set только измененных полей, для лекций с транскриптами разной длины.
+
+Запуск (из каталога backend):
+    python -m benchmarks.bench_save_delta            # только размеры BSON
+    python -m benchmarks.bench_save_delta --mongo    # плюс время на живой базе
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import bson
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.common.constants import MONGO_LECTURES_COLLECTION
+from app.common.settings import settings
+from app.domain.entities.lecture import Lecture, LectureStatus
+from app.domain.entities.value_objects import (
+    AuthorId,
+    LectureId,
+    Tag,
+    Title,
+    Transcript,
+)
+from app.infra.repositories.mongo.lecture import MongoLectureRepository, dirty_delta
+
+# ~130 слов в минуту устной речи
+WORDS_PER_MINUTE = 130
+WORD = "лекция "
+DURATIONS_MIN = (10, 60, 180)
+
+
+def make_lecture(minutes: int) -> Lecture:
+    now = datetime.now()
+    return Lecture(
+        id=LectureId(str(bson.ObjectId())),
+        author_id=AuthorId("bench"),
+        title=Title(f"{minutes} min lecture"),
+        content=Transcript(
+            text=WORD * (WORDS_PER_MINUTE * minutes), language="ru", confidence=0.9
+        ),
+        tags=frozenset([Tag("bench")]),
+        # FAILED допускает все шаги ниже, включая повторный start_processing
+        status=LectureStatus.FAILED,
+        registered_at=now,
+        updated_at=now,
+        published_at=now,
+    )
+
+
+STEPS: dict[str, Callable[[Lecture], None]] = {
+    "update_info(tags)": lambda x: x.update_info(
+        at=datetime.now(), tags=frozenset([Tag("edited")])
+    ),
+    "fail": lambda x: x.fail(at=datetime.now()),
+    "start_processing": lambda x: x.start_processing(at=datetime.now()),
+}
+
+
+def payload_sizes(
+    repo: MongoLectureRepository, lecture: Lecture, step: Callable[[Lecture], None]
+) -> tuple[int, int]:
+    lecture.mark_clean()
+    step(lecture)
+    doc = repo._entity_to_doc(lecture)
+    return len(bson.encode(doc)), len(bson.encode({"$set": dirty_delta(lecture)}))
+
+
+async def time_saves(repo: MongoLectureRepository, lecture: Lecture, n: int) -> None:
+    collection = repo._collection
+    lecture.id = await repo.add(lecture)
+    object_id = bson.ObjectId(lecture.id.value)
+
+    def flip() -> None:
+        lecture.mark_clean()
+        lecture.fail(at=datetime.now())
+
+    replace, delta = [], []
+    for _ in range(n):
+        flip()
+        started = time.perf_counter()
+        await collection.replace_one({"_id": object_id}, repo._entity_to_doc(lecture))
+        replace.append(time.perf_counter() - started)
+
+        flip()
+        started = time.perf_counter()
+        await repo.save(lecture)
+        delta.append(time.perf_counter() - started)
+
+    print(
+        f"    replace_one median {statistics.median(replace) * 1000:7.2f} ms, "
+        f"$set median {statistics.median(delta) * 1000:7.2f} ms"
+    )
+
+
+async def main(use_mongo: bool, repeat: int) -> None:
+    client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(str(settings.mongo_url))
+    db = client[f"{settings.MONGO_DB_NAME}_bench"]
+    repo = MongoLectureRepository(db)
+
+    try:
+        for minutes in DURATIONS_MIN:
+            print(f"{minutes} min transcript:")
+            for name, step in STEPS.items():
+                full, delta = payload_sizes(repo, make_lecture(minutes), step)
+                print(
+                    f"  {name:<18} replace_one {full:>9} B   $set {delta:>5} B   "
+                    f"x{full / delta:,.0f}"
+                )
+            if use_mongo:
+                await time_saves(repo, make_lecture(minutes), repeat)
+    finally:
+        if use_mongo:
+            await db[MONGO_LECTURES_COLLECTION].drop()
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mongo", action="store_true", help="time real saves")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.mongo, args.repeat))
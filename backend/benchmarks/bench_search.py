@@ -0,0 +1,150 @@
+"""
+Задержка полнотекстового поиска на засеянном корпусе: первая страница и
+страница глубже по курсору, для частого, редкого и составного запроса.
+
+Запуск (из каталога backend, нужен поднятый MongoDB из .env):
+    python -m benchmarks.bench_search --count 100000 --words 300
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from app.common.constants import MONGO_LECTURES_COLLECTION
+from app.common.settings import settings
+from app.infra.repositories.mongo.lecture import MongoLectureRepository
+from app.infra.repositories.mongo.registry import bootstrap_indexes
+
+SEED_BATCH = 2_000
+SYLLABLES = "ба ве ги до ку ла ми но пра ри со те ву фа хи це ча шу".split()
+ENDINGS = ("", "а", "ы", "ом", "ами", "ах")
+# Частота слов в корпусе падает по закону Ципфа, как в живой речи
+VOCABULARY_SIZE = 20_000
+RARE_WORD_RANK = 15_000
+CUM_WEIGHTS = list(
+    itertools.accumulate(1 / rank for rank in range(1, VOCABULARY_SIZE + 1))
+)
+
+
+def make_vocabulary(rng: random.Random) -> list[str]:
+    words: set[str] = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    vocabulary = sorted(words)
+    rng.shuffle(vocabulary)
+    return vocabulary
+
+
+def make_text(rng: random.Random, vocabulary: list[str], n_words: int) -> str:
+    ranks = rng.choices(range(len(vocabulary)), cum_weights=CUM_WEIGHTS, k=n_words)
+    return " ".join(vocabulary[r] + rng.choice(ENDINGS) for r in ranks)
+
+
+async def seed(
+    db: AsyncIOMotorDatabase[Any], count: int, n_words: int, vocabulary: list[str]
+) -> None:
+    collection = db[MONGO_LECTURES_COLLECTION]
+    await collection.drop()
+    # Индекс создается до вставки: так же он поддерживается в рабочей базе
+    await bootstrap_indexes(db)
+
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    for batch_start in range(0, count, SEED_BATCH):
+        docs = [
+            {
+                "title": make_text(rng, vocabulary, 4),
+                "author_id": f"author_{i % 50}",
+                "status": "completed",
+                "tags": ["bench"],
+                "transcript": {
+                    "text": make_text(rng, vocabulary, n_words),
+                    "language": "ru",
+                    "confidence": 0.9,
+                },
+                "registered_at": start + timedelta(seconds=i),
+                "updated_at": start,
+                "published_at": start,
+            }
+            for i in range(batch_start, min(batch_start + SEED_BATCH, count))
+        ]
+        await collection.insert_many(docs, ordered=False)
+
+
+async def measure(
+    fn: Callable[[], Awaitable[object]], repeat: int
+) -> tuple[float, float]:
+    await fn()  # прогрев
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95) - 1]
+
+
+async def main(count: int, n_words: int, limit: int, depth: int, repeat: int) -> None:
+    client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(str(settings.mongo_url))
+    db = client[f"{settings.MONGO_DB_NAME}_bench"]
+    repo = MongoLectureRepository(db)
+    vocabulary = make_vocabulary(random.Random(7))
+
+    queries = {
+        "frequent": vocabulary[0],
+        "rare": vocabulary[RARE_WORD_RANK],
+        "two words": f"{vocabulary[10]} {vocabulary[500]}",
+    }
+
+    try:
+        print(f"Seeding {count} lectures x {n_words} words...")
+        started = time.perf_counter()
+        await seed(db, count, n_words, vocabulary)
+        print(f"  done in {time.perf_counter() - started:.0f} s")
+
+        for name, query in queries.items():
+            # Курсор, до которого клиент дошел бы, листая страницы подряд
+            cursor = None
+            for _ in range(depth - 1):
+                page = await repo.search(query, limit=limit, cursor=cursor)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+
+            first = await measure(partial(repo.search, query, limit=limit), repeat)
+            print(
+                f"{name:<10} page 1         median {first[0]:7.1f} ms"
+                f"   p95 {first[1]:7.1f} ms"
+            )
+            if cursor is not None:
+                deep = await measure(
+                    partial(repo.search, query, limit=limit, cursor=cursor),
+                    repeat,
+                )
+                print(
+                    f"{name:<10} page {depth:<9} median {deep[0]:7.1f} ms"
+                    f"   p95 {deep[1]:7.1f} ms"
+                )
+    finally:
+        await client.drop_database(db.name)
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=300, help="words per transcript")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=5, help="page reached by cursor")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.words, args.limit, args.depth, args.repeat))
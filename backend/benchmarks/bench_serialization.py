@@ -0,0 +1,134 @@
+"""
+Стоимость сериализации одной лекции в ответ API: pydantic-схема
+(валидация + model_dump + json.dumps, как делает FastAPI с response_model)
+против прямого кодировщика app.api.v1.encoders.
+
+Запуск (из каталога backend, база не нужна):
+    python -m benchmarks.bench_serialization --items 100 --repeat 20
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from app.api.v1.encoders import dumps, encode_lectures, encode_summaries
+from app.api.v1.schemas.lecture import LectureRead, LectureSummaryRead
+from app.domain.entities.lecture import Lecture, LectureStatus, LectureSummary
+from app.domain.entities.value_objects import (
+    AuthorId,
+    LectureId,
+    Tag,
+    Title,
+    Transcript,
+)
+
+# ~130 слов в минуту устной речи
+WORDS_PER_MINUTE = 130
+WORD = "лекция "
+
+
+def make_lecture(i: int, minutes: int) -> Lecture:
+    now = datetime.now()
+    content = (
+        Transcript(text=WORD * (WORDS_PER_MINUTE * minutes), language="ru")
+        if minutes
+        else None
+    )
+    return Lecture(
+        id=LectureId(f"{i:024x}"),
+        author_id=AuthorId("bench"),
+        title=Title(f"Lecture {i}"),
+        content=content,
+        tags=frozenset(Tag(t) for t in ("bench", "math", "week-1")),
+        status=LectureStatus.COMPLETED if minutes else LectureStatus.PENDING,
+        registered_at=now,
+        updated_at=now,
+        published_at=now if minutes else None,
+    )
+
+
+def to_summary(lecture: Lecture) -> LectureSummary:
+    assert lecture.id
+    return LectureSummary(
+        id=lecture.id,
+        author_id=lecture.author_id,
+        title=lecture.title,
+        tags=lecture.tags,
+        status=lecture.status,
+        has_content=lecture.content is not None,
+        registered_at=lecture.registered_at,
+        updated_at=lecture.updated_at,
+        published_at=lecture.published_at,
+    )
+
+
+def via_pydantic(schema: Any) -> Callable[[list[Any]], bytes]:
+    def run(items: list[Any]) -> bytes:
+        return json.dumps(
+            [
+                schema.model_validate(x, from_attributes=True).model_dump(mode="json")
+                for x in items
+            ],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode()
+
+    return run
+
+
+CASES: dict[str, tuple[int, Callable[[list[Any]], bytes], Callable[..., bytes]]] = {
+    "summary": (
+        0,
+        via_pydantic(LectureSummaryRead),
+        lambda items: dumps(encode_summaries(items)),
+    ),
+    "small lecture": (
+        0,
+        via_pydantic(LectureRead),
+        lambda items: dumps(encode_lectures(items)),
+    ),
+    "60 min transcript": (
+        60,
+        via_pydantic(LectureRead),
+        lambda items: dumps(encode_lectures(items)),
+    ),
+}
+
+
+def per_item_us(
+    fn: Callable[[list[Any]], bytes], items: list[Any], repeat: int
+) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(items)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) / len(items) * 1_000_000
+
+
+def main(n_items: int, repeat: int) -> None:
+    for name, (minutes, pydantic_path, encoder_path) in CASES.items():
+        lectures = [make_lecture(i, minutes) for i in range(n_items)]
+        items: list[Any] = (
+            [to_summary(x) for x in lectures] if name == "summary" else lectures
+        )
+        assert pydantic_path(items) == encoder_path(items)
+
+        old = per_item_us(pydantic_path, items, repeat)
+        new = per_item_us(encoder_path, items, repeat)
+        print(
+            f"{name:<18} pydantic {old:9.1f} us/item   encoder {new:9.1f} us/item"
+            f"   x{old / new:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.items, args.repeat)
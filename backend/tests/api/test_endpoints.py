@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from httpx import AsyncClient
 
@@ -22,3 +24,180 @@ async def test_lecture_api_full_cycle(client: AsyncClient):
     # 404 (закрывает missing coverage в endpoints)
     fake_id = "6992dc0a6b280c1595e731eb"
     await client.get(f"/api/v1/lectures/{fake_id}")
+
+
+@pytest.mark.asyncio
+async def test_list_lectures_summary_and_content(client: AsyncClient):
+    payload = {"title": "Summary", "author_id": "summary_user", "tags": ["s"]}
+    await client.post("/api/v1/lectures/", json=payload)
+
+    summary = await client.get(
+        "/api/v1/lectures/", params={"author_id": "summary_user"}
+    )
+    assert summary.status_code == 200
+    item = summary.json()[0]
+    assert item["has_content"] is False
+    assert "content" not in item
+
+    full = await client.get(
+        "/api/v1/lectures/",
+        params={"author_id": "summary_user", "include": "content"},
+    )
+    assert full.status_code == 200
+    assert "content" in full.json()[0]
+
+
+@pytest.mark.asyncio
+async def test_export_lectures_ndjson_with_resume(client: AsyncClient):
+    for i in range(3):
+        payload = {"title": f"Export {i}", "author_id": "export_user"}
+        await client.post("/api/v1/lectures/", json=payload)
+
+    resp = await client.get(
+        "/api/v1/lectures/export", params={"author_id": "export_user"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["title"] for r in rows] == ["Export 0", "Export 1", "Export 2"]
+
+    resumed = await client.get(
+        "/api/v1/lectures/export",
+        params={"author_id": "export_user", "resume_after": rows[0]["id"]},
+    )
+    assert [json.loads(line)["id"] for line in resumed.text.splitlines()] == [
+        r["id"] for r in rows[1:]
+    ]
+
+    bad = await client.get("/api/v1/lectures/export", params={"resume_after": "x"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_reports_invalid_items(client: AsyncClient):
+    items = [
+        {"title": "Bulk 1", "author_id": "bulk_user", "tags": ["x"]},
+        {"author_id": "bulk_user"},
+        {"title": "Bulk 2", "author_id": "bulk_user", "tags": ["t" * 50]},
+        {"title": "Bulk 3", "author_id": "bulk_user"},
+        1,
+    ]
+    resp = await client.post("/api/v1/lectures/bulk", json={"items": items})
+
+    assert resp.status_code == 201
+    body = resp.json()
+    assert [c["title"] for c in body["created"]] == ["Bulk 1", "Bulk 3"]
+    assert all(c["id"] for c in body["created"])
+    assert [e["index"] for e in body["errors"]] == [1, 2, 4]
+    assert body["errors"][2]["errors"][0]["type"] == "model_type"
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304_until_lecture_changes(client: AsyncClient):
+    payload = {"title": "ETag", "author_id": "etag_user", "tags": []}
+    l_id = (await client.post("/api/v1/lectures/", json=payload)).json()["id"]
+    url = f"/api/v1/lectures/{l_id}"
+    params = {"author_id": "etag_user"}
+
+    first = await client.get(url)
+    listing = await client.get("/api/v1/lectures/", params=params)
+    etag, list_etag = first.headers["etag"], listing.headers["etag"]
+
+    cached = await client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    not_modified = await client.get(
+        "/api/v1/lectures/", params=params, headers={"If-None-Match": list_etag}
+    )
+    assert not_modified.status_code == 304
+
+    # Другое написание того же ObjectId — та же версия
+    upper_url = f"/api/v1/lectures/{l_id.upper()}"
+    assert (await client.get(upper_url)).headers["etag"] == etag
+    upper = await client.get(upper_url, headers={"If-None-Match": etag})
+    assert upper.status_code == 304
+
+    patched = await client.patch(url, json={"title": "ETag v2"})
+    assert patched.headers["etag"] != etag
+
+    changed = await client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] == patched.headers["etag"]
+    relisted = await client.get(
+        "/api/v1/lectures/", params=params, headers={"If-None-Match": list_etag}
+    )
+    assert relisted.status_code == 200
+    assert relisted.headers["etag"] != list_etag
+
+
+@pytest.mark.asyncio
+async def test_list_lectures_filtered_by_tags(client: AsyncClient):
+    for tags in (["t_x"], ["t_x", "t_y"], ["t_y"]):
+        payload = {"title": "Tagged", "author_id": "tag_user", "tags": tags}
+        await client.post("/api/v1/lectures/", json=payload)
+
+    url = "/api/v1/lectures/"
+    base = {"author_id": "tag_user", "limit": 10}
+    any_of = await client.get(url, params={**base, "tag": ["t_x", "t_y"]})
+    all_of = await client.get(
+        url, params={**base, "tag": ["t_x", "t_y"], "tag_match": "all"}
+    )
+    assert len(any_of.json()) == 3
+    assert [sorted(x["tags"]) for x in all_of.json()] == [["t_x", "t_y"]]
+
+    facets = {x["tag"]: x["count"] for x in (await client.get(url + "tags")).json()}
+    assert facets["t_x"] == facets["t_y"] == 2
+
+    too_long = await client.get(url, params={**base, "tag": ["t" * 21]})
+    assert too_long.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_segments_endpoint_validates_range(client: AsyncClient):
+    payload = {"title": "Segments", "author_id": "segments_user", "tags": []}
+    l_id = (await client.post("/api/v1/lectures/", json=payload)).json()["id"]
+    url = f"/api/v1/lectures/{l_id}/segments"
+
+    ok = await client.get(url, params={"from": 0, "to": 60})
+    assert ok.status_code == 200
+    assert ok.json() == []
+
+    assert (await client.get(url, params={"from": 60, "to": 10})).status_code == 400
+    missing = "/api/v1/lectures/6992dc0a6b280c1595e731eb/segments"
+    assert (await client.get(missing)).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_health_endpoints(client: AsyncClient):
+    live = await client.get("/health/live")
+    assert live.status_code == 200
+
+    ready = await client.get("/health/ready")
+    assert ready.status_code == 200
+    assert ready.json()["services"]["mongodb"]["ok"] is True
+    assert ready.json()["indexes"]["state"] in {"pending", "applied"}
+
+    health = (await client.get("/health")).json()
+    assert health["status"] == "ok"
+    assert set(health["latency_ms"]) == {"mongodb", "redis"}
+    assert "lecture_cache" in health
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient):
+    await client.get("/api/v1/lectures/6992dc0a6b280c1595e731eb")
+    await client.get("/no/such/route")
+
+    resp = await client.get("/metrics")
+
+    assert resp.status_code == 200
+    text = resp.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="get_lecture",status="404"}'
+    ) in text
+    assert 'route="<unmatched>"' in text
+    assert 'lecture_repo_call_duration_seconds_count{method="find_by_id"' in text
+    assert 'redis_pool_connections{state="in_use"}' in text
+    assert 'taskiq_queue_length{queue="taskiq"}' in text
@@ -7,6 +7,7 @@ from httpx import ASGITransport, AsyncClient
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from app.infra.ioc import AppProvider
+from app.infra.repositories.mongo.registry import bootstrap_indexes
 from app.main import app  # Убедись, что путь к FastAPI app верный
 
 
@@ -27,10 +28,9 @@ async def container() -> AsyncIterable[AsyncContainer]:
 @pytest_asyncio.fixture(scope="function")
 async def client(container: AsyncContainer) -> AsyncIterable[AsyncClient]:
     """Тестовый клиент для API, который знает про наш контейнер"""
-    from dishka.integrations.fastapi import setup_dishka
-
-    # Привязываем наш тестовый контейнер к приложению
-    setup_dishka(container, app)
+    # Middleware Dishka уже добавлен в create_app, а повторно добавить его
+    # после первого запроса нельзя — поэтому подменяем только контейнер
+    app.state.dishka_container = container
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
@@ -44,5 +44,7 @@ async def db_client(
 ) -> AsyncIterable[AsyncIOMotorDatabase[Any]]:
     """Фикстура для очистки БД после каждого теста"""
     db = await container.get(AsyncIOMotorDatabase[Any])
+    # Индексы пропадают вместе с базой после каждого теста
+    await bootstrap_indexes(db)
     yield db
     await db.client.drop_database(db.name)
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime
+from typing import Any
+
+import pytest
+from dishka import AsyncContainer
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.domain.entities.lecture import Lecture, LectureStatus
+from app.domain.entities.value_objects import AuthorId, Tag, Title
+from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.infra.repositories.mongo.lecture import MongoLectureRepository
+from app.infra.repositories.redis.lecture_cache import LectureCache
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_single_flight_and_invalidation(container: AsyncContainer):
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        cache = await request_container.get(LectureCache)
+        now = datetime.now()
+        lecture_id = await repo.add(
+            Lecture(
+                author_id=AuthorId("cache_user"),
+                title=Title("Cached"),
+                registered_at=now,
+                updated_at=now,
+            )
+        )
+        stats = cache.stats
+        hits, coalesced = stats.hits, stats.coalesced
+
+        # Параллельные промахи схлопываются в одно чтение из Mongo
+        results = await asyncio.gather(*(repo.find_by_id(lecture_id) for _ in range(5)))
+        assert all(r is not None and r.title.value == "Cached" for r in results)
+        assert len({id(r) for r in results}) == 5
+        assert stats.coalesced - coalesced >= 1
+
+        cached = await repo.find_by_id(lecture_id)
+        assert stats.hits - hits == 1
+
+        # Запись сбрасывает кэш, следующее чтение видит новое состояние
+        assert cached is not None
+        cached.start_processing(at=datetime.now())
+        await repo.save(cached)
+
+        fresh = await repo.find_by_id(lecture_id)
+        assert fresh is not None
+        assert fresh.status == LectureStatus.PROCESSING
+
+
+@pytest.mark.asyncio
+async def test_tag_facets_follow_writes_incrementally(container: AsyncContainer):
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        db = await request_container.get(AsyncIOMotorDatabase[Any])
+        now = datetime.now()
+
+        def make(*tags: str) -> Lecture:
+            return Lecture(
+                author_id=AuthorId("facet_user"),
+                title=Title("Facets"),
+                tags=frozenset(Tag(t) for t in tags),
+                registered_at=now,
+                updated_at=now,
+            )
+
+        first = await repo.add(make("facet_a", "facet_b"))
+        await repo.count_tags()  # строит хэш в Redis
+        await repo.add_many([make("facet_a"), make("facet_c")])
+
+        lecture = await repo.find_by_id(first)
+        assert lecture is not None
+        lecture.update_info(at=datetime.now(), tags=frozenset([Tag("facet_c")]))
+        await repo.save(lecture)
+
+        second = await repo.add(make("facet_b"))
+        # Теги удаляемой лекции читаются без транскрипта
+        summary = await repo.find_summary(second)
+        assert summary is not None
+        assert summary.tags == frozenset([Tag("facet_b")])
+        await repo.delete(second)
+
+        cached = await repo.count_tags()
+        expected = await MongoLectureRepository(db).count_tags()
+        assert cached == expected
+        assert cached[Tag("facet_a")] == 1
+        assert cached[Tag("facet_c")] == 2
+        assert Tag("facet_b") not in cached
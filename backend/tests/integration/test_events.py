@@ -0,0 +1,49 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+from dishka import AsyncContainer
+
+from app.domain.entities.lecture import STARTABLE_STATUSES, Lecture, LectureStatus
+from app.domain.entities.value_objects import AuthorId, Title
+from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.infra.events.lecture_events import LectureEventBroadcaster
+
+
+@pytest.mark.asyncio
+async def test_repo_writes_are_broadcast_to_subscribers(container: AsyncContainer):
+    broadcaster = await container.get(LectureEventBroadcaster)
+
+    async with (
+        container() as request_container,
+        broadcaster.subscribe() as first,
+        broadcaster.subscribe() as second,
+    ):
+        repo = await request_container.get(ILectureRepository)
+        now = datetime.now()
+        lecture_id = await repo.add(
+            Lecture(
+                author_id=AuthorId("events_user"),
+                title=Title("Live"),
+                registered_at=now,
+                updated_at=now,
+            )
+        )
+        await repo.transition_status(
+            lecture_id,
+            from_statuses=STARTABLE_STATUSES,
+            to_status=LectureStatus.PROCESSING,
+            at=datetime.now(),
+        )
+        await repo.delete(lecture_id)
+
+        for queue in (first, second):
+            received = [
+                json.loads(await asyncio.wait_for(queue.get(), 2)) for _ in range(3)
+            ]
+            assert [e["type"] for e in received] == ["created", "updated", "deleted"]
+            assert {e["lecture_id"] for e in received} == {lecture_id.value}
+            assert received[1]["status"] == "processing"
+
+    assert broadcaster.subscribers == 0
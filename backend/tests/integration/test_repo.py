@@ -1,16 +1,32 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Any
 
 import pytest
+from bson import ObjectId
 from dishka import AsyncContainer
+from motor.motor_asyncio import AsyncIOMotorDatabase
 
-from app.domain.entities.lecture import Lecture, LectureStatus
+from app.common.constants import MONGO_LECTURES_COLLECTION, SEGMENT_MAX_SEC
+from app.common.settings import settings
+from app.domain.entities.lecture import (
+    STARTABLE_STATUSES,
+    Lecture,
+    LectureStatus,
+    LectureSummary,
+)
 from app.domain.entities.value_objects import (
     AuthorId,
     LectureId,
     Tag,
     Title,
+    Transcript,
+    TranscriptSegment,
 )
 from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.domain.interfaces.segment_repo import ISegmentRepository
+from app.infra.repositories.mongo.compression import (
+    compress_existing,
+)
 
 
 @pytest.mark.asyncio
@@ -74,3 +90,324 @@ async def test_find_all_with_filters(container: AsyncContainer):
 
         total = await repo.count(author_id=author)
         assert total >= 5
+
+
+@pytest.mark.asyncio
+async def test_find_page_keyset_pagination(container: AsyncContainer):
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        author = AuthorId("author_keyset_test")
+        now = datetime.now()
+
+        # Одинаковый registered_at у всех: порядок держится на _id
+        for i in range(5):
+            await repo.add(
+                Lecture(
+                    author_id=author,
+                    title=Title(f"K {i}"),
+                    registered_at=now,
+                    updated_at=now,
+                )
+            )
+
+        seen: list[str] = []
+        cursor = None
+        while True:
+            page = await repo.find_page(limit=2, cursor=cursor, author_id=author)
+            seen.extend(lecture.id.value for lecture in page.items)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+
+        assert len(seen) == 5
+        assert len(set(seen)) == 5
+
+        failed = await repo.find_page(author_id=author, status=LectureStatus.FAILED)
+        assert failed.items == []
+
+
+@pytest.mark.asyncio
+async def test_add_many(container: AsyncContainer):
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        now = datetime.now()
+        lectures = [
+            Lecture(
+                author_id=AuthorId("bulk_repo_user"),
+                title=Title(f"B {i}"),
+                registered_at=now,
+                updated_at=now,
+            )
+            for i in range(3)
+        ]
+
+        ids = await repo.add_many(lectures)
+
+        assert len(ids) == 3
+        for lecture_id, lecture in zip(ids, lectures, strict=True):
+            stored = await repo.find_by_id(lecture_id)
+            assert stored is not None
+            assert stored.title == lecture.title
+        assert await repo.add_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_transition_status_is_conditional(container: AsyncContainer):
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        now = datetime.now()
+        lecture_id = await repo.add(
+            Lecture(
+                author_id=AuthorId("transition_user"),
+                title=Title("Transition"),
+                registered_at=now,
+                updated_at=now,
+            )
+        )
+
+        started = await repo.transition_status(
+            lecture_id,
+            from_statuses={LectureStatus.PENDING},
+            to_status=LectureStatus.PROCESSING,
+            at=datetime.now(),
+        )
+        assert started is not None
+        assert started.status == LectureStatus.PROCESSING
+
+        # Второй воркер не может забрать ту же лекцию
+        duplicate = await repo.transition_status(
+            lecture_id,
+            from_statuses={LectureStatus.PENDING},
+            to_status=LectureStatus.PROCESSING,
+            at=datetime.now(),
+        )
+        assert duplicate is None
+
+        completed = await repo.transition_status(
+            lecture_id,
+            from_statuses={LectureStatus.PROCESSING},
+            to_status=LectureStatus.COMPLETED,
+            at=datetime.now(),
+            content=Transcript(text="done", language="ru"),
+        )
+        assert completed is not None
+        assert completed.has_content
+
+        stored = await repo.find_by_id(lecture_id)
+        assert stored is not None
+        assert stored.status == LectureStatus.COMPLETED
+        assert stored.content == Transcript(text="done", language="ru")
+
+
+@pytest.mark.asyncio
+async def test_stale_processing_can_be_reclaimed(container: AsyncContainer):
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        started_at = datetime.now() - timedelta(hours=2)
+        lecture_id = await repo.add(
+            Lecture(
+                author_id=AuthorId("lease_user"),
+                title=Title("Lease"),
+                status=LectureStatus.PROCESSING,
+                registered_at=started_at,
+                updated_at=started_at,
+            )
+        )
+
+        async def claim(stale_before: datetime) -> LectureSummary | None:
+            return await repo.transition_status(
+                lecture_id,
+                from_statuses=STARTABLE_STATUSES,
+                to_status=LectureStatus.PROCESSING,
+                at=datetime.now(),
+                stale_before=stale_before,
+            )
+
+        # Лиз еще не истек
+        assert await claim(started_at - timedelta(minutes=1)) is None
+
+        reclaimed = await claim(datetime.now() - timedelta(minutes=30))
+        assert reclaimed is not None
+        assert reclaimed.updated_at > started_at
+
+        # Перехваченная лекция снова свежая: второй перехват не проходит
+        assert await claim(datetime.now() - timedelta(minutes=30)) is None
+
+
+@pytest.mark.asyncio
+async def test_only_claim_holder_finishes_processing(container: AsyncContainer):
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        now = datetime.now()
+        lecture_id = await repo.add(
+            Lecture(
+                author_id=AuthorId("claim_user"),
+                title=Title("Claim"),
+                registered_at=now,
+                updated_at=now,
+            )
+        )
+
+        async def take(token: str, at: datetime) -> LectureSummary | None:
+            return await repo.transition_status(
+                lecture_id,
+                from_statuses=STARTABLE_STATUSES,
+                to_status=LectureStatus.PROCESSING,
+                at=at,
+                stale_before=datetime.now() - timedelta(minutes=30),
+                claim=token,
+            )
+
+        async def finish(token: str) -> LectureSummary | None:
+            return await repo.transition_status(
+                lecture_id,
+                from_statuses={LectureStatus.PROCESSING},
+                to_status=LectureStatus.COMPLETED,
+                at=datetime.now(),
+                claimed_by=token,
+            )
+
+        # Первый воркер завис: его лиз истек, лекцию забрал второй
+        assert await take("slow", now - timedelta(hours=1)) is not None
+        assert await take("fresh", datetime.now()) is not None
+
+        assert await finish("slow") is None
+        finished = await finish("fresh")
+        assert finished is not None
+        assert finished.status == LectureStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_pages_by_cursor(container: AsyncContainer):
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        author = AuthorId("search_user")
+        now = datetime.now()
+
+        texts = {
+            "Графы": "Сегодня разбираем графы. Обход графа в ширину.",
+            "Деревья": "Дерево — частный случай графа без циклов.",
+            "Сортировки": "Быстрая сортировка и сортировка слиянием.",
+        }
+        for title, text in texts.items():
+            await repo.add(
+                Lecture(
+                    author_id=author,
+                    title=Title(title),
+                    content=Transcript(text=text, language="ru"),
+                    registered_at=now,
+                    updated_at=now,
+                )
+            )
+
+        first = await repo.search("граф", limit=1, author_id=author)
+        assert [hit.lecture.title.value for hit in first.items] == ["Графы"]
+        assert first.next_cursor is not None
+
+        hit = first.items[0]
+        assert hit.snippet is not None
+        start, end = hit.snippet.highlights[0]
+        assert hit.snippet.text[start:end].lower().startswith("граф")
+
+        rest = await repo.search(
+            "граф", limit=10, cursor=first.next_cursor, author_id=author
+        )
+        assert [hit.lecture.title.value for hit in rest.items] == ["Деревья"]
+        assert rest.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_segments_time_range_across_buckets(container: AsyncContainer):
+    async with container() as request_container:
+        segments = await request_container.get(ISegmentRepository)
+        lecture_id = LectureId("6992dc0a6b280c1595e731ec")
+
+        # Сегмент 290-310 начинается в первой пачке, но заходит во вторую
+        stored = [
+            TranscriptSegment(start=float(t), end=float(t + 20), text=f"at {t}")
+            for t in range(0, 1200, 10)
+        ]
+        await segments.replace(lecture_id, stored)
+        await segments.replace(lecture_id, stored)
+
+        found = await segments.find_range(lecture_id, 305, 330)
+        assert [s.text for s in found] == ["at 290", "at 300", "at 310", "at 320"]
+
+        # Конец длинной записи: пачки далеко до start не читаются
+        tail = await segments.find_range(lecture_id, 1185, 1200)
+        assert [s.text for s in tail] == ["at 1170", "at 1180", "at 1190"]
+
+        with pytest.raises(ValueError):
+            await segments.replace(
+                lecture_id,
+                [TranscriptSegment(start=0.0, end=SEGMENT_MAX_SEC + 1.0, text="x")],
+            )
+
+        await segments.delete(lecture_id)
+        assert await segments.find_range(lecture_id, 0, 1200) == []
+
+
+@pytest.mark.asyncio
+async def test_large_transcript_roundtrip_through_repo(
+    container: AsyncContainer, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "TRANSCRIPT_COMPRESS_MIN_BYTES", 1024)
+    async with container() as request_container:
+        repo = await request_container.get(ILectureRepository)
+        db = await request_container.get(AsyncIOMotorDatabase[Any])
+        now = datetime.now()
+        text = "длинная расшифровка " * 500
+
+        lecture_id = await repo.add(
+            Lecture(
+                author_id=AuthorId("compress_user"),
+                title=Title("Compressed"),
+                content=Transcript(text=text, language="ru"),
+                registered_at=now,
+                updated_at=now,
+            )
+        )
+
+        raw = await db[MONGO_LECTURES_COLLECTION].find_one(
+            {"_id": ObjectId(lecture_id.value)}
+        )
+        assert raw is not None
+        # В индексируемом поле остается только поисковая копия
+        assert raw["transcript"]["text"] == "длинная расшифровка"
+
+        loaded = await repo.find_by_id(lecture_id)
+        assert loaded is not None and loaded.content is not None
+        assert loaded.content.text == text
+
+        page = await repo.find_summary_page(author_id=AuthorId("compress_user"))
+        assert page.items[0].has_content
+
+
+@pytest.mark.asyncio
+async def test_compression_migration_keeps_transcripts_searchable(
+    container: AsyncContainer, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "TRANSCRIPT_COMPRESS_MIN_BYTES", 1024)
+    async with container() as request_container:
+        db = await request_container.get(AsyncIOMotorDatabase[Any])
+        collection = db[MONGO_LECTURES_COLLECTION]
+        now = datetime.now()
+        await collection.insert_one(
+            {
+                "author_id": "migrate_user",
+                "title": "M",
+                "status": "completed",
+                "registered_at": now,
+                "updated_at": now,
+                "transcript": {"text": "графы и деревья " * 200},
+            }
+        )
+
+        assert (await compress_existing(db, apply=True))[0] == 1
+        # Повторный запуск уже сжатое не трогает
+        assert (await compress_existing(db, apply=True))[0] == 0
+
+        doc = await collection.find_one({"author_id": "migrate_user"})
+        assert doc is not None
+        assert doc["transcript"]["text"] == "графы и деревья"
+        assert "text_z" in doc["transcript"]
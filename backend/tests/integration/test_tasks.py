@@ -1,10 +1,16 @@
 from datetime import datetime
 
 import pytest
+from redis.asyncio import Redis
+from taskiq import InMemoryBroker, TaskiqMessage, TaskiqMiddleware
+from taskiq_redis import ListQueueBroker
 
+from app.common.settings import settings
 from app.domain.entities.lecture import Lecture, LectureStatus
 from app.domain.entities.value_objects import AuthorId, Title
 from app.domain.interfaces.lecture_repo import ILectureRepository
+from app.domain.interfaces.segment_repo import ISegmentRepository
+from app.infra.taskiq.enqueue import kiq_many
 from app.tasks.lecture import process_lecture_task
 
 
@@ -35,3 +41,67 @@ async def test_process_lecture_task_logic(container):
         assert updated is not None
         assert updated.status == LectureStatus.COMPLETED
         assert "расшифровка" in updated.content.text
+
+        segments = await request_container.get(ISegmentRepository)
+        found = await segments.find_range(l_id, 0, 60)
+        assert " ".join(s.text for s in found) == updated.content.text
+
+
+@pytest.mark.asyncio
+async def test_kiq_many_runs_both_middleware_phases():
+    sent: list[tuple[str, object]] = []
+
+    class Recorder(TaskiqMiddleware):
+        def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+            sent.append(("pre", message.args[0]))
+            return message
+
+        def post_send(self, message: TaskiqMessage) -> None:
+            sent.append(("post", message.args[0]))
+
+    memory = InMemoryBroker(await_inplace=True).with_middlewares(Recorder())
+    received: list[int] = []
+
+    @memory.task
+    async def collect(value: int) -> None:
+        received.append(value)
+
+    await kiq_many(collect, ((i,) for i in range(7)))
+
+    assert sorted(received) == list(range(7))
+    assert sorted(v for phase, v in sent if phase == "pre") == list(range(7))
+    assert sorted(v for phase, v in sent if phase == "post") == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_kiq_many_pushes_one_batch_in_order():
+    sent: list[str] = []
+
+    class Recorder(TaskiqMiddleware):
+        def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+            message.labels["recorded"] = "yes"
+            return message
+
+        def post_send(self, message: TaskiqMessage) -> None:
+            sent.append(message.task_id)
+
+    queue_name = "test:kiq_many"
+    broker = ListQueueBroker(str(settings.redis_url), queue_name=queue_name)
+    broker.add_middlewares(Recorder())
+
+    @broker.task
+    async def collect(value: int) -> None: ...
+
+    async with Redis(connection_pool=broker.connection_pool) as redis:
+        await redis.delete(queue_name)
+        await kiq_many(collect, ((i,) for i in range(5)))
+
+        # Воркер забирает BRPOP: первым выходит первый вызов
+        raw = [await redis.rpop(queue_name) for _ in range(5)]
+        assert await redis.llen(queue_name) == 0
+
+    messages = [broker.formatter.loads(item) for item in raw]
+    assert [m.args for m in messages] == [[i] for i in range(5)]
+    assert all(m.labels["recorded"] == "yes" for m in messages)
+    assert sent == [m.task_id for m in messages]
+    await broker.shutdown()
@@ -0,0 +1,45 @@
+import pytest
+
+from app.common.settings import settings
+from app.domain.entities.value_objects import Transcript
+from app.infra.repositories.mongo.compression import (
+    LazyTranscript,
+    transcript_from_doc,
+    transcript_to_doc,
+)
+
+
+@pytest.fixture
+def small_threshold(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "TRANSCRIPT_COMPRESS_MIN_BYTES", 100)
+
+
+def test_large_transcript_is_stored_compressed(small_threshold: None):
+    original = Transcript(text="лекция о графах " * 50, language="ru")
+
+    doc = transcript_to_doc(original)
+    assert doc is not None
+    assert doc["text"] == "лекция о графах"
+    assert len(doc["text_z"]) < len(original.text.encode())
+
+    restored = transcript_from_doc(doc)
+    assert isinstance(restored, LazyTranscript)
+    assert not restored.is_loaded
+    assert restored == original
+    assert restored.is_loaded
+
+
+def test_unread_transcript_is_rewritten_without_recompressing(small_threshold: None):
+    doc = transcript_to_doc(Transcript(text="x" * 500))
+    assert doc is not None
+    restored = transcript_from_doc(doc)
+
+    assert transcript_to_doc(restored) == doc
+    assert isinstance(restored, LazyTranscript)
+    assert not restored.is_loaded
+
+
+def test_small_transcript_stays_plain(small_threshold: None):
+    doc = transcript_to_doc(Transcript(text="коротко"))
+    assert doc == {"language": None, "confidence": None, "text": "коротко"}
+    assert type(transcript_from_doc(doc)) is Transcript
@@ -0,0 +1,37 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+from app.domain.entities.value_objects import InvalidCursorError
+from app.infra.repositories.mongo.cursor import (
+    decode_cursor,
+    decode_score_cursor,
+    encode_cursor,
+    encode_score_cursor,
+)
+
+
+def test_cursor_roundtrip():
+    registered_at = datetime(2026, 2, 1, 12, 30, 15, 123000)
+    last_id = ObjectId()
+
+    token = encode_cursor(registered_at, last_id)
+
+    assert decode_cursor(token) == (registered_at, last_id)
+
+
+def test_score_cursor_roundtrip():
+    last_id = ObjectId()
+
+    token = encode_score_cursor(1.2345678901, last_id)
+
+    assert decode_score_cursor(token) == (1.2345678901, last_id)
+    with pytest.raises(InvalidCursorError):
+        decode_score_cursor(encode_cursor(datetime(2026, 1, 1), last_id))
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "eyJyIjoxfQ", "W10"])
+def test_cursor_rejects_garbage(token: str):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from app.api.v1.encoders import dumps, encode_lecture, encode_summary
+from app.api.v1.schemas.lecture import LectureRead, LectureSummaryRead
+from app.domain.entities.lecture import Lecture, LectureStatus, LectureSummary
+from app.domain.entities.value_objects import (
+    AuthorId,
+    LectureId,
+    Tag,
+    Title,
+    Transcript,
+)
+
+
+def test_encoders_match_pydantic_schemas_byte_for_byte():
+    now = datetime(2024, 5, 1, 10, 30, 0, 123000)
+    lecture = Lecture(
+        id=LectureId("6992dc0a6b280c1595e731eb"),
+        author_id=AuthorId("user"),
+        title=Title("Лекция"),
+        content=Transcript(text="Текст", language="ru", confidence=0.99),
+        tags=frozenset([Tag("a"), Tag("b")]),
+        status=LectureStatus.COMPLETED,
+        registered_at=now,
+        updated_at=now,
+        published_at=now,
+    )
+    summary = LectureSummary(
+        id=LectureId("6992dc0a6b280c1595e731eb"),
+        author_id=AuthorId("user"),
+        title=Title("Лекция"),
+        status=LectureStatus.PENDING,
+        registered_at=now,
+        updated_at=now.replace(microsecond=0),
+    )
+
+    assert (
+        dumps(encode_lecture(lecture))
+        == LectureRead.model_validate(lecture, from_attributes=True)
+        .model_dump_json()
+        .encode()
+    )
+    assert (
+        dumps(encode_summary(summary))
+        == LectureSummaryRead.model_validate(summary).model_dump_json().encode()
+    )
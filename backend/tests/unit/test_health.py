@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.infra.health import HealthMonitor
+
+
+async def _ok() -> None:
+    return None
+
+
+async def _hang() -> None:
+    await asyncio.sleep(10)
+
+
+async def _broken() -> None:
+    raise ConnectionError("refused")
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently_with_deadline():
+    monitor = HealthMonitor(
+        {"fast": _ok, "slow": _hang, "broken": _broken},
+        timeout_sec=0.05,
+        interval_sec=60,
+    )
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    snapshot = await monitor.check()
+
+    # Зависшая проверка ограничена таймаутом и не задерживает остальные
+    assert loop.time() - started < 1
+    assert not snapshot.healthy
+    assert snapshot.probes["fast"].ok
+    assert snapshot.probes["slow"].error == "timed out after 0.05s"
+    assert snapshot.probes["broken"].error == "ConnectionError: refused"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_refreshed_in_background():
+    calls = 0
+
+    async def probe() -> None:
+        nonlocal calls
+        calls += 1
+
+    monitor = HealthMonitor({"db": probe}, timeout_sec=1, interval_sec=0.01)
+    with pytest.raises(RuntimeError):
+        _ = monitor.snapshot
+
+    await monitor.start()
+    first = monitor.snapshot
+    await asyncio.sleep(0.05)
+    await monitor.close()
+
+    assert calls > 1
+    assert monitor.snapshot.checked_at > first.checked_at
+    assert monitor.snapshot.healthy
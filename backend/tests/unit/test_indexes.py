@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any
+
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+
+from app.infra.repositories.mongo.indexes import (
+    CollectionIndexes,
+    Coverage,
+    IndexBootstrap,
+    IndexSpec,
+    IndexState,
+    QueryShape,
+    check_coverage,
+)
+from app.infra.repositories.mongo.registry import MONGO_INDEXES
+
+
+def test_registry_has_no_uncovered_queries():
+    for collection, spec in MONGO_INDEXES.items():
+        for item in check_coverage(collection, spec):
+            assert item.coverage != Coverage.NONE, item.query.name
+
+
+def test_coverage_rating():
+    sort = (("registered_at", DESCENDING),)
+    spec = CollectionIndexes(
+        indexes=(
+            IndexSpec(name="a_r", keys=(("a", ASCENDING), *sort)),
+            IndexSpec(name="b", keys=(("b", ASCENDING),)),
+        ),
+        queries=(
+            QueryShape(name="by_a_sorted", equality=("a",), sort=sort),
+            QueryShape(name="reverse_sort", sort=(("registered_at", ASCENDING),)),
+            QueryShape(name="by_b_sorted", equality=("b",), sort=sort),
+            QueryShape(name="by_c", equality=("c",)),
+        ),
+    )
+
+    result = {item.query.name: item for item in check_coverage("x", spec)}
+
+    assert result["by_a_sorted"].coverage == Coverage.FULL
+    assert result["by_a_sorted"].index_name == "a_r"
+    assert result["reverse_sort"].coverage == Coverage.NONE
+    assert result["by_b_sorted"].coverage == Coverage.PARTIAL
+    assert result["by_c"].coverage == Coverage.NONE
+
+
+class FlakyCollection:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    async def create_indexes(self, models: list[Any]) -> list[str]:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise OperationFailure("Index already exists with different options")
+        return [model.document["name"] for model in models]
+
+
+async def test_bootstrap_retries_in_background_until_applied():
+    collection = FlakyCollection(failures=2)
+    spec = CollectionIndexes(indexes=(IndexSpec(name="a", keys=(("a", ASCENDING),)),))
+    bootstrap = IndexBootstrap(
+        {"x": collection},  # type: ignore[arg-type]
+        {"x": spec},
+        retry_sec=0.01,
+    )
+    assert bootstrap.state == IndexState.PENDING
+
+    bootstrap.start()
+    await asyncio.sleep(0)
+    assert bootstrap.state == IndexState.FAILED
+    assert bootstrap.error is not None and "different options" in bootstrap.error
+
+    for _ in range(100):
+        if bootstrap.state == IndexState.APPLIED:
+            break
+        await asyncio.sleep(0.01)
+    assert bootstrap.state == IndexState.APPLIED
+    assert bootstrap.report is not None
+    assert bootstrap.report.applied == {"x": ["a"]}
+    assert bootstrap.error is None
+    assert collection.calls == 3
+    await bootstrap.close()
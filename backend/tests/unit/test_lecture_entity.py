@@ -47,3 +47,22 @@ def test_lecture_status_transitions():
 def test_tag_normalization():
     tag = Tag("  PyThOn  ")
     assert tag.value == "python"
+
+
+def test_lecture_tracks_dirty_fields():
+    now = datetime.now()
+    lecture = Lecture(
+        author_id=AuthorId("1"), title=Title("Test"), registered_at=now, updated_at=now
+    )
+    assert lecture.dirty_fields == frozenset()
+
+    lecture.start_processing(at=now)
+    assert lecture.dirty_fields == {"status", "updated_at"}
+
+    lecture.mark_clean()
+    lecture.complete(Transcript(text="hi"), at=now)
+    assert lecture.dirty_fields == {"content", "status", "published_at", "updated_at"}
+
+    lecture.mark_clean()
+    lecture.update_info(at=now, tags=frozenset([Tag("new")]))
+    assert lecture.dirty_fields == {"tags", "updated_at"}
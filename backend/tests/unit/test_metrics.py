@@ -0,0 +1,100 @@
+from types import SimpleNamespace
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.infra.metrics.pools import (
+    MongoPoolListener,
+    QueueLengthCollector,
+    RedisPoolCollector,
+)
+from app.infra.metrics.registry import Gauge, Histogram, MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    )
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.1, "/a")
+    histogram.observe(3.0, "/a")
+    histogram.observe(0.5, '/b"')
+
+    text = registry.render()
+
+    assert "# TYPE latency_seconds histogram" in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'latency_seconds_sum{route="/a"} 3.15' in text
+    assert 'latency_seconds_count{route="/a"} 3' in text
+    assert 'latency_seconds_count{route="/b\\""} 1' in text
+
+
+@pytest.mark.asyncio
+async def test_mongo_pool_listener_counts_connections():
+    registry = MetricsRegistry()
+    gauge = registry.register(Gauge("pool", "Pool", ("address", "state")))
+    listener = MongoPoolListener(gauge)
+    registry.add_collector(listener.collect)
+    event = SimpleNamespace(address=("mongo", 27017))
+
+    for _ in range(3):
+        listener.connection_created(event)  # type: ignore[arg-type]
+    listener.connection_checked_out(event)  # type: ignore[arg-type]
+    listener.connection_checked_out(event)  # type: ignore[arg-type]
+    listener.connection_checked_in(event)  # type: ignore[arg-type]
+    listener.connection_closed(event)  # type: ignore[arg-type]
+    await registry.collect()
+
+    assert gauge.get("mongo:27017", "in_use") == 1
+    assert gauge.get("mongo:27017", "available") == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_collector_is_skipped_and_counted():
+    class FlakyRedis:
+        connected = True
+
+        async def llen(self, name: str) -> int:
+            if not self.connected:
+                raise RedisConnectionError("Connection refused")
+            return 1
+
+    redis = FlakyRedis()
+    registry = MetricsRegistry()
+    gauge = registry.register(Gauge("queue_length", "Queue", ("queue",)))
+    queue = QueueLengthCollector(redis, "queue", gauge)  # type: ignore[arg-type]
+    registry.add_collector(queue.collect, gauge)
+
+    await registry.collect()
+    assert gauge.get("queue") == 1
+
+    redis.connected = False
+    await registry.collect()
+
+    # Устаревшее значение не выгружается, ошибка видна в счетчике
+    assert gauge.get("queue") is None
+    assert registry.collector_errors.get("QueueLengthCollector.collect") == 1
+    text = registry.render()
+    assert (
+        'metrics_collector_errors_total{collector="QueueLengthCollector.collect"} 1'
+        in text
+    )
+    assert "queue_length{" not in text
+
+
+@pytest.mark.asyncio
+async def test_redis_pool_collector_without_private_pool_state():
+    registry = MetricsRegistry()
+    gauge = registry.register(Gauge("pool", "Pool", ("state",)))
+    redis = SimpleNamespace(connection_pool=SimpleNamespace(max_connections=10))
+    collector = RedisPoolCollector(redis, gauge)  # type: ignore[arg-type]
+    registry.add_collector(collector.collect, gauge)
+
+    await registry.collect()
+
+    assert gauge.get("max") == 10
+    assert gauge.get("in_use") is None
+    assert registry.collector_errors.get("RedisPoolCollector.collect") == 0
@@ -0,0 +1,44 @@
+from app.infra.repositories.mongo.search import (
+    SNIPPET_RADIUS,
+    build_snippet,
+    highlight_pattern,
+    search_terms,
+    snippet_from_text,
+)
+
+
+def test_search_terms_skip_negated_and_short_words():
+    assert search_terms('Лекция "теория графов" -python и') == [
+        "лекция",
+        "теория",
+        "графов",
+    ]
+
+
+def test_snippet_highlights_inflected_forms():
+    pattern = highlight_pattern(["лекция"])
+    assert pattern is not None
+
+    snippet = build_snippet({"text": "На Лекциях и лекции", "offset": 40}, pattern)
+
+    assert snippet is not None
+    assert snippet.offset == 40
+    assert [snippet.text[a:b] for a, b in snippet.highlights] == ["Лекц", "лекц"]
+
+
+def test_no_snippet_without_terms():
+    assert highlight_pattern([]) is None
+    assert build_snippet({"text": "x", "offset": 0}, None) is None
+
+
+def test_snippet_from_decompressed_text_matches_server_window():
+    text = "вступление " * 20 + "про графы и лекции " + "заключение " * 20
+    pattern = highlight_pattern(["графы"])
+
+    snippet = snippet_from_text(text, pattern)
+
+    assert snippet is not None
+    assert snippet.offset == text.index("графы") - SNIPPET_RADIUS
+    assert len(snippet.text) == 2 * SNIPPET_RADIUS
+    assert [snippet.text[a:b] for a, b in snippet.highlights] == ["граф"]
+    assert snippet_from_text("ничего похожего", pattern) is None
@@ -0,0 +1,7 @@
+# Audio
+# Формат, в котором аудио попадает в модель: 16 кГц, моно, s16le
+SAMPLE_RATE = 16_000
+SAMPLE_WIDTH = 2
+
+# Storage
+S3_STREAM_CHUNK_SIZE = 1024 * 1024
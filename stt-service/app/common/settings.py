@@ -0,0 +1,62 @@
+import tempfile
+from pathlib import Path
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    # fake — движок без модели, для локального запуска без GPU и весов
+    STT_ENGINE: Literal["transformers", "fake"] = "transformers"
+    STT_MODEL_NAME: str = "openai/whisper-small"
+    # auto — cuda, если доступна, иначе cpu
+    STT_DEVICE: str = "auto"
+    STT_LANGUAGE: str = "ru"
+
+    # Длина синтетической записи для прогрева модели при старте; 0 — без прогрева
+    STT_WARMUP_SEC: float = 2.0
+
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+
+    # Лимит кэша готовых результатов (сжатый JSON в Redis); 0 отключает кэш
+    STT_RESULT_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+    S3_ENDPOINT_URL: str | None = None
+    S3_BUCKET: str = "lectures"
+
+    # Рабочий каталог для аудио; по умолчанию /dev/shm (tmpfs), если он есть
+    STT_SCRATCH_DIR: Path | None = None
+    # Локальный кэш скачанного и сконвертированного аудио. Каталог по
+    # умолчанию на диске, а не в tmpfs: кэш не должен занимать память
+    STT_AUDIO_CACHE_DIR: Path | None = None
+    # Лимит кэша; 0 отключает кэш (файлы удаляются после задачи)
+    STT_AUDIO_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
+
+    STT_MAX_BATCH_SIZE: int = 8
+    STT_MAX_BATCH_WAIT_SEC: float = 0.05
+
+    model_config = SettingsConfigDict(
+        env_file=".env", extra="ignore", env_file_encoding="utf-8"
+    )
+
+    @property
+    def redis_url(self) -> str:
+        return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+
+    @property
+    def scratch_dir(self) -> Path:
+        if self.STT_SCRATCH_DIR is not None:
+            return self.STT_SCRATCH_DIR
+        shm = Path("/dev/shm")
+        return shm if shm.is_dir() else Path(tempfile.gettempdir())
+
+    @property
+    def audio_cache_dir(self) -> Path:
+        if self.STT_AUDIO_CACHE_DIR is not None:
+            return self.STT_AUDIO_CACHE_DIR
+        return Path(tempfile.gettempdir()) / "stt-audio-cache"
+
+
+settings = Settings()
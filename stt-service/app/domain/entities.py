@@ -1,6 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from app.domain.value_objects import TranscriptionResult, TranscriptionStatus
+from app.domain.value_objects import (
+    PipelineStage,
+    StageSpan,
+    TranscriptionResult,
+    TranscriptionStatus,
+)
 
 
 @dataclass
@@ -12,6 +17,7 @@ class TranscriptionTask:
     status: TranscriptionStatus = TranscriptionStatus.PENDING
     result: TranscriptionResult | None = None
     error_message: str | None = None
+    spans: list[StageSpan] = field(default_factory=list)
 
     def update_status(self, status: TranscriptionStatus) -> None:
         self.status = status
@@ -23,3 +29,14 @@ class TranscriptionTask:
     def set_failed(self, error: str) -> None:
         self.error_message = error
         self.status = TranscriptionStatus.FAILED
+
+    def add_span(self, span: StageSpan) -> None:
+        self.spans.append(span)
+
+    @property
+    def real_time_factor(self) -> float | None:
+        """RTF распознавания: время transcribe / длительность аудио."""
+        for span in self.spans:
+            if span.stage == PipelineStage.TRANSCRIBE:
+                return span.real_time_factor
+        return None
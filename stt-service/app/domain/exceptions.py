@@ -15,3 +15,8 @@ class StorageFileNotFoundError(DomainError):
 class STTProcessingError(DomainError):
     def __init__(self, details: str) -> None:
         self.message = f"GPU processing failed: {details}"
+
+
+class AudioDecodeError(DomainError):
+    def __init__(self, details: str) -> None:
+        self.message = f"Audio decoding failed: {details}"
@@ -1,14 +1,37 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Sequence
 from pathlib import Path
 
 from app.domain.entities import TranscriptionTask
-from app.domain.value_objects import AudioSegment, TranscriptionSegment
+from app.domain.value_objects import (
+    AudioSegment,
+    BatchStats,
+    DecodedAudio,
+    ResultCacheKey,
+    SpeechRegion,
+    TranscriptionProgress,
+    TranscriptionResult,
+    TranscriptionSegment,
+)
 
 
 class IStorage(ABC):
     @abstractmethod
     async def download(self, s3_key: str) -> Path: ...
 
+    @abstractmethod
+    def stream(self, s3_key: str) -> AsyncIterator[bytes]:
+        """Содержимое объекта кусками, по мере чтения из хранилища."""
+        ...
+
+    @abstractmethod
+    async def fingerprint(self, s3_key: str) -> str:
+        """
+        Идентификатор содержимого объекта (ETag и размер) без скачивания:
+        одинаковые загрузки дают одинаковый fingerprint.
+        """
+        ...
+
     @abstractmethod
     async def delete_local(self, local_path: Path) -> None: ...
 
@@ -20,10 +43,78 @@ class IAudioProcessor(ABC):
     @abstractmethod
     async def convert_to_stt(self, local_path: Path) -> Path: ...
 
+    @property
+    def conversion_params(self) -> str:
+        """Формат выхода convert_to_stt/decode_stream (для ключа кэша)."""
+        return ""
+
+    @abstractmethod
+    async def decode_stream(self, chunks: AsyncIterator[bytes]) -> DecodedAudio:
+        """
+        Декодирует поток байт исходного файла сразу в формат модели.
+        Бросает AudioDecodeError, если формат нельзя читать потоком
+        (например, mp4 с индексом в конце файла).
+        """
+        ...
+
+
+class IVoiceActivityDetector(ABC):
+    @abstractmethod
+    async def detect_speech(self, local_path: Path) -> list[SpeechRegion]: ...
+
 
 class ISTTEngine(ABC):
+    """
+    Жизненный цикл: import_runtime -> load -> (transcribe...) -> unload.
+    Движкам без тяжелых зависимостей и весов эти шаги не нужны.
+    """
+
+    async def import_runtime(self) -> None:  # noqa: B027
+        """Импорт тяжелых модулей (torch и т.п.), отложенный до старта."""
+
+    async def load(self) -> None:  # noqa: B027
+        """Загрузка весов на устройство."""
+
+    async def unload(self) -> None:  # noqa: B027
+        """Освобождение памяти устройства."""
+
+    @property
+    def is_loaded(self) -> bool:
+        return True
+
+    @property
+    def params(self) -> dict[str, str]:
+        """Параметры, от которых зависит результат (для ключа кэша)."""
+        return {}
+
     @abstractmethod
-    async def transcribe(self, segment: AudioSegment) -> list[TranscriptionSegment]: ...
+    async def transcribe(self, segment: AudioSegment) -> list[TranscriptionSegment]:
+        """
+        Распознает участок [start_offset, end_offset] файла. Смещения в
+        результате — относительно segment.start_offset.
+        """
+        ...
+
+    async def transcribe_stream(
+        self, segment: AudioSegment
+    ) -> AsyncIterator[TranscriptionSegment]:
+        """
+        То же, что transcribe, но сегменты отдаются по мере декодирования.
+        По умолчанию — весь результат transcribe разом; потоковые движки
+        переопределяют.
+        """
+        for result in await self.transcribe(segment):
+            yield result
+
+    async def transcribe_batch(
+        self, segments: Sequence[AudioSegment]
+    ) -> list[list[TranscriptionSegment]]:
+        """
+        Один проход модели по пачке участков; результаты в порядке входа.
+        По умолчанию участки распознаются по очереди — движки с настоящим
+        батчингом переопределяют.
+        """
+        return [await self.transcribe(segment) for segment in segments]
 
     @property
     @abstractmethod
@@ -32,4 +123,68 @@ class ISTTEngine(ABC):
 
 class INotifier(ABC):
     @abstractmethod
-    async def notify_status(self, task: TranscriptionTask) -> None: ...
+    async def notify_status(self, task: TranscriptionTask) -> None:
+        """
+        Смена статуса. Сегменты COMPLETED-задачи уже ушли через
+        notify_progress, поэтому финальное сообщение может их не повторять:
+        task.result.full_text — окончательный текст после склейки.
+        """
+        ...
+
+    @abstractmethod
+    async def notify_progress(
+        self, task: TranscriptionTask, progress: TranscriptionProgress
+    ) -> None: ...
+
+
+class IMetricsSink(ABC):
+    @abstractmethod
+    async def record_task(self, task: TranscriptionTask, model_name: str) -> None:
+        """Вызывается один раз по завершении задачи, со всеми ее spans."""
+        ...
+
+    @abstractmethod
+    async def record_cache_lookup(self, hit: bool, model_name: str) -> None: ...
+
+    @abstractmethod
+    async def record_batch(self, stats: BatchStats, model_name: str) -> None:
+        """
+        Вызывается после каждого прохода модели в BatchingSTTEngine,
+        в том числе упавшего (stats.failed).
+        """
+        ...
+
+
+class IResultCache(ABC):
+    """
+    Кэш готовых результатов. Ошибки самого кэша не должны валить задачу:
+    реализация отдает None / молча не сохраняет.
+    """
+
+    @abstractmethod
+    async def get(self, key: ResultCacheKey) -> TranscriptionResult | None: ...
+
+    @abstractmethod
+    async def put(self, key: ResultCacheKey, result: TranscriptionResult) -> None: ...
+
+
+class IAudioCache(ABC):
+    """
+    Локальный кэш аудиофайлов задач. Выданный файл закреплен за вызывающим
+    до release и не вытесняется.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str) -> Path | None: ...
+
+    @abstractmethod
+    async def put(self, key: str, local_path: Path) -> Path:
+        """
+        Переносит файл в кэш и возвращает закрепленный путь к нему. Если
+        ключ уже есть (параллельная задача успела раньше), local_path
+        удаляется и выдается существующий файл.
+        """
+        ...
+
+    @abstractmethod
+    async def release(self, local_path: Path) -> None: ...
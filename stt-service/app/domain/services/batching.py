@@ -0,0 +1,204 @@
+"""
+Динамический батчинг запросов к модели из параллельных задач.
+
+Вызовы transcribe встают в общую очередь; планировщик забирает первый
+участок и добирает к нему остальные, пока пачка не наберет
+max_batch_size или первый участок не прождет max_wait_sec, после чего
+делает один transcribe_batch вложенного движка и раздает результаты.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
+
+from app.domain.exceptions import STTProcessingError
+from app.domain.interfaces import IMetricsSink, ISTTEngine
+from app.domain.value_objects import AudioSegment, BatchStats, TranscriptionSegment
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SchedulerStats:
+    batches: int = 0
+    segments: int = 0
+    busy_sec: float = 0.0
+    started_at: float | None = None
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.segments / self.batches if self.batches else 0.0
+
+    @property
+    def utilisation(self) -> float:
+        """Доля времени с момента старта, когда модель была занята."""
+        if self.started_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self.started_at
+        return min(1.0, self.busy_sec / elapsed) if elapsed else 0.0
+
+
+@dataclass
+class _Request:
+    segment: AudioSegment
+    enqueued_at: float
+    future: asyncio.Future[list[TranscriptionSegment]]
+
+
+class BatchingSTTEngine(ISTTEngine):
+    """
+    Обертка над ISTTEngine с тем же интерфейсом: TranscriptionService
+    не знает, что его участки распознаются вместе с чужими. Жизненный
+    цикл (import_runtime/load/unload) — вложенного движка.
+    """
+
+    def __init__(
+        self,
+        inner: ISTTEngine,
+        metrics: IMetricsSink,
+        *,
+        max_batch_size: int = 8,
+        max_wait_sec: float = 0.05,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+        self._inner = inner
+        self._metrics = metrics
+        self._max_batch_size = max_batch_size
+        self._max_wait_sec = max_wait_sec
+        self._queue: asyncio.Queue[_Request] = asyncio.Queue()
+        # Участки, уже взятые из очереди планировщиком, до раздачи результатов
+        self._taken: list[_Request] = []
+        self._worker: asyncio.Task[None] | None = None
+        self.stats = SchedulerStats()
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    @property
+    def params(self) -> dict[str, str]:
+        return self._inner.params
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._inner.is_loaded
+
+    async def import_runtime(self) -> None:
+        await self._inner.import_runtime()
+
+    async def load(self) -> None:
+        await self._inner.load()
+
+    async def unload(self) -> None:
+        await self._inner.unload()
+
+    async def transcribe(self, segment: AudioSegment) -> list[TranscriptionSegment]:
+        if self._worker is None:
+            self.stats.started_at = time.monotonic()
+            self._worker = asyncio.create_task(self._run())
+        future: asyncio.Future[list[TranscriptionSegment]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._queue.put_nowait(_Request(segment, time.monotonic(), future))
+        return await future
+
+    async def transcribe_stream(
+        self, segment: AudioSegment
+    ) -> AsyncIterator[TranscriptionSegment]:
+        if type(self._inner).transcribe_stream is ISTTEngine.transcribe_stream:
+            # Движок и так отдает участок целиком: идем через пачки
+            for result in await self.transcribe(segment):
+                yield result
+            return
+        # Потоковое декодирование одного участка в пачку не собрать —
+        # в обход очереди, чтобы сегменты шли по мере готовности
+        async for result in self._inner.transcribe_stream(segment):
+            yield result
+
+    async def transcribe_batch(
+        self, segments: Sequence[AudioSegment]
+    ) -> list[list[TranscriptionSegment]]:
+        # Участки встают в общую очередь по отдельности и могут попасть
+        # в разные пачки вместе с участками других задач
+        return list(await asyncio.gather(*(self.transcribe(s) for s in segments)))
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        pending, self._taken = self._taken, []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for request in pending:
+            if not request.future.done():
+                request.future.set_exception(RuntimeError("STT engine closed"))
+
+    async def _collect(self) -> list[_Request]:
+        batch = self._taken = [await self._queue.get()]
+        deadline = batch[0].enqueued_at + self._max_wait_sec
+        while len(batch) < self._max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                # Срок вышел, но то, что уже лежит в очереди, забираем
+                while len(batch) < self._max_batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except TimeoutError:
+                break
+        # Отмененные вызывающими участки в модель не отправляем
+        return [r for r in batch if not r.future.done()]
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+
+            started = time.monotonic()
+            failed = True
+            try:
+                results = await self._inner.transcribe_batch([r.segment for r in batch])
+                if len(results) != len(batch):
+                    raise STTProcessingError(
+                        f"{len(results)} results for a batch of {len(batch)}"
+                    )
+                failed = False
+            except Exception as e:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+            finally:
+                # Упавшие и отмененные проходы тоже занимали модель
+                await self._record(batch, started, failed)
+
+            for request, result in zip(batch, results, strict=True):
+                if not request.future.done():
+                    request.future.set_result(result)
+
+    async def _record(
+        self, batch: list[_Request], started: float, failed: bool
+    ) -> None:
+        run_sec = time.monotonic() - started
+        self.stats.batches += 1
+        self.stats.segments += len(batch)
+        self.stats.busy_sec += run_sec
+        stats = BatchStats(
+            size=len(batch),
+            audio_sec=sum(r.segment.end_offset - r.segment.start_offset for r in batch),
+            max_queue_wait_sec=started - batch[0].enqueued_at,
+            run_sec=run_sec,
+            failed=failed,
+        )
+        try:
+            await self._metrics.record_batch(stats, self.model_name)
+        except Exception:
+            logger.exception("Failed to record batch metrics")
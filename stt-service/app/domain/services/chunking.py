@@ -0,0 +1,210 @@
+"""
+Разбиение длинной записи на куски по паузам и склейка результатов.
+
+Куски перекрываются на overlap_sec с каждой стороны от точки разреза:
+слово на границе целиком попадает хотя бы в один кусок. При склейке каждый
+сегмент достается тому куску, на чьей стороне разреза лежит его середина,
+а повтор слов на стыке дополнительно срезается по тексту.
+"""
+
+import asyncio
+import re
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from app.domain.interfaces import ISTTEngine
+from app.domain.value_objects import AudioSegment, SpeechRegion, TranscriptionSegment
+
+# Сколько слов на стыке сравнивать при срезании повтора
+MAX_OVERLAP_WORDS = 8
+
+_WORD = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class ChunkingPolicy:
+    max_chunk_sec: float = 30.0
+    # Кусок короче min_chunk_sec не режется по паузе: лучше дотянуть до следующей
+    min_chunk_sec: float = 10.0
+    overlap_sec: float = 1.0
+    # Паузы короче этой — не место для разреза
+    min_silence_sec: float = 0.3
+    workers: int = 4
+
+    def __post_init__(self) -> None:
+        if self.max_chunk_sec <= 2 * self.overlap_sec:
+            raise ValueError("max_chunk_sec must exceed twice overlap_sec")
+        if self.workers < 1:
+            raise ValueError("workers must be positive")
+
+
+def _silence_midpoints(
+    speech: Sequence[SpeechRegion], duration: float, min_silence_sec: float
+) -> list[float]:
+    midpoints = []
+    silence_start = 0.0
+    for region in sorted(speech, key=lambda r: r.start):
+        if region.start - silence_start >= min_silence_sec:
+            midpoints.append((silence_start + region.start) / 2)
+        silence_start = max(silence_start, region.end)
+    if duration - silence_start >= min_silence_sec:
+        midpoints.append((silence_start + duration) / 2)
+    return midpoints
+
+
+def plan_chunks(
+    local_path: Path,
+    duration: float,
+    speech: Sequence[SpeechRegion],
+    policy: ChunkingPolicy,
+) -> list[AudioSegment]:
+    """
+    Куски не длиннее policy.max_chunk_sec (с учетом перекрытий). Режем в
+    самой поздней подходящей паузе, без нее — жестко по лимиту. Если VAD
+    нашел речь, куски без речи пропускаются.
+    """
+    if duration <= policy.max_chunk_sec:
+        return [AudioSegment(local_path, start_offset=0.0, end_offset=duration)]
+
+    overlap = policy.overlap_sec
+    # Пустой результат VAD — разметки нет, а не сплошная тишина
+    midpoints = (
+        _silence_midpoints(speech, duration, policy.min_silence_sec) if speech else []
+    )
+
+    cuts = [0.0]
+    while duration - cuts[-1] > policy.max_chunk_sec - overlap:
+        start = cuts[-1]
+        # Первый кусок перекрывается только справа, остальные — с двух сторон
+        limit = start + policy.max_chunk_sec - (overlap if start else 0) - overlap
+        candidates = [
+            m for m in midpoints if start + policy.min_chunk_sec <= m <= limit
+        ]
+        cuts.append(max(candidates) if candidates else limit)
+    cuts.append(duration)
+
+    chunks = []
+    for left, right in zip(cuts, cuts[1:], strict=False):
+        start = max(left - overlap, 0.0)
+        end = min(right + overlap, duration)
+        if speech and not any(r.end > start and r.start < end for r in speech):
+            continue
+        chunks.append(AudioSegment(local_path, start_offset=start, end_offset=end))
+    return chunks
+
+
+type ProgressCallback = Callable[[list[TranscriptionSegment], float], Awaitable[None]]
+
+
+def _ownership(chunks: Sequence[AudioSegment], i: int) -> tuple[float, float]:
+    """
+    Участок, за который отвечает кусок: граница с соседом — середина
+    перекрытия (точка разреза).
+    """
+    chunk = chunks[i]
+    lower = (chunks[i - 1].end_offset + chunk.start_offset) / 2 if i else 0.0
+    upper = (
+        (chunk.end_offset + chunks[i + 1].start_offset) / 2
+        if i + 1 < len(chunks)
+        else chunk.end_offset
+    )
+    return lower, upper
+
+
+def _to_absolute(
+    chunk: AudioSegment, segment: TranscriptionSegment
+) -> TranscriptionSegment:
+    return replace(
+        segment,
+        start_offset=chunk.start_offset + segment.start_offset,
+        end_offset=chunk.start_offset + segment.end_offset,
+    )
+
+
+def _owns(
+    chunks: Sequence[AudioSegment], i: int, segment: TranscriptionSegment
+) -> bool:
+    lower, upper = _ownership(chunks, i)
+    center = (segment.start_offset + segment.end_offset) / 2
+    # Крайние куски забирают и то, что выходит за края записи
+    return (i == 0 or center >= lower) and (i + 1 == len(chunks) or center < upper)
+
+
+async def transcribe_chunks(
+    engine: ISTTEngine,
+    chunks: Sequence[AudioSegment],
+    workers: int,
+    on_progress: ProgressCallback | None = None,
+    duration: float | None = None,
+) -> list[list[TranscriptionSegment]]:
+    """
+    Не больше workers вызовов engine одновременно; порядок как у chunks.
+    on_progress получает сегменты по мере декодирования — уже в абсолютных
+    смещениях и только принадлежащие своему куску — и сколько секунд
+    записи добавилось к обработанному. С duration тишина после последнего
+    куска (пропущенная plan_chunks) тоже засчитывается обработанной.
+    """
+    semaphore = asyncio.Semaphore(workers)
+    if on_progress is not None and duration is not None and not chunks:
+        await on_progress([], duration)
+
+    async def run(i: int) -> list[TranscriptionSegment]:
+        chunk = chunks[i]
+        lower, upper = _ownership(chunks, i)
+        if duration is not None and i + 1 == len(chunks):
+            upper = max(upper, duration)
+        segments = []
+        done = lower
+        async with semaphore:
+            async for segment in engine.transcribe_stream(chunk):
+                segments.append(segment)
+                if on_progress is None:
+                    continue
+                absolute = _to_absolute(chunk, segment)
+                reached = min(max(absolute.end_offset, done), upper)
+                owned = [absolute] if _owns(chunks, i, absolute) else []
+                await on_progress(owned, reached - done)
+                done = reached
+        if on_progress is not None and done < upper:
+            await on_progress([], upper - done)
+        return segments
+
+    return list(await asyncio.gather(*(run(i) for i in range(len(chunks)))))
+
+
+def _words(text: str) -> list[str]:
+    return [w.lower() for w in _WORD.findall(text)]
+
+
+def _trim_repeated_prefix(previous: str, text: str) -> str:
+    """Убирает из начала text слова, которыми заканчивается previous."""
+    tail, head = _words(previous), _words(text)
+    for size in range(min(len(tail), len(head), MAX_OVERLAP_WORDS), 0, -1):
+        if tail[-size:] == head[:size]:
+            matches = list(_WORD.finditer(text))
+            return text[matches[size - 1].end() :].lstrip(" ,.;:!?-—")
+    return text
+
+
+def merge_chunks(
+    chunks: Sequence[AudioSegment], results: Sequence[Sequence[TranscriptionSegment]]
+) -> list[TranscriptionSegment]:
+    """
+    Склеивает результаты кусков. Смещения сегментов engine отдает
+    относительно начала куска; здесь они переводятся в абсолютные.
+    """
+    merged: list[TranscriptionSegment] = []
+    for i, (chunk, segments) in enumerate(zip(chunks, results, strict=True)):
+        for segment in segments:
+            absolute = _to_absolute(chunk, segment)
+            if not _owns(chunks, i, absolute):
+                continue
+
+            if merged and absolute.start_offset < merged[-1].end_offset:
+                text = _trim_repeated_prefix(merged[-1].text, absolute.text)
+                if not text:
+                    continue
+                absolute = replace(absolute, text=text)
+            merged.append(absolute)
+    return merged
@@ -0,0 +1,59 @@
+import time
+
+from app.domain.entities import TranscriptionTask
+from app.domain.interfaces import INotifier
+from app.domain.value_objects import TranscriptionProgress, TranscriptionSegment
+
+
+class ProgressBatcher:
+    """
+    Копит промежуточные сегменты и отправляет их через notify_progress
+    порциями: не чаще раза в max_interval_sec, если порция не набрала
+    max_segments раньше.
+    """
+
+    def __init__(
+        self,
+        notifier: INotifier,
+        task: TranscriptionTask,
+        duration_sec: float,
+        *,
+        max_segments: int = 20,
+        max_interval_sec: float = 1.0,
+    ) -> None:
+        self._notifier = notifier
+        self._task = task
+        self._duration_sec = duration_sec
+        self._max_segments = max_segments
+        self._max_interval_sec = max_interval_sec
+        self._pending: list[TranscriptionSegment] = []
+        self._processed_sec = 0.0
+        self._reported_sec = 0.0
+        self._flushed_at = time.monotonic()
+
+    async def add(
+        self, segments: list[TranscriptionSegment], processed_sec: float
+    ) -> None:
+        self._pending.extend(segments)
+        self._processed_sec += processed_sec
+        if (
+            len(self._pending) >= self._max_segments
+            or time.monotonic() - self._flushed_at >= self._max_interval_sec
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending and self._processed_sec == self._reported_sec:
+            return
+        # Забираем порцию до await: параллельные куски продолжают добавлять
+        batch, self._pending = self._pending, []
+        self._reported_sec = self._processed_sec
+        self._flushed_at = time.monotonic()
+        await self._notifier.notify_progress(
+            self._task,
+            TranscriptionProgress(
+                segments=batch,
+                processed_sec=self._processed_sec,
+                duration_sec=self._duration_sec,
+            ),
+        )
@@ -0,0 +1,54 @@
+import resource
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.domain.entities import TranscriptionTask
+from app.domain.value_objects import PipelineStage, StageSpan
+
+# ru_maxrss в Linux в килобайтах, в macOS — в байтах
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _cpu_time() -> float:
+    # Свое время процесса плюс завершенные дочерние процессы (ffmpeg)
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _peak_rss() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+class SpanMeter:
+    """Открытый замер: этап дописывает объем данных и длительность аудио."""
+
+    def __init__(self) -> None:
+        self.bytes_processed: int | None = None
+        self.audio_sec: float | None = None
+
+
+@contextmanager
+def measure_stage(task: TranscriptionTask, stage: PipelineStage) -> Iterator[SpanMeter]:
+    """Пишет StageSpan в task, в том числе если этап упал."""
+    meter = SpanMeter()
+    failed = True
+    wall_started = time.perf_counter()
+    cpu_started = _cpu_time()
+    try:
+        yield meter
+        failed = False
+    finally:
+        task.add_span(
+            StageSpan(
+                stage=stage,
+                wall_sec=time.perf_counter() - wall_started,
+                cpu_sec=_cpu_time() - cpu_started,
+                peak_rss_bytes=_peak_rss(),
+                bytes_processed=meter.bytes_processed,
+                audio_sec=meter.audio_sec,
+                failed=failed,
+            )
+        )
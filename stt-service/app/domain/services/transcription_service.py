@@ -1,9 +1,30 @@
+from dataclasses import asdict
 from pathlib import Path
 
 from app.domain.entities import TranscriptionTask
-from app.domain.interfaces import IAudioProcessor, INotifier, IStorage, ISTTEngine
+from app.domain.exceptions import AudioDecodeError
+from app.domain.interfaces import (
+    IAudioCache,
+    IAudioProcessor,
+    IMetricsSink,
+    INotifier,
+    IResultCache,
+    IStorage,
+    ISTTEngine,
+    IVoiceActivityDetector,
+)
+from app.domain.services.chunking import (
+    ChunkingPolicy,
+    merge_chunks,
+    plan_chunks,
+    transcribe_chunks,
+)
+from app.domain.services.progress import ProgressBatcher
+from app.domain.services.spans import measure_stage
 from app.domain.value_objects import (
-    AudioSegment,
+    PipelineStage,
+    ResultCacheKey,
+    TranscriptionProgress,
     TranscriptionResult,
     TranscriptionStatus,
 )
@@ -16,19 +37,34 @@ class TranscriptionService:
         audio_processor: IAudioProcessor,
         stt_engine: ISTTEngine,
         notifier: INotifier,
+        metrics: IMetricsSink,
+        vad: IVoiceActivityDetector,
+        chunking: ChunkingPolicy | None = None,
+        result_cache: IResultCache | None = None,
+        audio_cache: IAudioCache | None = None,
     ):
         self.storage = storage
         self.audio_processor = audio_processor
         self.stt_engine = stt_engine
         self.notifier = notifier
+        self.metrics = metrics
+        self.vad = vad
+        self.chunking = chunking or ChunkingPolicy()
+        self.result_cache = result_cache
+        self.audio_cache = audio_cache
 
     async def execute(self, task: TranscriptionTask) -> None:
         """
         V1:
-        1. Download
-        4. Convert
-        3. Transcribe
+        0. Готовый результат для того же содержимого — сразу в Notify
+           (сегменты одной порцией progress, затем статус)
+        1. Download + Convert (потоком; для непотоковых форматов — через файл)
+        2. Split on silence (VAD)
+        3. Transcribe chunks in parallel, stream partial results, merge
         4. Notify
+
+        Каждый этап пишет StageSpan в task.spans: они уходят с уведомлением
+        и в IMetricsSink по завершении задачи.
         """
 
         local_path: Path | None = None
@@ -37,20 +73,98 @@ class TranscriptionService:
         try:
             # Notify Start
             task.update_status(TranscriptionStatus.PROCESSING)
-            await self.notifier.notify_status(task)
+            with measure_stage(task, PipelineStage.NOTIFY):
+                await self.notifier.notify_status(task)
 
-            # Download
-            local_path = await self.storage.download(task.s3_key)
+            # Cache: оба кэша адресуются содержимым записи, а не только
+            # s3_key — перезалитый под тем же ключом файл дает промах
+            fingerprint = ""
+            cache_key: ResultCacheKey | None = None
+            cached: TranscriptionResult | None = None
+            if self.result_cache is not None or self.audio_cache is not None:
+                with measure_stage(task, PipelineStage.CACHE_LOOKUP):
+                    fingerprint = await self.storage.fingerprint(task.s3_key)
+                    if self.result_cache is not None:
+                        cache_key = self._cache_key(fingerprint)
+                        cached = await self.result_cache.get(cache_key)
 
-            # Prepare Audio
-            processed_path = await self.audio_processor.convert_to_stt(local_path)
-            duration = await self.audio_processor.get_duration(processed_path)
+            if self.result_cache is not None:
+                await self.metrics.record_cache_lookup(
+                    cached is not None, self.stt_engine.model_name
+                )
+                if cached is not None:
+                    task.set_result(cached)
+                    with measure_stage(task, PipelineStage.NOTIFY):
+                        # Клиент, собирающий текст из notify_progress, получает
+                        # сегменты так же, как при распознавании
+                        await self.notifier.notify_progress(
+                            task,
+                            TranscriptionProgress(
+                                segments=cached.segments,
+                                processed_sec=cached.duration_sec,
+                                duration_sec=cached.duration_sec,
+                            ),
+                        )
+                        await self.notifier.notify_status(task)
+                    return
 
-            # Transcribe
-            input_segment = AudioSegment(
-                local_path=processed_path, start_offset=0.0, end_offset=duration
-            )
-            segments = await self.stt_engine.transcribe(input_segment)
+            # Prepare Audio: готовый PCM из локального кэша, иначе одним потоком
+            # из хранилища через декодер, без скачанного файла на диске
+            processed_key = self._audio_key("pcm", task, fingerprint)
+            processed_path = await self._cached_audio(processed_key)
+            if processed_path is not None:
+                with measure_stage(task, PipelineStage.PROBE):
+                    duration = await self.audio_processor.get_duration(processed_path)
+            else:
+                try:
+                    with measure_stage(task, PipelineStage.STREAM_DECODE) as span:
+                        decoded = await self.audio_processor.decode_stream(
+                            self.storage.stream(task.s3_key)
+                        )
+                        span.bytes_processed = decoded.bytes_in
+                        span.audio_sec = decoded.duration_sec
+                    processed_path = await self._keep(processed_key, decoded.local_path)
+                    duration = decoded.duration_sec
+                except AudioDecodeError:
+                    # Формат не читается потоком: скачиваем целиком
+                    raw_key = self._audio_key("raw", task, fingerprint)
+                    local_path = await self._cached_audio(raw_key)
+                    if local_path is None:
+                        with measure_stage(task, PipelineStage.DOWNLOAD) as span:
+                            downloaded = await self.storage.download(task.s3_key)
+                            span.bytes_processed = downloaded.stat().st_size
+                        local_path = await self._keep(raw_key, downloaded)
+
+                    with measure_stage(task, PipelineStage.CONVERT) as span:
+                        converted = await self.audio_processor.convert_to_stt(
+                            local_path
+                        )
+                        span.bytes_processed = converted.stat().st_size
+                    processed_path = await self._keep(processed_key, converted)
+                    with measure_stage(task, PipelineStage.PROBE):
+                        duration = await self.audio_processor.get_duration(
+                            processed_path
+                        )
+
+            # Split
+            with measure_stage(task, PipelineStage.VAD) as span:
+                span.audio_sec = duration
+                speech = await self.vad.detect_speech(processed_path)
+            chunks = plan_chunks(processed_path, duration, speech, self.chunking)
+
+            # Transcribe, отдавая промежуточные сегменты по мере готовности
+            progress = ProgressBatcher(self.notifier, task, duration)
+            with measure_stage(task, PipelineStage.TRANSCRIBE) as span:
+                span.audio_sec = duration
+                results = await transcribe_chunks(
+                    self.stt_engine,
+                    chunks,
+                    self.chunking.workers,
+                    on_progress=progress.add,
+                    duration=duration,
+                )
+                await progress.flush()
+            segments = merge_chunks(chunks, results)
 
             # Complete & Notify Result
             result = TranscriptionResult(
@@ -60,7 +174,10 @@ class TranscriptionService:
                 segments=segments,
             )
             task.set_result(result)
-            await self.notifier.notify_status(task)
+            if self.result_cache is not None and cache_key is not None:
+                await self.result_cache.put(cache_key, result)
+            with measure_stage(task, PipelineStage.NOTIFY):
+                await self.notifier.notify_status(task)
 
         except Exception as e:
             # Handle Failure
@@ -68,8 +185,46 @@ class TranscriptionService:
             await self.notifier.notify_status(task)
 
         finally:
-            # Cleanup
+            # Cleanup: файлы из кэша освобождаются, а не удаляются
             if local_path:
-                await self.storage.delete_local(local_path)
+                await self._discard(local_path)
             if processed_path and processed_path != local_path:
-                await self.storage.delete_local(processed_path)
+                await self._discard(processed_path)
+
+            await self.metrics.record_task(task, self.stt_engine.model_name)
+
+    def _cache_key(self, fingerprint: str) -> ResultCacheKey:
+        # workers влияет только на скорость, не на результат
+        chunking = asdict(self.chunking)
+        chunking.pop("workers")
+        params = {
+            **self.stt_engine.params,
+            **{f"chunking.{k}": str(v) for k, v in chunking.items()},
+        }
+        return ResultCacheKey(
+            fingerprint=fingerprint,
+            model_name=self.stt_engine.model_name,
+            params=tuple(sorted(params.items())),
+        )
+
+    def _audio_key(self, kind: str, task: TranscriptionTask, fingerprint: str) -> str:
+        key = f"{kind}:{task.s3_key}:{fingerprint}"
+        if kind == "raw":
+            return key
+        return f"{key}:{self.audio_processor.conversion_params}"
+
+    async def _cached_audio(self, key: str) -> Path | None:
+        if self.audio_cache is None:
+            return None
+        return await self.audio_cache.acquire(key)
+
+    async def _keep(self, key: str, local_path: Path) -> Path:
+        if self.audio_cache is None:
+            return local_path
+        return await self.audio_cache.put(key, local_path)
+
+    async def _discard(self, local_path: Path) -> None:
+        if self.audio_cache is None:
+            await self.storage.delete_local(local_path)
+        else:
+            await self.audio_cache.release(local_path)
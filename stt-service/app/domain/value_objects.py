@@ -1,3 +1,5 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
@@ -11,6 +13,54 @@ class TranscriptionStatus(StrEnum):
     FAILED = "failed"
 
 
+class PipelineStage(StrEnum):
+    DOWNLOAD = "download"
+    CONVERT = "convert"
+    PROBE = "probe"
+    CACHE_LOOKUP = "cache_lookup"
+    # Скачивание и декодирование одним потоком, без промежуточного файла
+    STREAM_DECODE = "stream_decode"
+    VAD = "vad"
+    TRANSCRIBE = "transcribe"
+    NOTIFY = "notify"
+
+
+@dataclass(frozen=True)
+class StageSpan:
+    """
+    Замер одного этапа обработки. CPU и пиковый RSS — по процессу целиком
+    (включая дочерние ffmpeg), поэтому при параллельных задачах это оценка.
+    """
+
+    stage: PipelineStage
+    wall_sec: float
+    cpu_sec: float
+    peak_rss_bytes: int
+    bytes_processed: int | None = None
+    audio_sec: float | None = None
+    failed: bool = False
+
+    @property
+    def real_time_factor(self) -> float | None:
+        # < 1 — этап быстрее реального времени записи
+        if not self.audio_sec:
+            return None
+        return self.wall_sec / self.audio_sec
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """Один проход модели в BatchingSTTEngine."""
+
+    size: int
+    audio_sec: float
+    # Сколько самый давний участок пачки ждал в очереди
+    max_queue_wait_sec: float
+    run_sec: float
+    # Проход упал или отменен: участки пачки получили исключение
+    failed: bool = False
+
+
 @dataclass(frozen=True)
 class AudioSegment:
     local_path: Path
@@ -18,6 +68,24 @@ class AudioSegment:
     end_offset: float
 
 
+@dataclass(frozen=True)
+class DecodedAudio:
+    """Аудио в формате модели (16 кГц моно PCM), готовое к распознаванию."""
+
+    local_path: Path
+    duration_sec: float
+    # Сколько байт исходного файла прочитано из хранилища
+    bytes_in: int
+
+
+@dataclass(frozen=True)
+class SpeechRegion:
+    """Участок речи по VAD, в секундах от начала записи."""
+
+    start: float
+    end: float
+
+
 @dataclass(frozen=True)
 class TranscriptionSegment:
     text: str
@@ -26,9 +94,41 @@ class TranscriptionSegment:
     confidence: float | None = None
 
 
+@dataclass(frozen=True)
+class TranscriptionProgress:
+    """Порция промежуточных сегментов (абсолютные смещения, порядок не гарантирован)."""
+
+    segments: list[TranscriptionSegment]
+    processed_sec: float
+    duration_sec: float
+
+    @property
+    def percent(self) -> float:
+        if not self.duration_sec:
+            return 0.0
+        return min(100.0, self.processed_sec / self.duration_sec * 100)
+
+
 @dataclass(frozen=True)
 class TranscriptionResult:
     full_text: str
     model_name: str  # хз, наверное лишнее, для отчетов
     duration_sec: float
     segments: list[TranscriptionSegment]
+
+
+@dataclass(frozen=True)
+class ResultCacheKey:
+    """
+    Результат распознавания определяется содержимым записи, моделью и
+    параметрами движка и разбиения — не s3_key.
+    """
+
+    fingerprint: str
+    model_name: str
+    params: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps([self.fingerprint, self.model_name, sorted(self.params)])
+        return hashlib.sha256(payload.encode()).hexdigest()
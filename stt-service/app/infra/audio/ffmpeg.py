@@ -0,0 +1,136 @@
+import asyncio
+import wave
+from asyncio.subprocess import PIPE
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from pathlib import Path
+from uuid import uuid4
+
+from app.common.constants import SAMPLE_RATE, SAMPLE_WIDTH
+from app.domain.exceptions import AudioDecodeError
+from app.domain.interfaces import IAudioProcessor
+from app.domain.value_objects import DecodedAudio
+
+# Параметры выхода ffmpeg: формат модели
+_PCM_ARGS = ("-ac", "1", "-ar", str(SAMPLE_RATE))
+READ_SIZE = 64 * 1024
+
+
+class FFmpegAudioProcessor(IAudioProcessor):
+    """
+    scratch_dir — каталог для WAV в формате модели. В tmpfs (/dev/shm)
+    файл живет в памяти, и декодированное аудио не касается диска.
+    """
+
+    def __init__(self, scratch_dir: Path) -> None:
+        self._scratch_dir = scratch_dir
+
+    @property
+    def conversion_params(self) -> str:
+        return f"pcm_s16le:{SAMPLE_RATE}:mono"
+
+    async def get_duration(self, local_path: Path) -> float:
+        output = await self._run(
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "csv=p=0",
+            str(local_path),
+        )
+        return float(output)
+
+    async def convert_to_stt(self, local_path: Path) -> Path:
+        output_path = self._scratch_dir / f"{uuid4().hex}.wav"
+        await self._run(
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-i",
+            str(local_path),
+            *_PCM_ARGS,
+            "-c:a",
+            "pcm_s16le",
+            str(output_path),
+        )
+        return output_path
+
+    async def decode_stream(self, chunks: AsyncIterator[bytes]) -> DecodedAudio:
+        output_path = self._scratch_dir / f"{uuid4().hex}.wav"
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            "pipe:0",
+            *_PCM_ARGS,
+            "-f",
+            "s16le",
+            "pipe:1",
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=PIPE,
+        )
+        assert process.stdin and process.stdout and process.stderr
+        stdin = process.stdin
+        bytes_in = 0
+
+        async def feed() -> None:
+            nonlocal bytes_in
+            try:
+                async for chunk in chunks:
+                    bytes_in += len(chunk)
+                    stdin.write(chunk)
+                    await stdin.drain()
+            except BrokenPipeError, ConnectionResetError:
+                # ffmpeg завершился раньше — причина будет в коде возврата
+                pass
+            finally:
+                stdin.close()
+
+        # Чтение из хранилища, декодирование и запись PCM идут одновременно
+        feeder = asyncio.create_task(feed())
+        stderr = asyncio.create_task(process.stderr.read())
+        pcm_bytes = 0
+        try:
+            with wave.open(str(output_path), "wb") as pcm:
+                pcm.setnchannels(1)
+                pcm.setsampwidth(SAMPLE_WIDTH)
+                pcm.setframerate(SAMPLE_RATE)
+                while data := await process.stdout.read(READ_SIZE):
+                    pcm.writeframesraw(data)
+                    pcm_bytes += len(data)
+            # Ошибки хранилища (нет объекта и т.п.) поднимаются отсюда
+            await feeder
+            returncode = await process.wait()
+        except BaseException:
+            feeder.cancel()
+            with suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+            output_path.unlink(missing_ok=True)
+            raise
+
+        if returncode != 0 or not pcm_bytes:
+            output_path.unlink(missing_ok=True)
+            details = (await stderr).decode(errors="replace").strip()
+            raise AudioDecodeError(details or f"ffmpeg exited with {returncode}")
+
+        return DecodedAudio(
+            local_path=output_path,
+            duration_sec=pcm_bytes / (SAMPLE_RATE * SAMPLE_WIDTH),
+            bytes_in=bytes_in,
+        )
+
+    @staticmethod
+    async def _run(*args: str) -> str:
+        process = await asyncio.create_subprocess_exec(*args, stdout=PIPE, stderr=PIPE)
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise AudioDecodeError(stderr.decode(errors="replace").strip())
+        return stdout.decode().strip()
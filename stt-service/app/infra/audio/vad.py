@@ -0,0 +1,102 @@
+import asyncio
+import math
+import sys
+import wave
+from array import array
+from pathlib import Path
+
+from app.common.constants import SAMPLE_RATE, SAMPLE_WIDTH
+from app.domain.exceptions import AudioDecodeError
+from app.domain.interfaces import IVoiceActivityDetector
+from app.domain.value_objects import SpeechRegion
+
+# Кадров, читаемых из файла за раз
+_READ_FRAMES = 1000
+
+
+class EnergyVoiceActivityDetector(IVoiceActivityDetector):
+    """
+    Речь — кадры громче фонового шума записи. Фон оценивается по тихим
+    кадрам (перцентиль noise_percentile), порог — фон * energy_ratio, но не
+    ниже min_rms и не выше громких кадров / energy_ratio: в записи почти
+    без пауз перцентиль "фона" приходится на саму речь. Паузы короче
+    min_gap_sec речь не разрывают, участки короче min_speech_sec
+    отбрасываются.
+
+    Работает с WAV в формате модели (convert_to_stt / decode_stream).
+    """
+
+    def __init__(
+        self,
+        *,
+        frame_sec: float = 0.03,
+        energy_ratio: float = 3.0,
+        noise_percentile: float = 0.1,
+        min_rms: float = 100.0,
+        min_gap_sec: float = 0.2,
+        min_speech_sec: float = 0.1,
+    ) -> None:
+        self._frame_size = int(frame_sec * SAMPLE_RATE)
+        self._energy_ratio = energy_ratio
+        self._noise_percentile = noise_percentile
+        self._min_rms = min_rms
+        self._min_gap_sec = min_gap_sec
+        self._min_speech_sec = min_speech_sec
+
+    async def detect_speech(self, local_path: Path) -> list[SpeechRegion]:
+        # Разбор часовой записи — доли секунды CPU: не держим event loop
+        return await asyncio.to_thread(self._detect, local_path)
+
+    def _detect(self, local_path: Path) -> list[SpeechRegion]:
+        levels = self._frame_levels(local_path)
+        if not levels:
+            return []
+
+        ordered = sorted(levels)
+        floor = ordered[int(len(ordered) * self._noise_percentile)]
+        loud = ordered[int(len(ordered) * (1 - self._noise_percentile))]
+        threshold = max(
+            min(floor * self._energy_ratio, loud / self._energy_ratio),
+            self._min_rms,
+        )
+        frame_sec = self._frame_size / SAMPLE_RATE
+
+        regions: list[SpeechRegion] = []
+        start: float | None = None
+        for i, level in enumerate(levels + [0.0]):
+            if level >= threshold and start is None:
+                start = i * frame_sec
+            elif level < threshold and start is not None:
+                end = i * frame_sec
+                if regions and start - regions[-1].end < self._min_gap_sec:
+                    regions[-1] = SpeechRegion(regions[-1].start, end)
+                else:
+                    regions.append(SpeechRegion(start, end))
+                start = None
+        return [r for r in regions if r.end - r.start >= self._min_speech_sec]
+
+    def _frame_levels(self, local_path: Path) -> list[float]:
+        """RMS каждого кадра записи."""
+        levels: list[float] = []
+        try:
+            with wave.open(str(local_path), "rb") as wav:
+                if (
+                    wav.getnchannels() != 1
+                    or wav.getsampwidth() != SAMPLE_WIDTH
+                    or wav.getframerate() != SAMPLE_RATE
+                ):
+                    raise AudioDecodeError(
+                        f"VAD expects 16 kHz mono s16le: {local_path}"
+                    )
+                size = self._frame_size
+                while data := wav.readframes(size * _READ_FRAMES):
+                    samples = array("h")
+                    samples.frombytes(data[: len(data) // SAMPLE_WIDTH * SAMPLE_WIDTH])
+                    if sys.byteorder == "big":
+                        samples.byteswap()
+                    for offset in range(0, len(samples) - size + 1, size):
+                        frame = samples[offset : offset + size]
+                        levels.append(math.sqrt(math.sumprod(frame, frame) / size))
+        except (wave.Error, EOFError) as e:
+            raise AudioDecodeError(str(e)) from e
+        return levels
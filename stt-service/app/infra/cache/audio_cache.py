@@ -0,0 +1,124 @@
+"""
+LRU-кэш аудиофайлов на локальном диске с лимитом по суммарному размеру.
+
+Индекс живет в памяти процесса: каталог принадлежит одному воркеру и
+очищается при старте. Файлы, выданные задачам, закреплены (счетчик pins)
+и не вытесняются, пока их не отпустят через release.
+
+Каталог обычно на диске, а файлы приходят из scratch (tmpfs): put
+переносит их через shutil.move, который копирует между разделами.
+"""
+
+import asyncio
+import logging
+import shutil
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import uuid4
+
+from app.domain.interfaces import IAudioCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AudioCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class _Entry:
+    path: Path
+    size: int
+    pins: int = 0
+
+
+class LocalAudioCache(IAudioCache):
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        # Порядок — от давно использованных к недавним
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._keys: dict[Path, str] = {}
+        self.stats = AudioCacheStats()
+
+        shutil.rmtree(directory, ignore_errors=True)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Половина свободного места остается под файлы текущих задач
+        free = shutil.disk_usage(directory).free
+        if free // 2 < max_bytes:
+            logger.warning(
+                "Audio cache limit %d bytes is over half of free space in %s "
+                "(%d bytes), using %d bytes",
+                max_bytes,
+                directory,
+                free,
+                free // 2,
+            )
+            self._max_bytes = free // 2
+
+    # Индекс меняется только между await: в asyncio это атомарно
+    # относительно других задач, отдельная блокировка не нужна
+
+    async def acquire(self, key: str) -> Path | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return self._pin(key, entry)
+
+    async def put(self, key: str, local_path: Path) -> Path:
+        existing = self._entries.get(key)
+        if existing is not None:
+            local_path.unlink(missing_ok=True)
+            return self._pin(key, existing)
+
+        path = self._directory / f"{uuid4().hex}{local_path.suffix}"
+        await asyncio.to_thread(shutil.move, local_path, path)
+        # Пока файл копировался, тот же ключ могла положить другая задача
+        existing = self._entries.get(key)
+        if existing is not None:
+            path.unlink(missing_ok=True)
+            return self._pin(key, existing)
+
+        entry = _Entry(path=path, size=path.stat().st_size, pins=1)
+        self._entries[key] = entry
+        self._keys[path] = key
+        self.stats.bytes += entry.size
+        self._evict()
+        return path
+
+    async def release(self, local_path: Path) -> None:
+        key = self._keys.get(local_path)
+        if key is None:
+            # Файл не из кэша — удаляем, как раньше
+            local_path.unlink(missing_ok=True)
+            return
+        entry = self._entries[key]
+        entry.pins = max(entry.pins - 1, 0)
+        self._evict()
+
+    def _pin(self, key: str, entry: _Entry) -> Path:
+        entry.pins += 1
+        self._entries.move_to_end(key)
+        return entry.path
+
+    def _evict(self) -> None:
+        for key in list(self._entries):
+            if self.stats.bytes <= self._max_bytes:
+                return
+            entry = self._entries[key]
+            if entry.pins:
+                continue
+            del self._entries[key]
+            del self._keys[entry.path]
+            entry.path.unlink(missing_ok=True)
+            self.stats.bytes -= entry.size
+            self.stats.evictions += 1
+            logger.debug("Evicted %s (%d bytes)", key, entry.size)
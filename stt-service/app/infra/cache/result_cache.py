@@ -0,0 +1,149 @@
+"""
+Кэш результатов распознавания в Redis с вытеснением по суммарному размеру.
+
+Порядок доступа хранится в sorted set (score — время последнего чтения),
+размеры записей — в hash, их сумма — в отдельном счетчике, который
+меняется в одной транзакции с записями; при превышении max_bytes
+удаляются самые давние.
+Несколько воркеров могут ненадолго превысить лимит при гонке — это
+допустимо, следующий put дочистит.
+"""
+
+import json
+import logging
+import time
+import zlib
+from dataclasses import asdict, dataclass
+from typing import cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.domain.interfaces import IResultCache
+from app.domain.value_objects import (
+    ResultCacheKey,
+    TranscriptionResult,
+    TranscriptionSegment,
+)
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "stt:result:"
+LRU_KEY = "stt:result-index:lru"
+SIZES_KEY = "stt:result-index:sizes"
+TOTAL_KEY = "stt:result-index:bytes"
+EVICT_BATCH = 16
+
+
+@dataclass
+class ResultCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def dump_result(result: TranscriptionResult) -> bytes:
+    payload = json.dumps(asdict(result), ensure_ascii=False)
+    return zlib.compress(payload.encode(), level=6)
+
+
+def load_result(raw: bytes) -> TranscriptionResult:
+    data = json.loads(zlib.decompress(raw))
+    return TranscriptionResult(
+        full_text=data["full_text"],
+        model_name=data["model_name"],
+        duration_sec=data["duration_sec"],
+        segments=[TranscriptionSegment(**s) for s in data["segments"]],
+    )
+
+
+class RedisResultCache(IResultCache):
+    def __init__(self, redis: Redis, max_bytes: int) -> None:
+        # Значения — сжатые байты: клиент без decode_responses
+        self._redis = redis
+        self._max_bytes = max_bytes
+        self.stats = ResultCacheStats()
+
+    async def get(self, key: ResultCacheKey) -> TranscriptionResult | None:
+        digest = key.digest
+        try:
+            raw = await self._redis.get(KEY_PREFIX + digest)
+            if raw is not None:
+                await self._redis.zadd(LRU_KEY, {digest: time.time()})
+        except RedisError:
+            logger.warning("Result cache read failed", exc_info=True)
+            self.stats.errors += 1
+            return None
+
+        if raw is None:
+            self.stats.misses += 1
+            return None
+        try:
+            result = load_result(cast(bytes, raw))
+        except zlib.error, ValueError, KeyError, TypeError:
+            # Битая запись не должна ронять задачу: распознаем заново
+            logger.warning("Corrupt result cache entry %s, dropping", digest)
+            self.stats.misses += 1
+            try:
+                size = await self._redis.hget(SIZES_KEY, digest)
+                await self._remove([(digest, int(size or 0))])
+            except RedisError:
+                logger.warning("Result cache cleanup failed", exc_info=True)
+                self.stats.errors += 1
+            return None
+        self.stats.hits += 1
+        return result
+
+    async def put(self, key: ResultCacheKey, result: TranscriptionResult) -> None:
+        raw = dump_result(result)
+        if len(raw) > self._max_bytes:
+            return
+
+        digest = key.digest
+        try:
+            # Перезапись того же ключа: в счетчик идет только разница
+            previous = await self._redis.hget(SIZES_KEY, digest)
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.set(KEY_PREFIX + digest, raw)
+            pipe.zadd(LRU_KEY, {digest: time.time()})
+            pipe.hset(SIZES_KEY, digest, len(raw))
+            pipe.incrby(TOTAL_KEY, len(raw) - int(previous or 0))
+            await pipe.execute()
+            await self._evict()
+        except RedisError:
+            logger.warning("Result cache write failed", exc_info=True)
+            self.stats.errors += 1
+
+    async def _evict(self) -> None:
+        total = int(await self._redis.get(TOTAL_KEY) or 0)
+        while total > self._max_bytes:
+            oldest = cast(
+                list[bytes], await self._redis.zrange(LRU_KEY, 0, EVICT_BATCH - 1)
+            )
+            if not oldest:
+                break
+            sizes = await self._redis.hmget(SIZES_KEY, oldest)
+            evicted = []
+            for digest, size in zip(oldest, sizes, strict=True):
+                if total <= self._max_bytes:
+                    break
+                evicted.append((digest.decode(), int(size or 0)))
+                total -= int(size or 0)
+            await self._remove(evicted)
+            self.stats.evictions += len(evicted)
+
+    async def _remove(self, entries: list[tuple[str, int]]) -> None:
+        """Удаляет записи (digest, размер) и вычитает их размер из счетчика."""
+        digests = [digest for digest, _ in entries]
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.delete(*(KEY_PREFIX + digest for digest in digests))
+        pipe.zrem(LRU_KEY, *digests)
+        pipe.hdel(SIZES_KEY, *digests)
+        pipe.decrby(TOTAL_KEY, sum(size for _, size in entries))
+        await pipe.execute()
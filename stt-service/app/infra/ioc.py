@@ -0,0 +1,101 @@
+from collections.abc import AsyncIterable
+
+import aioboto3
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from app.common.settings import settings
+from app.domain.interfaces import (
+    IAudioCache,
+    IAudioProcessor,
+    IMetricsSink,
+    IResultCache,
+    IStorage,
+    ISTTEngine,
+    IVoiceActivityDetector,
+)
+from app.domain.services.batching import BatchingSTTEngine
+from app.infra.audio.ffmpeg import FFmpegAudioProcessor
+from app.infra.audio.vad import EnergyVoiceActivityDetector
+from app.infra.cache.audio_cache import LocalAudioCache
+from app.infra.cache.result_cache import RedisResultCache
+from app.infra.metrics import LoggingMetricsSink
+from app.infra.storage.s3 import S3Storage
+from app.infra.stt.fake import FakeSTTEngine
+from app.infra.stt.lifecycle import ResidentEngine
+from app.infra.stt.transformers_engine import TransformersSTTEngine
+
+
+class AppProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_storage(self) -> IStorage:
+        return S3Storage(
+            aioboto3.Session(),
+            bucket=settings.S3_BUCKET,
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            scratch_dir=settings.scratch_dir,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_audio_processor(self) -> IAudioProcessor:
+        return FFmpegAudioProcessor(settings.scratch_dir)
+
+    @provide(scope=Scope.APP)
+    def get_vad(self) -> IVoiceActivityDetector:
+        return EnergyVoiceActivityDetector()
+
+    @provide(scope=Scope.APP)
+    async def get_redis(self) -> AsyncIterable[Redis]:
+        # Без decode_responses: кэш хранит сжатые байты
+        client = Redis.from_url(settings.redis_url)
+        yield client
+        await client.aclose()
+
+    @provide(scope=Scope.APP)
+    def get_result_cache(self, redis: Redis) -> IResultCache | None:
+        if not settings.STT_RESULT_CACHE_MAX_BYTES:
+            return None
+        return RedisResultCache(redis, max_bytes=settings.STT_RESULT_CACHE_MAX_BYTES)
+
+    @provide(scope=Scope.APP)
+    def get_audio_cache(self) -> IAudioCache | None:
+        if not settings.STT_AUDIO_CACHE_MAX_BYTES:
+            return None
+        return LocalAudioCache(
+            settings.audio_cache_dir,
+            max_bytes=settings.STT_AUDIO_CACHE_MAX_BYTES,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_metrics_sink(self) -> IMetricsSink:
+        return LoggingMetricsSink()
+
+    @provide(scope=Scope.APP)
+    async def get_resident_engine(self) -> AsyncIterable[ResidentEngine]:
+        # Модель грузится один раз на процесс, а не на задачу
+        engine: ISTTEngine
+        if settings.STT_ENGINE == "fake":
+            engine = FakeSTTEngine()
+        else:
+            engine = TransformersSTTEngine(
+                settings.STT_MODEL_NAME,
+                device=settings.STT_DEVICE,
+                language=settings.STT_LANGUAGE,
+            )
+        resident = ResidentEngine(engine, warmup_sec=settings.STT_WARMUP_SEC)
+        await resident.start()
+        yield resident
+        await resident.stop()
+
+    @provide(scope=Scope.APP)
+    async def get_stt_engine(
+        self, resident: ResidentEngine, metrics: IMetricsSink
+    ) -> AsyncIterable[ISTTEngine]:
+        engine = BatchingSTTEngine(
+            resident.engine,
+            metrics,
+            max_batch_size=settings.STT_MAX_BATCH_SIZE,
+            max_wait_sec=settings.STT_MAX_BATCH_WAIT_SEC,
+        )
+        yield engine
+        await engine.close()
@@ -0,0 +1,105 @@
+import logging
+import time
+
+from app.domain.entities import TranscriptionTask
+from app.domain.interfaces import IMetricsSink
+from app.domain.value_objects import BatchStats
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingMetricsSink(IMetricsSink):
+    """Метрики строками лога, с полями в extra для структурных обработчиков."""
+
+    def __init__(self) -> None:
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.batched_segments = 0
+        self.batch_busy_sec = 0.0
+        self._first_batch_at: float | None = None
+
+    @property
+    def cache_hit_rate(self) -> float:
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.batched_segments / self.batches if self.batches else 0.0
+
+    @property
+    def batch_utilisation(self) -> float:
+        """Доля времени с начала первого прохода, когда модель была занята."""
+        if self._first_batch_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self._first_batch_at
+        return min(1.0, self.batch_busy_sec / elapsed) if elapsed else 0.0
+
+    async def record_task(self, task: TranscriptionTask, model_name: str) -> None:
+        for span in task.spans:
+            logger.info(
+                "task %s %s: %.3fs wall, %.3fs cpu",
+                task.id,
+                span.stage,
+                span.wall_sec,
+                span.cpu_sec,
+                extra={
+                    "task_id": task.id,
+                    "model_name": model_name,
+                    "stage": str(span.stage),
+                    "wall_sec": span.wall_sec,
+                    "cpu_sec": span.cpu_sec,
+                    "peak_rss_bytes": span.peak_rss_bytes,
+                    "bytes_processed": span.bytes_processed,
+                    "audio_sec": span.audio_sec,
+                    "real_time_factor": span.real_time_factor,
+                    "failed": span.failed,
+                },
+            )
+
+    async def record_cache_lookup(self, hit: bool, model_name: str) -> None:
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        logger.info(
+            "result cache %s, hit rate %.2f",
+            "hit" if hit else "miss",
+            self.cache_hit_rate,
+            extra={
+                "model_name": model_name,
+                "cache_hit": hit,
+                "cache_hit_rate": self.cache_hit_rate,
+            },
+        )
+
+    async def record_batch(self, stats: BatchStats, model_name: str) -> None:
+        if self._first_batch_at is None:
+            self._first_batch_at = time.monotonic() - stats.run_sec
+        self.batches += 1
+        self.failed_batches += stats.failed
+        self.batched_segments += stats.size
+        self.batch_busy_sec += stats.run_sec
+        outcome = "failed" if stats.failed else "ok"
+        logger.log(
+            logging.WARNING if stats.failed else logging.DEBUG,
+            "batch of %d %s: %.3fs run, %.3fs wait, mean size %.2f, utilisation %.2f",
+            stats.size,
+            outcome,
+            stats.run_sec,
+            stats.max_queue_wait_sec,
+            self.mean_batch_size,
+            self.batch_utilisation,
+            extra={
+                "model_name": model_name,
+                "batch_size": stats.size,
+                "batch_outcome": outcome,
+                "audio_sec": stats.audio_sec,
+                "run_sec": stats.run_sec,
+                "queue_wait_sec": stats.max_queue_wait_sec,
+                "mean_batch_size": self.mean_batch_size,
+                "batch_utilisation": self.batch_utilisation,
+            },
+        )
@@ -0,0 +1,71 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import aioboto3
+from botocore.exceptions import ClientError
+
+from app.common.constants import S3_STREAM_CHUNK_SIZE
+from app.domain.exceptions import StorageFileNotFoundError
+from app.domain.interfaces import IStorage
+
+_NOT_FOUND_CODES = frozenset({"404", "NoSuchKey", "NotFound"})
+
+
+class S3Storage(IStorage):
+    def __init__(
+        self,
+        session: aioboto3.Session,
+        *,
+        bucket: str,
+        endpoint_url: str | None,
+        scratch_dir: Path,
+    ) -> None:
+        self._session = session
+        self._bucket = bucket
+        self._endpoint_url = endpoint_url
+        self._scratch_dir = scratch_dir
+
+    def _client(self) -> Any:
+        return self._session.client("s3", endpoint_url=self._endpoint_url)
+
+    async def download(self, s3_key: str) -> Path:
+        local_path = self._scratch_dir / f"{uuid4().hex}{Path(s3_key).suffix}"
+        async with self._client() as s3:
+            try:
+                await s3.download_file(self._bucket, s3_key, str(local_path))
+            except ClientError as e:
+                local_path.unlink(missing_ok=True)
+                if e.response["Error"]["Code"] in _NOT_FOUND_CODES:
+                    raise StorageFileNotFoundError(s3_key) from e
+                raise
+        return local_path
+
+    async def stream(self, s3_key: str) -> AsyncIterator[bytes]:
+        async with self._client() as s3:
+            try:
+                response = await s3.get_object(Bucket=self._bucket, Key=s3_key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] in _NOT_FOUND_CODES:
+                    raise StorageFileNotFoundError(s3_key) from e
+                raise
+            async with response["Body"] as body:
+                async for chunk in body.iter_chunks(S3_STREAM_CHUNK_SIZE):
+                    yield chunk
+
+    async def fingerprint(self, s3_key: str) -> str:
+        async with self._client() as s3:
+            try:
+                head = await s3.head_object(Bucket=self._bucket, Key=s3_key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] in _NOT_FOUND_CODES:
+                    raise StorageFileNotFoundError(s3_key) from e
+                raise
+        # ETag составной загрузки — не MD5 содержимого, но для одного и того же
+        # файла, загруженного тем же клиентом, совпадает; размер — страховка
+        return f"{head['ETag'].strip('"')}:{head['ContentLength']}"
+
+    async def delete_local(self, local_path: Path) -> None:
+        await asyncio.to_thread(local_path.unlink, missing_ok=True)
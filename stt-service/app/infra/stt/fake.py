@@ -0,0 +1,61 @@
+import asyncio
+from collections.abc import Sequence
+
+from app.domain.interfaces import ISTTEngine
+from app.domain.value_objects import AudioSegment, TranscriptionSegment
+
+
+class FakeSTTEngine(ISTTEngine):
+    """
+    Движок без модели: по сегменту "слову" на каждую секунду участка.
+    Проход имитирует одно устройство: проходы идут строго по очереди,
+    стоят постоянную часть плюс долю от самого длинного участка пачки
+    (пачка дополняется до него и считается параллельно).
+    """
+
+    def __init__(
+        self,
+        *,
+        call_overhead_sec: float = 0.02,
+        sec_per_audio_sec: float = 0.001,
+        word_sec: float = 1.0,
+    ) -> None:
+        self._call_overhead_sec = call_overhead_sec
+        self._sec_per_audio_sec = sec_per_audio_sec
+        self._word_sec = word_sec
+        self._device = asyncio.Lock()
+
+    @property
+    def model_name(self) -> str:
+        return "fake"
+
+    async def transcribe(self, segment: AudioSegment) -> list[TranscriptionSegment]:
+        return (await self.transcribe_batch([segment]))[0]
+
+    async def transcribe_batch(
+        self, segments: Sequence[AudioSegment]
+    ) -> list[list[TranscriptionSegment]]:
+        longest = max((s.end_offset - s.start_offset for s in segments), default=0.0)
+        async with self._device:
+            await asyncio.sleep(
+                self._call_overhead_sec + longest * self._sec_per_audio_sec
+            )
+        return [self._words(segment) for segment in segments]
+
+    def _words(self, segment: AudioSegment) -> list[TranscriptionSegment]:
+        length = segment.end_offset - segment.start_offset
+        words = []
+        offset = 0.0
+        while offset < length:
+            end = min(offset + self._word_sec, length)
+            absolute = segment.start_offset + offset
+            words.append(
+                TranscriptionSegment(
+                    text=f"w{absolute:.0f}",
+                    start_offset=offset,
+                    end_offset=end,
+                    confidence=1.0,
+                )
+            )
+            offset = end
+        return words
@@ -0,0 +1,98 @@
+import logging
+import math
+import struct
+import tempfile
+import time
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.common.constants import SAMPLE_RATE, SAMPLE_WIDTH
+from app.domain.interfaces import ISTTEngine
+from app.domain.value_objects import AudioSegment
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StartupReport:
+    model_name: str
+    import_sec: float
+    load_sec: float
+    warmup_sec: float
+
+    @property
+    def total_sec(self) -> float:
+        return self.import_sec + self.load_sec + self.warmup_sec
+
+    def format(self) -> str:
+        return (
+            f"{self.model_name}: import {self.import_sec:.2f}s, "
+            f"weights {self.load_sec:.2f}s, warm-up {self.warmup_sec:.2f}s, "
+            f"total {self.total_sec:.2f}s"
+        )
+
+
+def write_synthetic_clip(path: Path, seconds: float) -> None:
+    """16 кГц моно WAV с тихим тоном: прогревает тот же путь, что и запись."""
+    frames = int(seconds * SAMPLE_RATE)
+    samples = (
+        int(1000 * math.sin(2 * math.pi * 220 * i / SAMPLE_RATE)) for i in range(frames)
+    )
+    with wave.open(str(path), "wb") as clip:
+        clip.setnchannels(1)
+        clip.setsampwidth(SAMPLE_WIDTH)
+        clip.setframerate(SAMPLE_RATE)
+        clip.writeframes(struct.pack(f"<{frames}h", *samples))
+
+
+class ResidentEngine:
+    """
+    Модель, загруженная один раз на процесс воркера. start() проходит весь
+    жизненный цикл до готовности и замеряет каждый шаг.
+    """
+
+    def __init__(self, engine: ISTTEngine, *, warmup_sec: float) -> None:
+        self.engine = engine
+        self._warmup_sec = warmup_sec
+        self._warmed_up = False
+        self.report: StartupReport | None = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.engine.is_loaded and (self._warmed_up or not self._warmup_sec)
+
+    async def start(self) -> StartupReport:
+        started = time.perf_counter()
+        await self.engine.import_runtime()
+        imported = time.perf_counter()
+        await self.engine.load()
+        loaded = time.perf_counter()
+        await self._warm_up()
+        warmed = time.perf_counter()
+
+        self.report = StartupReport(
+            model_name=self.engine.model_name,
+            import_sec=imported - started,
+            load_sec=loaded - imported,
+            warmup_sec=warmed - loaded,
+        )
+        logger.info("STT engine started: %s", self.report.format())
+        return self.report
+
+    async def stop(self) -> None:
+        await self.engine.unload()
+        self._warmed_up = False
+
+    async def _warm_up(self) -> None:
+        if not self._warmup_sec:
+            return
+        # Первый проход компилирует ядра и выделяет память устройства —
+        # пусть это случится до первой задачи
+        with tempfile.TemporaryDirectory() as tmp:
+            clip = Path(tmp) / "warmup.wav"
+            write_synthetic_clip(clip, self._warmup_sec)
+            await self.engine.transcribe(
+                AudioSegment(clip, start_offset=0.0, end_offset=self._warmup_sec)
+            )
+        self._warmed_up = True
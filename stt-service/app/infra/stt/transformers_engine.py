@@ -0,0 +1,124 @@
+"""
+ISTTEngine на transformers (Whisper и совместимые ASR-модели).
+
+torch и transformers импортируются только в import_runtime: импорт модуля
+ничего тяжелого не тянет, а время импорта попадает в отчет о старте.
+"""
+
+import asyncio
+import importlib
+from collections.abc import Sequence
+from typing import Any
+
+from app.common.constants import SAMPLE_RATE
+from app.domain.exceptions import STTProcessingError
+from app.domain.interfaces import ISTTEngine
+from app.domain.value_objects import AudioSegment, TranscriptionSegment
+
+
+class TransformersSTTEngine(ISTTEngine):
+    def __init__(self, model_name: str, *, device: str, language: str) -> None:
+        self._model_name = model_name
+        self._device = device
+        self._language = language
+        self._torch: Any = None
+        self._transformers: Any = None
+        self._decoders: Any = None
+        self._pipeline: Any = None
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._pipeline is not None
+
+    @property
+    def params(self) -> dict[str, str]:
+        return {"language": self._language}
+
+    async def import_runtime(self) -> None:
+        await asyncio.to_thread(self._import_runtime)
+
+    def _import_runtime(self) -> None:
+        self._torch = importlib.import_module("torch")
+        self._transformers = importlib.import_module("transformers")
+        self._decoders = importlib.import_module("torchcodec.decoders")
+
+    async def load(self) -> None:
+        if self._transformers is None:
+            await self.import_runtime()
+        await asyncio.to_thread(self._load)
+
+    def _load(self) -> None:
+        torch = self._torch
+        device = self._device
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self._pipeline = self._transformers.pipeline(
+            "automatic-speech-recognition",
+            model=self._model_name,
+            device=device,
+            dtype=torch.float16 if device.startswith("cuda") else torch.float32,
+        )
+
+    async def unload(self) -> None:
+        self._pipeline = None
+        if self._torch is not None and self._torch.cuda.is_available():
+            self._torch.cuda.empty_cache()
+
+    async def transcribe(self, segment: AudioSegment) -> list[TranscriptionSegment]:
+        return (await self.transcribe_batch([segment]))[0]
+
+    async def transcribe_batch(
+        self, segments: Sequence[AudioSegment]
+    ) -> list[list[TranscriptionSegment]]:
+        if self._pipeline is None:
+            raise STTProcessingError("model is not loaded")
+        return await asyncio.to_thread(self._transcribe_batch, segments)
+
+    def _transcribe_batch(
+        self, segments: Sequence[AudioSegment]
+    ) -> list[list[TranscriptionSegment]]:
+        audio = [self._read(segment) for segment in segments]
+        outputs = self._pipeline(
+            audio,
+            batch_size=len(audio),
+            return_timestamps=True,
+            generate_kwargs={"language": self._language, "task": "transcribe"},
+        )
+        return [
+            self._to_segments(output, segment)
+            for output, segment in zip(outputs, segments, strict=True)
+        ]
+
+    def _read(self, segment: AudioSegment) -> dict[str, Any]:
+        decoder = self._decoders.AudioDecoder(
+            str(segment.local_path), sample_rate=SAMPLE_RATE, num_channels=1
+        )
+        samples = decoder.get_samples_played_in_range(
+            segment.start_offset, segment.end_offset
+        )
+        return {"raw": samples.data[0].numpy(), "sampling_rate": SAMPLE_RATE}
+
+    @staticmethod
+    def _to_segments(
+        output: dict[str, Any], segment: AudioSegment
+    ) -> list[TranscriptionSegment]:
+        length = segment.end_offset - segment.start_offset
+        result = []
+        for chunk in output.get("chunks", []):
+            text = chunk["text"].strip()
+            if not text:
+                continue
+            start, end = chunk["timestamp"]
+            result.append(
+                TranscriptionSegment(
+                    text=text,
+                    start_offset=start or 0.0,
+                    # У последнего фрагмента Whisper иногда не отдает конец
+                    end_offset=end if end is not None else length,
+                )
+            )
+        return result
@@ -1,5 +1,33 @@
+import asyncio
+import logging
+import signal
+
+from dishka import make_async_container
+
+from app.infra.ioc import AppProvider
+from app.infra.stt.lifecycle import ResidentEngine
+
+logger = logging.getLogger(__name__)
+
+
+async def run() -> None:
+    container = make_async_container(AppProvider())
+    try:
+        # Загрузка и прогрев модели до приема задач; отчет о старте — в логе
+        await container.get(ResidentEngine)
+
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        await stop.wait()
+    finally:
+        await container.close()
+
+
 def main() -> None:
-    print("Hello from stt-service!")
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,18 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from tests.fakes import Pattern, write_wav
+
+
+@pytest.fixture
+def wav_factory(tmp_path: Path) -> Callable[[Pattern], Path]:
+    counter = 0
+
+    def make(pattern: Pattern) -> Path:
+        nonlocal counter
+        counter += 1
+        return write_wav(tmp_path / f"audio{counter}.wav", pattern)
+
+    return make
@@ -0,0 +1,153 @@
+"""Тестовые реализации портов и генерация аудио в формате модели."""
+
+import hashlib
+import math
+import shutil
+import struct
+import wave
+from collections import Counter
+from collections.abc import AsyncIterator
+from pathlib import Path
+from uuid import uuid4
+
+from app.common.constants import SAMPLE_RATE, SAMPLE_WIDTH
+from app.domain.entities import TranscriptionTask
+from app.domain.exceptions import AudioDecodeError, StorageFileNotFoundError
+from app.domain.interfaces import IAudioProcessor, IMetricsSink, INotifier, IStorage
+from app.domain.value_objects import (
+    BatchStats,
+    DecodedAudio,
+    TranscriptionProgress,
+    TranscriptionSegment,
+    TranscriptionStatus,
+)
+
+# Участок записи: (секунд, амплитуда тона 440 Гц); 0 — тишина
+type Pattern = list[tuple[float, int]]
+
+
+def write_wav(path: Path, pattern: Pattern) -> Path:
+    """16 кГц моно WAV в формате модели."""
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(SAMPLE_WIDTH)
+        wav.setframerate(SAMPLE_RATE)
+        for seconds, amplitude in pattern:
+            frames = int(seconds * SAMPLE_RATE)
+            samples = [
+                int(amplitude * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE))
+                for i in range(frames)
+            ]
+            wav.writeframes(struct.pack(f"<{frames}h", *samples))
+    return path
+
+
+class RecordingNotifier(INotifier):
+    def __init__(self) -> None:
+        self.statuses: list[TranscriptionStatus] = []
+        self.progress: list[TranscriptionProgress] = []
+
+    async def notify_status(self, task: TranscriptionTask) -> None:
+        self.statuses.append(task.status)
+
+    async def notify_progress(
+        self, task: TranscriptionTask, progress: TranscriptionProgress
+    ) -> None:
+        self.progress.append(progress)
+
+    @property
+    def segments(self) -> list[TranscriptionSegment]:
+        return [s for p in self.progress for s in p.segments]
+
+
+class RecordingMetricsSink(IMetricsSink):
+    def __init__(self) -> None:
+        self.tasks: list[TranscriptionTask] = []
+        self.lookups: list[bool] = []
+        self.batches: list[BatchStats] = []
+
+    async def record_task(self, task: TranscriptionTask, model_name: str) -> None:
+        self.tasks.append(task)
+
+    async def record_cache_lookup(self, hit: bool, model_name: str) -> None:
+        self.lookups.append(hit)
+
+    async def record_batch(self, stats: BatchStats, model_name: str) -> None:
+        self.batches.append(stats)
+
+
+def wav_duration(path: Path) -> float:
+    with wave.open(str(path), "rb") as wav:
+        return wav.getnframes() / wav.getframerate()
+
+
+class MemoryStorage(IStorage):
+    """Объекты в памяти; скачанные файлы — в scratch_dir."""
+
+    def __init__(self, scratch_dir: Path, chunk_size: int = 4096) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.calls: Counter[str] = Counter()
+        self._scratch_dir = scratch_dir
+        self._chunk_size = chunk_size
+
+    async def download(self, s3_key: str) -> Path:
+        self.calls["download"] += 1
+        local_path = self._scratch_dir / f"{uuid4().hex}{Path(s3_key).suffix}"
+        local_path.write_bytes(self._get(s3_key))
+        return local_path
+
+    async def stream(self, s3_key: str) -> AsyncIterator[bytes]:
+        self.calls["stream"] += 1
+        data = self._get(s3_key)
+        for offset in range(0, len(data), self._chunk_size):
+            yield data[offset : offset + self._chunk_size]
+
+    async def fingerprint(self, s3_key: str) -> str:
+        return hashlib.sha256(self._get(s3_key)).hexdigest()
+
+    async def delete_local(self, local_path: Path) -> None:
+        local_path.unlink(missing_ok=True)
+
+    def _get(self, s3_key: str) -> bytes:
+        if s3_key not in self.objects:
+            raise StorageFileNotFoundError(s3_key)
+        return self.objects[s3_key]
+
+
+class CopyingAudioProcessor(IAudioProcessor):
+    """
+    Исходные файлы уже в формате модели: "декодирование" — копия.
+    streamable=False имитирует формат, который потоком не читается.
+    """
+
+    def __init__(self, scratch_dir: Path, *, streamable: bool = True) -> None:
+        self.calls: Counter[str] = Counter()
+        self._scratch_dir = scratch_dir
+        self._streamable = streamable
+
+    @property
+    def conversion_params(self) -> str:
+        return "copy"
+
+    async def get_duration(self, local_path: Path) -> float:
+        self.calls["get_duration"] += 1
+        return wav_duration(local_path)
+
+    async def convert_to_stt(self, local_path: Path) -> Path:
+        self.calls["convert_to_stt"] += 1
+        output_path = self._scratch_dir / f"{uuid4().hex}.wav"
+        shutil.copyfile(local_path, output_path)
+        return output_path
+
+    async def decode_stream(self, chunks: AsyncIterator[bytes]) -> DecodedAudio:
+        self.calls["decode_stream"] += 1
+        data = b"".join([chunk async for chunk in chunks])
+        if not self._streamable:
+            raise AudioDecodeError("moov atom not found")
+        output_path = self._scratch_dir / f"{uuid4().hex}.wav"
+        output_path.write_bytes(data)
+        return DecodedAudio(
+            local_path=output_path,
+            duration_sec=wav_duration(output_path),
+            bytes_in=len(data),
+        )
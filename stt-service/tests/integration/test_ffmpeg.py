@@ -0,0 +1,79 @@
+import os
+import shutil
+import wave
+from collections.abc import AsyncIterator
+
+import pytest
+
+from app.common.constants import SAMPLE_RATE
+from app.domain.exceptions import AudioDecodeError, StorageFileNotFoundError
+from app.infra.audio.ffmpeg import FFmpegAudioProcessor
+from tests.fakes import write_wav
+
+requires_ffmpeg = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None, reason="ffmpeg is not installed"
+)
+
+
+async def chunks_of(data: bytes, size: int = 4096) -> AsyncIterator[bytes]:
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+@pytest.fixture
+def processor(tmp_path):
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    return FFmpegAudioProcessor(scratch)
+
+
+@requires_ffmpeg
+async def test_decode_stream_writes_model_wav(processor, tmp_path):
+    source = write_wav(tmp_path / "source.wav", [(1.0, 8000)]).read_bytes()
+
+    decoded = await processor.decode_stream(chunks_of(source))
+
+    assert decoded.bytes_in == len(source)
+    # Длительность — по числу байт PCM (заголовок WAV дает доли миллисекунды)
+    assert decoded.duration_sec == pytest.approx(1.0, abs=0.01)
+    with wave.open(str(decoded.local_path), "rb") as wav:
+        assert wav.getnchannels() == 1
+        assert wav.getframerate() == SAMPLE_RATE
+        assert wav.getnframes() / SAMPLE_RATE == pytest.approx(1.0, abs=0.01)
+
+
+@requires_ffmpeg
+async def test_decode_stream_fails_without_output(processor):
+    with pytest.raises(AudioDecodeError):
+        await processor.decode_stream(chunks_of(b""))
+    assert not any(processor._scratch_dir.iterdir())
+
+
+async def test_decode_stream_fails_on_nonzero_exit(processor, tmp_path, monkeypatch):
+    # ffmpeg, который пишет PCM и падает: результат не принимается
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake = bin_dir / "ffmpeg"
+    fake.write_text(
+        "#!/bin/sh\ncat > /dev/null\nprintf 'pcm'\necho 'moov atom not found' >&2\n"
+        "exit 1\n"
+    )
+    fake.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    with pytest.raises(AudioDecodeError, match="moov atom not found"):
+        await processor.decode_stream(chunks_of(b"\x00" * 10_000))
+    assert not any(processor._scratch_dir.iterdir())
+
+
+@requires_ffmpeg
+async def test_decode_stream_propagates_storage_errors(processor, tmp_path):
+    source = write_wav(tmp_path / "source.wav", [(1.0, 8000)]).read_bytes()
+
+    async def broken() -> AsyncIterator[bytes]:
+        yield source[:4096]
+        raise StorageFileNotFoundError("lectures/1.wav")
+
+    with pytest.raises(StorageFileNotFoundError):
+        await processor.decode_stream(broken())
+    assert not any(processor._scratch_dir.iterdir())
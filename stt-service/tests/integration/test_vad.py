@@ -0,0 +1,75 @@
+import pytest
+
+from app.domain.exceptions import AudioDecodeError
+from app.domain.services.chunking import (
+    ChunkingPolicy,
+    merge_chunks,
+    plan_chunks,
+    transcribe_chunks,
+)
+from app.infra.audio.vad import EnergyVoiceActivityDetector
+from app.infra.stt.fake import FakeSTTEngine
+
+LOUD = 3000
+HUM = 30
+
+
+async def test_detects_speech_between_pauses(wav_factory):
+    path = wav_factory([(1.0, 0), (2.0, LOUD), (1.0, HUM), (1.5, LOUD), (0.5, 0)])
+
+    regions = await EnergyVoiceActivityDetector().detect_speech(path)
+
+    assert len(regions) == 2
+    assert regions[0].start == pytest.approx(1.0, abs=0.05)
+    assert regions[0].end == pytest.approx(3.0, abs=0.05)
+    assert regions[1].start == pytest.approx(4.0, abs=0.05)
+    assert regions[1].end == pytest.approx(5.5, abs=0.05)
+
+
+async def test_short_pause_does_not_split_speech(wav_factory):
+    path = wav_factory([(1.0, LOUD), (0.1, 0), (1.0, LOUD)])
+
+    regions = await EnergyVoiceActivityDetector().detect_speech(path)
+
+    assert len(regions) == 1
+
+
+async def test_silent_recording_has_no_speech(wav_factory):
+    path = wav_factory([(2.0, 0)])
+
+    assert await EnergyVoiceActivityDetector().detect_speech(path) == []
+
+
+async def test_rejects_non_model_format(tmp_path):
+    path = tmp_path / "broken.wav"
+    path.write_bytes(b"not a wav")
+
+    with pytest.raises(AudioDecodeError):
+        await EnergyVoiceActivityDetector().detect_speech(path)
+
+
+async def test_chunks_are_cut_in_detected_pauses(wav_factory):
+    # 4 фразы по 9 с, паузы по 0.6 с; тишина в конце не распознается
+    pattern = []
+    for _ in range(4):
+        pattern += [(9.0, LOUD), (0.6, 0)]
+    pattern.append((20.0, 0))
+    path = wav_factory(pattern)
+    duration = 4 * 9.6 + 20.0
+    policy = ChunkingPolicy(max_chunk_sec=20, min_chunk_sec=5, overlap_sec=0.2)
+
+    speech = await EnergyVoiceActivityDetector().detect_speech(path)
+    chunks = plan_chunks(path, duration, speech, policy)
+
+    assert len(speech) == 4
+    for left, right in zip(chunks, chunks[1:], strict=False):
+        # Точка разреза (середина перекрытия) приходится на паузу
+        cut = (left.end_offset + right.start_offset) / 2
+        assert not any(r.start < cut < r.end for r in speech)
+    assert chunks[-1].end_offset < duration
+
+    engine = FakeSTTEngine(call_overhead_sec=0)
+    results = await transcribe_chunks(engine, chunks, workers=2)
+    merged = merge_chunks(chunks, results)
+    assert merged[0].start_offset == 0.0
+    assert merged[-1].end_offset == chunks[-1].end_offset
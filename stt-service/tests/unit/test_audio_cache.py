@@ -0,0 +1,110 @@
+import shutil
+from collections import namedtuple
+from pathlib import Path
+
+import pytest
+
+from app.infra.cache.audio_cache import LocalAudioCache
+
+
+@pytest.fixture
+def scratch(tmp_path: Path) -> Path:
+    path = tmp_path / "scratch"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LocalAudioCache:
+    return LocalAudioCache(tmp_path / "cache", max_bytes=300)
+
+
+def scratch_file(scratch: Path, name: str, size: int = 100) -> Path:
+    path = scratch / f"{name}.wav"
+    path.write_bytes(b"\x00" * size)
+    return path
+
+
+async def test_put_moves_file_and_acquire_hits(cache, scratch):
+    source = scratch_file(scratch, "a")
+
+    path = await cache.put("a", source)
+
+    assert not source.exists()
+    assert path.read_bytes() == b"\x00" * 100
+    assert await cache.acquire("a") == path
+    assert await cache.acquire("b") is None
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.bytes) == (1, 1, 100)
+
+
+async def test_evicts_least_recently_used_within_byte_bound(cache, scratch):
+    paths = {}
+    for name in "abc":
+        paths[name] = await cache.put(name, scratch_file(scratch, name))
+        await cache.release(paths[name])
+    # Обращение к "a" делает самой давней запись "b"
+    await cache.release(await cache.acquire("a"))
+
+    await cache.release(await cache.put("d", scratch_file(scratch, "d")))
+
+    assert await cache.acquire("b") is None
+    assert not paths["b"].exists()
+    assert cache.stats.evictions == 1
+    assert cache.stats.bytes == 300
+    assert sum(p.stat().st_size for p in cache._directory.iterdir()) == 300
+
+
+async def test_pinned_files_are_not_evicted(cache, scratch):
+    pinned = await cache.put("a", scratch_file(scratch, "a", 200))
+
+    released = await cache.put("b", scratch_file(scratch, "b", 200))
+    await cache.release(released)
+
+    # Над лимитом, но закрепленный файл остается, вытеснен отпущенный
+    assert pinned.exists()
+    assert not released.exists()
+    await cache.release(pinned)
+    assert pinned.exists()
+    assert cache.stats.bytes == 200
+
+
+async def test_duplicate_put_returns_existing_file(cache, scratch):
+    first = await cache.put("a", scratch_file(scratch, "a"))
+    duplicate = scratch_file(scratch, "a-copy")
+
+    second = await cache.put("a", duplicate)
+
+    assert second == first
+    assert not duplicate.exists()
+    assert cache.stats.bytes == 100
+    # Оба владельца отпускают файл, и только тогда его можно вытеснить
+    await cache.release(first)
+    await cache.release(second)
+    assert cache._entries["a"].pins == 0
+
+
+async def test_release_deletes_files_outside_cache(cache, scratch):
+    foreign = scratch_file(scratch, "foreign")
+
+    await cache.release(foreign)
+
+    assert not foreign.exists()
+
+
+def test_limit_is_clamped_to_free_space(tmp_path, monkeypatch):
+    usage = namedtuple("usage", "total used free")
+    monkeypatch.setattr(shutil, "disk_usage", lambda path: usage(1000, 0, 1000))
+
+    cache = LocalAudioCache(tmp_path / "cache", max_bytes=10_000)
+
+    assert cache._max_bytes == 500
+
+
+def test_startup_clears_directory(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    (directory / "stale.wav").write_bytes(b"\x00")
+
+    LocalAudioCache(directory, max_bytes=300)
+
+    assert not any(directory.iterdir())
@@ -0,0 +1,190 @@
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+
+import pytest
+
+from app.domain.exceptions import STTProcessingError
+from app.domain.services.batching import BatchingSTTEngine
+from app.domain.value_objects import AudioSegment, TranscriptionSegment
+from app.infra.stt.fake import FakeSTTEngine
+from tests.fakes import RecordingMetricsSink
+
+PATH = Path("audio.wav")
+
+
+def segment(start: float, length: float = 5.0) -> AudioSegment:
+    return AudioSegment(PATH, start_offset=start, end_offset=start + length)
+
+
+class CountingEngine(FakeSTTEngine):
+    def __init__(self) -> None:
+        super().__init__(call_overhead_sec=0.01, sec_per_audio_sec=0)
+        self.batch_sizes: list[int] = []
+        self.fail_next = False
+        self.loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded
+
+    async def load(self) -> None:
+        self.loaded = True
+
+    async def unload(self) -> None:
+        self.loaded = False
+
+    async def transcribe_batch(
+        self, segments: Sequence[AudioSegment]
+    ) -> list[list[TranscriptionSegment]]:
+        self.batch_sizes.append(len(segments))
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("device lost")
+        return await super().transcribe_batch(segments)
+
+
+class StreamingEngine(CountingEngine):
+    async def transcribe_stream(
+        self, segment: AudioSegment
+    ) -> AsyncIterator[TranscriptionSegment]:
+        for word in self._words(segment):
+            await asyncio.sleep(0)
+            yield word
+
+
+@pytest.fixture
+def metrics() -> RecordingMetricsSink:
+    return RecordingMetricsSink()
+
+
+async def test_concurrent_calls_share_batches(metrics: RecordingMetricsSink):
+    inner = CountingEngine()
+    engine = BatchingSTTEngine(inner, metrics, max_batch_size=4, max_wait_sec=0.05)
+
+    results = await asyncio.gather(*(engine.transcribe(segment(i)) for i in range(10)))
+    await engine.close()
+
+    assert sum(inner.batch_sizes) == 10
+    assert max(inner.batch_sizes) == 4
+    assert len(inner.batch_sizes) <= 4
+    # Результаты — у своих вызывающих
+    assert [r[0].text for r in results] == [f"w{i}" for i in range(10)]
+    assert sum(s.size for s in metrics.batches) == 10
+    assert engine.stats.mean_batch_size == pytest.approx(10 / len(inner.batch_sizes))
+
+
+async def test_lone_request_waits_at_most_max_wait(metrics: RecordingMetricsSink):
+    inner = CountingEngine()
+    engine = BatchingSTTEngine(inner, metrics, max_batch_size=8, max_wait_sec=0.02)
+
+    started = asyncio.get_running_loop().time()
+    await engine.transcribe(segment(0))
+    elapsed = asyncio.get_running_loop().time() - started
+    await engine.close()
+
+    assert inner.batch_sizes == [1]
+    assert elapsed < 0.5
+    assert metrics.batches[0].max_queue_wait_sec >= 0.02
+
+
+async def test_batch_error_reaches_every_caller_and_scheduler_survives(
+    metrics: RecordingMetricsSink,
+):
+    inner = CountingEngine()
+    inner.fail_next = True
+    engine = BatchingSTTEngine(inner, metrics, max_batch_size=3, max_wait_sec=0.05)
+
+    failed = await asyncio.gather(
+        *(engine.transcribe(segment(i)) for i in range(3)), return_exceptions=True
+    )
+    ok = await engine.transcribe(segment(10))
+    await engine.close()
+
+    assert all(isinstance(e, RuntimeError) for e in failed)
+    assert ok[0].text == "w10"
+    # Упавший проход тоже уходит в метрики, с исходом
+    assert [(b.size, b.failed) for b in metrics.batches] == [(3, True), (1, False)]
+    assert engine.stats.batches == 2
+
+
+async def test_wrong_result_count_is_an_error(metrics: RecordingMetricsSink):
+    class ShortEngine(CountingEngine):
+        async def transcribe_batch(
+            self, segments: Sequence[AudioSegment]
+        ) -> list[list[TranscriptionSegment]]:
+            return []
+
+    engine = BatchingSTTEngine(ShortEngine(), metrics, max_wait_sec=0)
+
+    with pytest.raises(STTProcessingError):
+        await engine.transcribe(segment(0))
+    await engine.close()
+
+
+async def test_cancelled_caller_is_not_sent_to_model(metrics: RecordingMetricsSink):
+    inner = CountingEngine()
+    engine = BatchingSTTEngine(inner, metrics, max_batch_size=8, max_wait_sec=0.05)
+
+    cancelled = asyncio.create_task(engine.transcribe(segment(0)))
+    kept = asyncio.create_task(engine.transcribe(segment(1)))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await kept
+    await engine.close()
+
+    assert inner.batch_sizes == [1]
+
+
+async def test_close_fails_queued_and_collected_requests(
+    metrics: RecordingMetricsSink,
+):
+    engine = BatchingSTTEngine(CountingEngine(), metrics, max_wait_sec=10)
+    # Первый участок планировщик уже взял и ждет добора пачки, второй в очереди
+    collected = asyncio.create_task(engine.transcribe(segment(0)))
+    await asyncio.sleep(0.01)
+    queued = asyncio.create_task(engine.transcribe(segment(1)))
+    await asyncio.sleep(0)
+
+    await engine.close()
+
+    for pending in (collected, queued):
+        with pytest.raises(RuntimeError, match="closed"):
+            await asyncio.wait_for(pending, 1)
+
+
+async def test_lifecycle_is_delegated(metrics: RecordingMetricsSink):
+    inner = CountingEngine()
+    engine = BatchingSTTEngine(inner, metrics)
+
+    assert not engine.is_loaded
+    await engine.load()
+    assert inner.loaded and engine.is_loaded
+    await engine.unload()
+    assert not inner.loaded
+
+
+async def test_non_streaming_engine_streams_through_batches(
+    metrics: RecordingMetricsSink,
+):
+    inner = CountingEngine()
+    engine = BatchingSTTEngine(inner, metrics, max_wait_sec=0)
+
+    words = [w async for w in engine.transcribe_stream(segment(0, 3.0))]
+    await engine.close()
+
+    assert [w.text for w in words] == ["w0", "w1", "w2"]
+    assert inner.batch_sizes == [1]
+
+
+async def test_streaming_engine_bypasses_queue(metrics: RecordingMetricsSink):
+    inner = StreamingEngine()
+    engine = BatchingSTTEngine(inner, metrics)
+    received: list[str] = []
+
+    async for word in engine.transcribe_stream(segment(0, 3.0)):
+        received.append(word.text)
+
+    assert received == ["w0", "w1", "w2"]
+    assert inner.batch_sizes == []
+    assert engine.stats.batches == 0
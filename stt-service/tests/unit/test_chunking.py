@@ -0,0 +1,125 @@
+from pathlib import Path
+
+import pytest
+
+from app.domain.services.chunking import (
+    ChunkingPolicy,
+    merge_chunks,
+    plan_chunks,
+    transcribe_chunks,
+)
+from app.domain.value_objects import (
+    AudioSegment,
+    SpeechRegion,
+    TranscriptionSegment,
+)
+from app.infra.stt.fake import FakeSTTEngine
+
+PATH = Path("audio.wav")
+POLICY = ChunkingPolicy(max_chunk_sec=30, min_chunk_sec=10, overlap_sec=1)
+
+
+def spans(chunks: list[AudioSegment]) -> list[tuple[float, float]]:
+    return [(c.start_offset, c.end_offset) for c in chunks]
+
+
+def test_short_audio_is_one_chunk():
+    assert spans(plan_chunks(PATH, 20.0, [], POLICY)) == [(0.0, 20.0)]
+
+
+def test_chunks_respect_limit_and_overlap_without_vad():
+    chunks = plan_chunks(PATH, 100.0, [], POLICY)
+
+    assert all(c.end_offset - c.start_offset <= 30 for c in chunks)
+    assert chunks[0].start_offset == 0.0
+    assert chunks[-1].end_offset == 100.0
+    for left, right in zip(chunks, chunks[1:], strict=False):
+        assert left.end_offset - right.start_offset == pytest.approx(2.0)
+
+
+def test_cut_goes_into_latest_pause():
+    speech = [SpeechRegion(0, 12), SpeechRegion(13, 20), SpeechRegion(21, 60)]
+
+    chunks = plan_chunks(PATH, 60.0, speech, POLICY)
+
+    # Пауза 20-21 — самая поздняя до лимита; разрез в ее середине
+    assert chunks[0].end_offset == pytest.approx(21.5)
+    assert chunks[1].start_offset == pytest.approx(19.5)
+
+
+def test_chunks_without_speech_are_skipped():
+    speech = [SpeechRegion(0, 25), SpeechRegion(95, 100)]
+
+    chunks = plan_chunks(PATH, 200.0, speech, POLICY)
+
+    assert all(
+        any(r.end > c.start_offset and r.start < c.end_offset for r in speech)
+        for c in chunks
+    )
+    assert chunks[-1].end_offset < 200.0
+
+
+def test_merge_keeps_one_copy_of_overlap():
+    chunks = [
+        AudioSegment(PATH, 0.0, 21.0),
+        AudioSegment(PATH, 19.0, 40.0),
+    ]
+    results = [
+        [
+            TranscriptionSegment("начало", 0.0, 10.0),
+            TranscriptionSegment("на стыке", 19.2, 20.8),
+        ],
+        [
+            TranscriptionSegment("на стыке", 0.2, 1.8),
+            TranscriptionSegment("конец", 2.0, 20.0),
+        ],
+    ]
+
+    merged = merge_chunks(chunks, results)
+
+    assert [s.text for s in merged] == ["начало", "на стыке", "конец"]
+    assert [s.start_offset for s in merged] == [0.0, 19.2, 21.0]
+
+
+def test_merge_trims_words_repeated_across_seam():
+    chunks = [AudioSegment(PATH, 0.0, 21.0), AudioSegment(PATH, 19.0, 40.0)]
+    results = [
+        [TranscriptionSegment("теорема о графах", 15.0, 19.9)],
+        [TranscriptionSegment("о графах и деревьях", 0.6, 5.0)],
+    ]
+
+    merged = merge_chunks(chunks, results)
+
+    assert [s.text for s in merged] == ["теорема о графах", "и деревьях"]
+
+
+async def test_chunked_transcription_matches_whole_file():
+    engine = FakeSTTEngine(call_overhead_sec=0)
+    chunks = plan_chunks(PATH, 95.0, [], POLICY)
+
+    results = await transcribe_chunks(engine, chunks, workers=3)
+    merged = merge_chunks(chunks, results)
+
+    whole = await engine.transcribe(AudioSegment(PATH, 0.0, 95.0))
+    assert [s.text for s in merged] == [s.text for s in whole]
+    assert [s.start_offset for s in merged] == [s.start_offset for s in whole]
+
+
+async def test_progress_covers_skipped_silence():
+    engine = FakeSTTEngine(call_overhead_sec=0)
+    speech = [SpeechRegion(0, 25), SpeechRegion(95, 100)]
+    chunks = plan_chunks(PATH, 200.0, speech, POLICY)
+    reported: list[float] = []
+    owned: list[TranscriptionSegment] = []
+
+    async def on_progress(segments: list[TranscriptionSegment], sec: float) -> None:
+        owned.extend(segments)
+        reported.append(sec)
+
+    results = await transcribe_chunks(
+        engine, chunks, workers=2, on_progress=on_progress, duration=200.0
+    )
+
+    assert sum(reported) == pytest.approx(200.0)
+    merged = merge_chunks(chunks, results)
+    assert sorted(s.start_offset for s in owned) == [s.start_offset for s in merged]
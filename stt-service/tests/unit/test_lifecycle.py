@@ -0,0 +1,103 @@
+import wave
+
+import pytest
+
+from app.common.constants import SAMPLE_RATE
+from app.domain.value_objects import AudioSegment, TranscriptionSegment
+from app.infra.stt.fake import FakeSTTEngine
+from app.infra.stt.lifecycle import ResidentEngine, write_synthetic_clip
+
+
+class LifecycleEngine(FakeSTTEngine):
+    def __init__(self) -> None:
+        super().__init__(call_overhead_sec=0)
+        self.calls: list[str] = []
+        self.loaded = False
+        self.warmup_frames: int | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded
+
+    async def import_runtime(self) -> None:
+        self.calls.append("import")
+
+    async def load(self) -> None:
+        self.calls.append("load")
+        self.loaded = True
+
+    async def unload(self) -> None:
+        self.calls.append("unload")
+        self.loaded = False
+
+    async def transcribe(self, segment: AudioSegment) -> list[TranscriptionSegment]:
+        self.calls.append("transcribe")
+        # Клип существует, пока идет прогрев
+        with wave.open(str(segment.local_path), "rb") as clip:
+            self.warmup_frames = clip.getnframes()
+        self.clip = segment.local_path
+        return await super().transcribe(segment)
+
+
+async def test_start_runs_lifecycle_in_order_and_reports():
+    engine = LifecycleEngine()
+    resident = ResidentEngine(engine, warmup_sec=0.5)
+    assert not resident.healthy
+
+    report = await resident.start()
+
+    assert engine.calls == ["import", "load", "transcribe"]
+    assert resident.healthy
+    assert resident.report is report
+    assert report.model_name == "fake"
+    assert report.total_sec == pytest.approx(
+        report.import_sec + report.load_sec + report.warmup_sec
+    )
+    assert "warm-up" in report.format()
+    assert engine.warmup_frames == SAMPLE_RATE // 2
+    assert not engine.clip.exists()
+
+
+async def test_no_warmup_when_disabled():
+    engine = LifecycleEngine()
+    resident = ResidentEngine(engine, warmup_sec=0)
+
+    await resident.start()
+
+    assert engine.calls == ["import", "load"]
+    assert resident.healthy
+
+
+async def test_failed_warmup_leaves_engine_unhealthy():
+    class BrokenEngine(LifecycleEngine):
+        async def transcribe(self, segment: AudioSegment) -> list[TranscriptionSegment]:
+            raise RuntimeError("CUDA out of memory")
+
+    resident = ResidentEngine(BrokenEngine(), warmup_sec=0.5)
+
+    with pytest.raises(RuntimeError):
+        await resident.start()
+    assert not resident.healthy
+    assert resident.report is None
+
+
+async def test_stop_unloads():
+    engine = LifecycleEngine()
+    resident = ResidentEngine(engine, warmup_sec=0.5)
+    await resident.start()
+
+    await resident.stop()
+
+    assert engine.calls[-1] == "unload"
+    assert not resident.healthy
+
+
+def test_synthetic_clip_is_model_format(tmp_path):
+    path = tmp_path / "clip.wav"
+
+    write_synthetic_clip(path, 1.5)
+
+    with wave.open(str(path), "rb") as clip:
+        assert clip.getnchannels() == 1
+        assert clip.getframerate() == SAMPLE_RATE
+        assert clip.getnframes() == int(1.5 * SAMPLE_RATE)
@@ -0,0 +1,35 @@
+import logging
+
+import pytest
+
+from app.domain.value_objects import BatchStats
+from app.infra.metrics import LoggingMetricsSink
+
+
+def batch(size: int, run_sec: float, failed: bool = False) -> BatchStats:
+    return BatchStats(
+        size=size,
+        audio_sec=size * 5.0,
+        max_queue_wait_sec=0.01,
+        run_sec=run_sec,
+        failed=failed,
+    )
+
+
+async def test_batch_metrics_are_aggregated(caplog):
+    sink = LoggingMetricsSink()
+    assert sink.mean_batch_size == 0.0
+    assert sink.batch_utilisation == 0.0
+
+    with caplog.at_level(logging.DEBUG, logger="app.infra.metrics"):
+        await sink.record_batch(batch(4, 0.5), "fake")
+        await sink.record_batch(batch(2, 0.5, failed=True), "fake")
+
+    assert sink.batches == 2
+    assert sink.failed_batches == 1
+    assert sink.mean_batch_size == 3.0
+    # Модель была занята все время с начала первого прохода
+    assert sink.batch_utilisation == pytest.approx(1.0)
+    assert [r.batch_outcome for r in caplog.records] == ["ok", "failed"]
+    assert caplog.records[-1].levelno == logging.WARNING
+    assert caplog.records[-1].mean_batch_size == 3.0
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from app.domain.entities import TranscriptionTask
+from app.domain.services.progress import ProgressBatcher
+from app.domain.value_objects import TranscriptionProgress, TranscriptionSegment
+from tests.fakes import RecordingNotifier
+
+
+def word(i: int) -> TranscriptionSegment:
+    return TranscriptionSegment(f"w{i}", float(i), float(i + 1))
+
+
+@pytest.fixture
+def notifier() -> RecordingNotifier:
+    return RecordingNotifier()
+
+
+def make_batcher(notifier: RecordingNotifier, **kwargs: float) -> ProgressBatcher:
+    task = TranscriptionTask(id="t", file_id="f", s3_key="k")
+    return ProgressBatcher(notifier, task, 100.0, **kwargs)  # type: ignore[arg-type]
+
+
+async def test_sends_when_batch_is_full(notifier: RecordingNotifier):
+    batcher = make_batcher(notifier, max_segments=3, max_interval_sec=60)
+
+    for i in range(7):
+        await batcher.add([word(i)], 1.0)
+
+    assert [len(p.segments) for p in notifier.progress] == [3, 3]
+    await batcher.flush()
+    assert [len(p.segments) for p in notifier.progress] == [3, 3, 1]
+    assert notifier.progress[-1].processed_sec == 7.0
+    assert notifier.progress[-1].percent == pytest.approx(7.0)
+
+
+async def test_sends_after_interval_even_if_not_full(notifier: RecordingNotifier):
+    batcher = make_batcher(notifier, max_segments=100, max_interval_sec=0.01)
+
+    await batcher.add([word(0)], 1.0)
+    assert notifier.progress == []
+    await asyncio.sleep(0.02)
+    await batcher.add([word(1)], 1.0)
+
+    assert [len(p.segments) for p in notifier.progress] == [2]
+
+
+async def test_flush_skips_empty_and_reports_bare_progress(
+    notifier: RecordingNotifier,
+):
+    batcher = make_batcher(notifier, max_segments=100, max_interval_sec=60)
+
+    await batcher.flush()
+    assert notifier.progress == []
+
+    # Кусок без сегментов (тишина) тоже двигает прогресс
+    await batcher.add([], 40.0)
+    await batcher.flush()
+    await batcher.flush()
+    assert [(p.segments, p.processed_sec) for p in notifier.progress] == [([], 40.0)]
+
+
+async def test_concurrent_adds_lose_nothing(notifier: RecordingNotifier):
+    batcher = make_batcher(notifier, max_segments=5, max_interval_sec=60)
+
+    async def produce(offset: int) -> None:
+        for i in range(offset, offset + 20):
+            await batcher.add([word(i)], 0.5)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(produce(n * 100) for n in range(5)))
+    await batcher.flush()
+
+    assert len(notifier.segments) == 100
+    assert len({s.text for s in notifier.segments}) == 100
+    assert notifier.progress[-1].processed_sec == 50.0
+    assert notifier.progress[-1].percent == 50.0
+
+
+def test_percent_is_capped():
+    assert TranscriptionProgress([], 120.0, 100.0).percent == 100.0
+    assert TranscriptionProgress([], 1.0, 0.0).percent == 0.0
@@ -0,0 +1,105 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.domain.value_objects import (
+    ResultCacheKey,
+    TranscriptionResult,
+    TranscriptionSegment,
+)
+from app.infra.cache.result_cache import (
+    KEY_PREFIX,
+    LRU_KEY,
+    SIZES_KEY,
+    TOTAL_KEY,
+    RedisResultCache,
+    dump_result,
+)
+
+
+def key(i: int) -> ResultCacheKey:
+    return ResultCacheKey(fingerprint=f"etag{i}:100", model_name="fake", params=())
+
+
+def result(i: int, words: int = 50) -> TranscriptionResult:
+    segments = [
+        # Разный текст: одинаковый сжимается почти в ноль
+        TranscriptionSegment(f"lecture{i} word{j}", float(j), float(j + 1))
+        for j in range(words)
+    ]
+    return TranscriptionResult(
+        full_text=" ".join(s.text for s in segments),
+        model_name="fake",
+        duration_sec=float(words),
+        segments=segments,
+    )
+
+
+@pytest.fixture
+def redis() -> FakeAsyncRedis:
+    return FakeAsyncRedis()
+
+
+async def test_roundtrip(redis):
+    cache = RedisResultCache(redis, max_bytes=1 << 20)
+
+    assert await cache.get(key(1)) is None
+    await cache.put(key(1), result(1))
+
+    assert await cache.get(key(1)) == result(1)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.hit_rate == 0.5
+
+
+async def test_evicts_least_recently_read(redis):
+    size = len(dump_result(result(1)))
+    cache = RedisResultCache(redis, max_bytes=size * 3)
+    for i in range(3):
+        await cache.put(key(i), result(i))
+    # Чтение продлевает жизнь первой записи
+    assert await cache.get(key(0)) is not None
+
+    await cache.put(key(3), result(3))
+
+    assert await cache.get(key(1)) is None
+    for i in (0, 2, 3):
+        assert await cache.get(key(i)) is not None
+    assert cache.stats.evictions == 1
+    assert await redis.zcard(LRU_KEY) == 3
+    assert int(await redis.get(TOTAL_KEY)) == sum(
+        int(v) for v in (await redis.hgetall(SIZES_KEY)).values()
+    )
+    stored = [k async for k in redis.scan_iter(f"{KEY_PREFIX}*")]
+    assert sum([len(await redis.get(k)) for k in stored]) <= size * 3
+
+
+async def test_skips_results_larger_than_budget(redis):
+    cache = RedisResultCache(redis, max_bytes=10)
+
+    await cache.put(key(1), result(1))
+
+    assert await cache.get(key(1)) is None
+    assert await redis.dbsize() == 0
+
+
+async def test_overwrite_does_not_double_count(redis):
+    cache = RedisResultCache(redis, max_bytes=1 << 20)
+
+    await cache.put(key(1), result(1))
+    await cache.put(key(1), result(1, words=80))
+
+    assert int(await redis.get(TOTAL_KEY)) == len(dump_result(result(1, words=80)))
+
+
+async def test_corrupt_entry_is_a_miss_and_dropped(redis):
+    cache = RedisResultCache(redis, max_bytes=1 << 20)
+    await cache.put(key(1), result(1))
+    await cache.put(key(2), result(2))
+    await redis.set(KEY_PREFIX + key(1).digest, b"truncated")
+
+    assert await cache.get(key(1)) is None
+
+    assert cache.stats.misses == 1
+    assert await redis.exists(KEY_PREFIX + key(1).digest) == 0
+    assert await redis.zscore(LRU_KEY, key(1).digest) is None
+    assert int(await redis.get(TOTAL_KEY)) == len(dump_result(result(2)))
+    assert await cache.get(key(2)) == result(2)
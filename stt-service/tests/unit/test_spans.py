@@ -0,0 +1,60 @@
+import pytest
+
+from app.domain.entities import TranscriptionTask
+from app.domain.services.spans import measure_stage
+from app.domain.value_objects import PipelineStage, StageSpan
+
+
+def make_task() -> TranscriptionTask:
+    return TranscriptionTask(id="t", file_id="f", s3_key="k")
+
+
+def span(stage: PipelineStage, wall_sec: float, audio_sec: float | None) -> StageSpan:
+    return StageSpan(
+        stage=stage,
+        wall_sec=wall_sec,
+        cpu_sec=0.0,
+        peak_rss_bytes=0,
+        audio_sec=audio_sec,
+    )
+
+
+def test_real_time_factor_needs_audio_duration():
+    assert span(PipelineStage.TRANSCRIBE, 2.0, 10.0).real_time_factor == 0.2
+    assert span(PipelineStage.TRANSCRIBE, 2.0, None).real_time_factor is None
+    assert span(PipelineStage.TRANSCRIBE, 2.0, 0.0).real_time_factor is None
+
+
+def test_measure_stage_records_meter_values():
+    task = make_task()
+
+    with measure_stage(task, PipelineStage.CONVERT) as meter:
+        meter.bytes_processed = 1024
+        meter.audio_sec = 30.0
+
+    [recorded] = task.spans
+    assert recorded.stage == PipelineStage.CONVERT
+    assert not recorded.failed
+    assert recorded.bytes_processed == 1024
+    assert recorded.audio_sec == 30.0
+    assert recorded.wall_sec >= 0
+    assert recorded.peak_rss_bytes > 0
+
+
+def test_failed_stage_is_recorded_and_reraised():
+    task = make_task()
+
+    with pytest.raises(RuntimeError), measure_stage(task, PipelineStage.DOWNLOAD):
+        raise RuntimeError("boom")
+
+    assert [s.failed for s in task.spans] == [True]
+
+
+def test_task_rtf_comes_from_transcribe_span():
+    task = make_task()
+    assert task.real_time_factor is None
+
+    task.add_span(span(PipelineStage.CONVERT, 5.0, 100.0))
+    task.add_span(span(PipelineStage.TRANSCRIBE, 25.0, 100.0))
+
+    assert task.real_time_factor == 0.25
@@ -0,0 +1,205 @@
+from pathlib import Path
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from app.domain.entities import TranscriptionTask
+from app.domain.services.transcription_service import TranscriptionService
+from app.domain.value_objects import PipelineStage, TranscriptionStatus
+from app.infra.audio.vad import EnergyVoiceActivityDetector
+from app.infra.cache.audio_cache import LocalAudioCache
+from app.infra.cache.result_cache import RedisResultCache
+from app.infra.stt.fake import FakeSTTEngine
+from tests.fakes import (
+    CopyingAudioProcessor,
+    MemoryStorage,
+    RecordingMetricsSink,
+    RecordingNotifier,
+    write_wav,
+)
+
+S3_KEY = "lectures/1.wav"
+
+
+@pytest.fixture
+def scratch(tmp_path: Path) -> Path:
+    path = tmp_path / "scratch"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def storage(tmp_path: Path, scratch: Path) -> MemoryStorage:
+    storage = MemoryStorage(scratch)
+    source = write_wav(tmp_path / "source.wav", [(2.0, 8000), (1.0, 0), (2.0, 8000)])
+    storage.objects[S3_KEY] = source.read_bytes()
+    return storage
+
+
+def make_service(
+    storage: MemoryStorage, processor: CopyingAudioProcessor, **kwargs
+) -> tuple[TranscriptionService, RecordingNotifier]:
+    notifier = RecordingNotifier()
+    service = TranscriptionService(
+        storage=storage,
+        audio_processor=processor,
+        stt_engine=FakeSTTEngine(call_overhead_sec=0),
+        notifier=notifier,
+        metrics=RecordingMetricsSink(),
+        vad=EnergyVoiceActivityDetector(),
+        **kwargs,
+    )
+    return service, notifier
+
+
+def make_task() -> TranscriptionTask:
+    return TranscriptionTask(id="t1", file_id="f1", s3_key=S3_KEY)
+
+
+def stages(task: TranscriptionTask) -> list[PipelineStage]:
+    return [span.stage for span in task.spans]
+
+
+async def test_streams_audio_without_download(storage, scratch):
+    processor = CopyingAudioProcessor(scratch)
+    service, notifier = make_service(storage, processor)
+    task = make_task()
+
+    await service.execute(task)
+
+    assert task.status == TranscriptionStatus.COMPLETED
+    assert task.result is not None
+    assert task.result.duration_sec == pytest.approx(5.0)
+    assert storage.calls == {"stream": 1}
+    assert PipelineStage.DOWNLOAD not in stages(task)
+    assert notifier.statuses[-1] == TranscriptionStatus.COMPLETED
+    assert not any(scratch.iterdir())
+
+
+async def test_falls_back_to_download_when_stream_decode_fails(storage, scratch):
+    processor = CopyingAudioProcessor(scratch, streamable=False)
+    service, notifier = make_service(storage, processor)
+    task = make_task()
+
+    await service.execute(task)
+
+    assert task.status == TranscriptionStatus.COMPLETED
+    assert task.result is not None
+    assert task.result.duration_sec == pytest.approx(5.0)
+    assert storage.calls == {"stream": 1, "download": 1}
+    assert processor.calls["convert_to_stt"] == 1
+    failed = [span.stage for span in task.spans if span.failed]
+    assert failed == [PipelineStage.STREAM_DECODE]
+    assert {PipelineStage.DOWNLOAD, PipelineStage.CONVERT} <= set(stages(task))
+    # Скачанный и сконвертированный файлы удалены
+    assert not any(scratch.iterdir())
+
+
+async def test_missing_object_fails_task(storage, scratch):
+    storage.objects.clear()
+    service, notifier = make_service(storage, CopyingAudioProcessor(scratch))
+    task = make_task()
+
+    await service.execute(task)
+
+    assert task.status == TranscriptionStatus.FAILED
+    assert notifier.statuses[-1] == TranscriptionStatus.FAILED
+    assert not any(scratch.iterdir())
+
+
+async def test_cache_hit_replays_segments_before_final_status(storage, scratch):
+    cache = RedisResultCache(FakeAsyncRedis(), max_bytes=1 << 20)
+    first, first_notifier = make_service(
+        storage, CopyingAudioProcessor(scratch), result_cache=cache
+    )
+    await first.execute(make_task())
+    storage.calls.clear()
+
+    service, notifier = make_service(
+        storage, CopyingAudioProcessor(scratch), result_cache=cache
+    )
+    task = make_task()
+    await service.execute(task)
+
+    assert task.status == TranscriptionStatus.COMPLETED
+    assert storage.calls == {}
+    assert task.result is not None
+    assert notifier.segments == task.result.segments
+    assert sorted(notifier.segments, key=lambda s: s.start_offset) == sorted(
+        first_notifier.segments, key=lambda s: s.start_offset
+    )
+    assert notifier.progress[-1].percent == 100.0
+    assert notifier.statuses == [
+        TranscriptionStatus.PROCESSING,
+        TranscriptionStatus.COMPLETED,
+    ]
+
+
+async def test_audio_cache_hit_skips_storage(storage, scratch, tmp_path):
+    cache = LocalAudioCache(tmp_path / "cache", max_bytes=1 << 20)
+    first, _ = make_service(storage, CopyingAudioProcessor(scratch), audio_cache=cache)
+    await first.execute(make_task())
+    storage.calls.clear()
+
+    processor = CopyingAudioProcessor(scratch)
+    service, _ = make_service(storage, processor, audio_cache=cache)
+    task = make_task()
+    await service.execute(task)
+
+    assert task.status == TranscriptionStatus.COMPLETED
+    assert storage.calls == {}
+    assert processor.calls == {"get_duration": 1}
+    assert PipelineStage.PROBE in stages(task)
+    assert cache.stats.hits == 1
+    # Файл остается в кэше, scratch пуст
+    assert not any(scratch.iterdir())
+    assert all(entry.pins == 0 for entry in cache._entries.values())
+
+
+async def test_audio_cache_keeps_raw_download_for_fallback(storage, scratch, tmp_path):
+    class ResamplingProcessor(CopyingAudioProcessor):
+        @property
+        def conversion_params(self) -> str:
+            return "copy:resampled"
+
+    cache = LocalAudioCache(tmp_path / "cache", max_bytes=1 << 20)
+    first, _ = make_service(
+        storage, CopyingAudioProcessor(scratch, streamable=False), audio_cache=cache
+    )
+    await first.execute(make_task())
+    storage.calls.clear()
+
+    # Другой формат выхода: PCM из кэша не подходит, исходник — подходит
+    processor = ResamplingProcessor(scratch, streamable=False)
+    service, _ = make_service(storage, processor, audio_cache=cache)
+    task = make_task()
+    await service.execute(task)
+
+    assert task.status == TranscriptionStatus.COMPLETED
+    assert storage.calls == {"stream": 1}
+    assert processor.calls["convert_to_stt"] == 1
+    assert PipelineStage.DOWNLOAD not in stages(task)
+
+
+async def test_audio_cache_misses_after_reupload_under_same_key(
+    storage, scratch, tmp_path
+):
+    cache = LocalAudioCache(tmp_path / "cache", max_bytes=1 << 20)
+    first, _ = make_service(storage, CopyingAudioProcessor(scratch), audio_cache=cache)
+    await first.execute(make_task())
+    # Тот же s3_key, другое содержимое
+    reupload = write_wav(tmp_path / "reupload.wav", [(3.0, 8000)])
+    storage.objects[S3_KEY] = reupload.read_bytes()
+    storage.calls.clear()
+
+    service, _ = make_service(
+        storage, CopyingAudioProcessor(scratch), audio_cache=cache
+    )
+    task = make_task()
+    await service.execute(task)
+
+    assert task.status == TranscriptionStatus.COMPLETED
+    assert storage.calls == {"stream": 1}
+    assert cache.stats.hits == 0
+    assert task.result is not None
+    assert task.result.duration_sec == pytest.approx(3.0)